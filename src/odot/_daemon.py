@@ -0,0 +1,345 @@
+"""Opt-in background server that runs CLI commands in a warm process.
+
+`odot daemon` binds a Unix domain socket next to the database file and keeps
+the imported modules, the engine and its connection pool alive between calls.
+`cli.main` forwards argv to it when it is running and the caller is a script
+(stdout is not a terminal and stdin has no input to give), which is where
+per-call startup cost dominates: status-bar and tmux hooks that run
+`odot count --json` hundreds of times an hour. Interactive use always runs
+in-process so prompts, colors and terminal width behave exactly as before.
+
+The wire protocol is one JSON line per message. The client sends
+``{"argv": [...], "cwd": "...", "env": {...}}``, where ``env`` holds the
+client's values of the `CLIENT_ENV` variables. The server streams back
+``{"out": "..."}`` and ``{"err": "..."}`` frames as the command writes, then a
+final ``{"exit": <code>}``; or, before running anything, ``{"decline": true}``
+when the client needs a PRAGMA profile the daemon's connections don't have.
+Requests are served one at a time because each command temporarily redirects
+the process-wide stdout/stderr and environment.
+"""
+
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import sys
+import time
+import traceback
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import IO, Any
+
+from odot import database
+
+#: Set to a non-empty value to always run in-process, even with a daemon up.
+NO_DAEMON_ENV = "ODOT_NO_DAEMON"
+
+#: Environment variables the CLI reads (directly, or through rich and the
+#: time functions), sent with each forwarded call and applied around it.
+CLIENT_ENV = (
+    "ODOT_DB_PROFILE",
+    "NO_COLOR",
+    "FORCE_COLOR",
+    "TERM",
+    "COLUMNS",
+    "LINES",
+    "PAGER",
+    "TZ",
+)
+
+
+class DaemonError(RuntimeError):
+    """Raised when the daemon cannot start (e.g. one is already listening)."""
+
+
+def socket_path() -> Path:
+    """Return the socket path for the current database (``db.sqlite`` → ``db.sock``).
+
+    Deriving it from `database.get_db_path` means ``ODOT_DB_PATH`` selects the
+    daemon too, so a client never talks to a server bound to another database.
+    """
+    return database.get_db_path().with_suffix(".sock")
+
+
+def _frame(**message: Any) -> bytes:
+    """Encode one protocol message as a newline-terminated JSON line."""
+    return (json.dumps(message) + "\n").encode()
+
+
+def should_forward(argv: list[str]) -> bool:
+    """Return whether this invocation should be handed to a running daemon.
+
+    Only non-interactive calls are forwarded: a terminal on stdin means a
+    prompt may need answering, and a terminal on stdout means rich should see
+    the real TTY for colors and width. The daemon's commands see an empty
+    stdin, so neither is a call whose stdin may carry input (a pipe, or a
+    file with data left: ``echo y | odot clean``, ``odot add - < notes``).
+    `odot daemon` itself never forwards.
+    """
+    if os.environ.get(NO_DAEMON_ENV) or not hasattr(socket, "AF_UNIX"):
+        return False
+    if argv[:1] == ["daemon"] or "-" in argv:
+        return False
+    return not sys.stdout.isatty() and _stdin_is_empty()
+
+
+def _stdin_is_empty() -> bool:
+    """Return whether stdin has nothing a command could read.
+
+    True for a closed stdin, a non-terminal device such as ``/dev/null``, or
+    a regular file read to its end. A pipe or socket may still deliver data
+    however long it has been quiet, so it counts as input.
+    """
+    if sys.stdin is None:
+        return True
+    if sys.stdin.isatty():
+        return False
+    try:
+        fd = sys.stdin.fileno()
+        mode = os.fstat(fd).st_mode
+        if stat.S_ISCHR(mode):
+            return True
+        return (
+            stat.S_ISREG(mode) and os.lseek(fd, 0, os.SEEK_CUR) >= os.fstat(fd).st_size
+        )
+    except (OSError, ValueError):  # not backed by a descriptor, or closed
+        return True
+
+
+def forward(
+    argv: list[str],
+    *,
+    path: Path | None = None,
+    stdout: IO[str] | None = None,
+    stderr: IO[str] | None = None,
+) -> int | None:
+    """Run `argv` on the daemon, replaying its output, and return the exit code.
+
+    Returns None when no daemon answers (no socket, or a stale one left by a
+    killed server), or when it declines the call because the client's
+    ``ODOT_DB_PROFILE`` differs from its own, so the caller can fall back to
+    running in-process. Once a
+    command has started, a dropped connection is reported as a failure rather
+    than retried, since the command may already have taken effect.
+
+    Args:
+        argv: Command-line arguments, without the program name.
+        path: Socket to connect to; defaults to `socket_path`.
+        stdout: Stream for the command's stdout; defaults to `sys.stdout`.
+        stderr: Stream for the command's stderr; defaults to `sys.stderr`.
+    """
+    path = path or socket_path()
+    streams = {"out": stdout or sys.stdout, "err": stderr or sys.stderr}
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    with sock:
+        try:
+            sock.connect(str(path))
+        except OSError:
+            return None
+        env = {name: os.environ[name] for name in CLIENT_ENV if name in os.environ}
+        sock.sendall(_frame(argv=argv, cwd=str(Path.cwd()), env=env))
+        with sock.makefile("rb") as reader:
+            for line in reader:
+                message = json.loads(line)
+                if "exit" in message:
+                    return message["exit"]
+                if "decline" in message:
+                    return None
+                for name, data in message.items():
+                    try:
+                        streams[name].write(data)
+                        streams[name].flush()
+                    except BrokenPipeError:
+                        # Our reader exited (`odot list | head`). Closing the
+                        # socket stops the command; exit as quietly as Click
+                        # does for an in-process call.
+                        _discard(streams[name])
+                        return 1
+    streams["err"].write("odot daemon closed the connection unexpectedly.\n")
+    return 1
+
+
+def _discard(stream: IO[str]) -> None:
+    """Point `stream`'s closed pipe at /dev/null, so exit-time flushes pass."""
+    with contextlib.suppress(OSError, ValueError):  # not backed by a descriptor
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, stream.fileno())
+        os.close(devnull)
+
+
+class _FrameWriter(io.TextIOBase):
+    """Text stream that relays every write to the client as a protocol frame."""
+
+    def __init__(self, wfile: IO[bytes], name: str) -> None:
+        self._wfile = wfile
+        self._name = name
+
+    def write(self, data: str) -> int:
+        # Refusing bytes like a real text stream matters: Click probes with
+        # write(b"") and, if that passes, sends its prompts as bytes.
+        if not isinstance(data, str):
+            msg = f"write() argument must be str, not {type(data).__name__}"
+            raise TypeError(msg)
+        if data:
+            self._wfile.write(_frame(**{self._name: data}))
+            self._wfile.flush()
+        return len(data)
+
+
+@contextlib.contextmanager
+def client_env(env: Mapping[str, str]) -> Iterator[None]:
+    """Set the `CLIENT_ENV` variables to the client's values while in the block.
+
+    Variables the client doesn't have are unset, so the daemon's own values
+    never leak into a call. ``TZ`` is re-read, so local times match the
+    client's.
+    """
+    saved = {name: os.environ.get(name) for name in CLIENT_ENV}
+
+    def apply(values: Mapping[str, str | None]) -> None:
+        for name in CLIENT_ENV:
+            value = values.get(name)
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        time.tzset()
+
+    apply(env)
+    try:
+        yield
+    finally:
+        apply(saved)
+
+
+def _db_profile() -> str | None:
+    """Return the PRAGMA profile this environment selects, or None if invalid."""
+    try:
+        return database.get_db_profile()
+    except ValueError:
+        return None
+
+
+def run_command(argv: list[str], stdout: IO[str], stderr: IO[str]) -> int:
+    """Run one CLI invocation in this process with redirected I/O.
+
+    stdin is replaced with an empty stream, so a command that would prompt
+    aborts cleanly instead of blocking the daemon. Click's standalone mode is
+    kept so usage errors and aborts print exactly what the in-process CLI would.
+    """
+    from odot.cli import app, reset_consoles  # cli imports this module
+
+    reset_consoles()  # pick up the client's NO_COLOR, COLUMNS, ...
+
+    code = 0
+    saved_stdin = sys.stdin
+    sys.stdin = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                app(args=argv, prog_name="odot")
+            except SystemExit as exc:
+                # Mirrors the interpreter: None is success, a message exits 1.
+                if exc.code is None or isinstance(exc.code, int):
+                    code = exc.code or 0
+                else:
+                    sys.stderr.write(f"{exc.code}\n")
+                    code = 1
+            except Exception:  # noqa: BLE001  # one bad call must not kill the server
+                traceback.print_exc()
+                code = 1
+    finally:
+        sys.stdin = saved_stdin
+    return code
+
+
+class _Server(socketserver.UnixStreamServer):
+    """The daemon's server, remembering the PRAGMA profile it was started with."""
+
+    profile: str | None
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Serve a single forwarded invocation."""
+
+    server: _Server
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:  # a liveness probe from `is_running`
+            return
+        request = json.loads(line)
+        # Relative paths (export/report/import targets) resolve against the
+        # client's working directory, not the daemon's.
+        with client_env(request["env"]), contextlib.chdir(request["cwd"]):
+            # The warm connections carry the daemon's profile; a call that
+            # needs another one (or an invalid one) runs in the client.
+            if _db_profile() != self.server.profile:
+                self.wfile.write(_frame(decline=True))
+                return
+            code = run_command(
+                request["argv"],
+                _FrameWriter(self.wfile, "out"),
+                _FrameWriter(self.wfile, "err"),
+            )
+        with contextlib.suppress(BrokenPipeError):  # the client stopped reading
+            self.wfile.write(_frame(exit=code))
+
+
+def is_running(path: Path) -> bool:
+    """Return whether something accepts connections on the socket at `path`."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(path))
+        except OSError:
+            return False
+    return True
+
+
+def make_server(path: Path) -> socketserver.UnixStreamServer:
+    """Bind the daemon's socket at `path`, replacing a stale one.
+
+    The socket is created owner-only (mode 0600): anyone who can connect can
+    run any command against the database.
+
+    Raises:
+        DaemonError: If another daemon is already listening on `path`.
+    """
+    if is_running(path):
+        raise DaemonError(f"An odot daemon is already listening on {path}")
+    path.unlink(missing_ok=True)
+    old_umask = os.umask(0o177)
+    try:
+        server = _Server(str(path), _Handler)
+    finally:
+        os.umask(old_umask)
+    server.profile = _db_profile()
+    return server
+
+
+def _interrupt(_signum: int, _frame: object) -> None:
+    """Signal handler that stops `serve` the same way Ctrl-C does."""
+    raise KeyboardInterrupt
+
+
+def serve(server: socketserver.UnixStreamServer) -> None:
+    """Serve forwarded commands on `server` until interrupted, then clean up.
+
+    `server` comes from `make_server`; its socket is removed on the way out.
+    SIGTERM is handled like Ctrl-C: it is what `kill` and service managers
+    send, and a daemon started with `&` from a script ignores SIGINT.
+    """
+    path = Path(server.server_address)
+    previous = signal.signal(signal.SIGTERM, _interrupt)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        signal.signal(signal.SIGTERM, previous)
+        server.server_close()
+        path.unlink(missing_ok=True)
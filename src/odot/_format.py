@@ -5,13 +5,23 @@ highlighting can be unit tested as pure functions without going through
 Typer's `CliRunner`.
 """
 
+from __future__ import annotations
+
 import re
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+# rich is imported inside the renderers: building labels or relative times
+# (and importing this module at all) must not pay for it.
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+    from typing import TextIO
 
-from rich.table import Table
-from rich.text import Text
+    from rich.table import Table
+    from rich.text import Text
+    from sqlalchemy import Row
 
-from odot.models import Task
+    from odot.models import Task, TaskRow
 
 #: Rich markup for each priority level, paired with a short text label so the
 #: meaning survives even without color (e.g. piped output, colorblind users).
@@ -75,7 +85,9 @@ def _truncate(text: str, width: int) -> str:
     return text[: width - 1] + "…"
 
 
-def build_task_choice_labels(tasks: list[Task]) -> list[tuple[str, int]]:
+def build_task_choice_labels(
+    tasks: Sequence[Task | TaskRow | Row[Any]],
+) -> list[tuple[str, int]]:
     """Build aligned, plain-text selection labels for interactive prompts.
 
     Produces one `(label, task_id)` pair per task with the id, status glyph,
@@ -89,7 +101,8 @@ def build_task_choice_labels(tasks: list[Task]) -> list[tuple[str, int]]:
     is assumed to have an `id` (persisted tasks always do).
 
     Args:
-        tasks: The tasks to offer, in display order.
+        tasks: The tasks to offer, in display order: `Task` objects,
+            `TaskRow`s or rows of `core.LABEL_FIELDS`.
 
     Returns:
         A list of `(label, task_id)` tuples; the labels are safe to use as
@@ -101,18 +114,43 @@ def build_task_choice_labels(tasks: list[Task]) -> list[tuple[str, int]]:
     labels: list[tuple[str, int]] = []
     for t in tasks:
         assert t.id is not None  # persisted tasks always carry an id
-        glyph = "✔" if t.is_done else "○"
-        content = _truncate(t.content, _CHOICE_CONTENT_WIDTH).ljust(
-            _CHOICE_CONTENT_WIDTH
-        )
-        label = (
-            f"# {str(t.id).rjust(id_width)} │ {glyph} │ {content} │ "
-            f"{t.category.ljust(category_width)} │ {priority_display_plain(t.priority)}"
+        label = choice_label(
+            t.id,
+            t.content,
+            t.category,
+            t.priority,
+            t.is_done,
+            id_width=id_width,
+            category_width=category_width,
         )
         labels.append((label, t.id))
     return labels
 
 
+def choice_label(
+    task_id: int,
+    content: str,
+    category: str,
+    priority: int,
+    is_done: bool,
+    *,
+    id_width: int,
+    category_width: int,
+) -> str:
+    """Build one `build_task_choice_labels` label from a task's fields.
+
+    For callers that build labels one at a time, like the large-list picker
+    in `odot._picker`, which only labels the tasks it is about to show. The
+    widths pad the id and category cells, as in `build_task_choice_labels`.
+    """
+    glyph = "✔" if is_done else "○"
+    content = _truncate(content, _CHOICE_CONTENT_WIDTH).ljust(_CHOICE_CONTENT_WIDTH)
+    return (
+        f"# {str(task_id).rjust(id_width)} │ {glyph} │ {content} │ "
+        f"{category.ljust(category_width)} │ {priority_display_plain(priority)}"
+    )
+
+
 def highlight_match(content: str, phrase: str) -> Text:
     """Highlight every case-insensitive occurrence of `phrase` within `content`.
 
@@ -129,6 +167,8 @@ def highlight_match(content: str, phrase: str) -> Text:
     Returns:
         A `Text` object with matching spans styled `bold yellow`.
     """
+    from rich.text import Text
+
     text = Text(content)
     if not phrase:
         return text
@@ -138,8 +178,35 @@ def highlight_match(content: str, phrase: str) -> Text:
     return text
 
 
+def highlight_spans(content: str, spans: Sequence[tuple[int, int]]) -> Text:
+    """Highlight precomputed `(start, end)` character spans within `content`.
+
+    The counterpart of `highlight_match` for callers that already know where
+    the matches are (e.g. offsets reported by the search index), so no regex
+    pass over the content is needed.
+
+    Args:
+        content: The full task content to render.
+        spans: Character offsets to style, as half-open `(start, end)` pairs.
+
+    Returns:
+        A `Text` object with each span styled `bold yellow`.
+    """
+    from rich.text import Text
+
+    text = Text(content)
+    for start, end in spans:
+        text.stylize("bold yellow", start, end)
+    return text
+
+
 def render_task_table(
-    tasks: list[Task], *, title: str, highlight: str | None = None
+    tasks: Sequence[Task | TaskRow | Row[Any]],
+    *,
+    title: str | None,
+    highlight: str | Mapping[int, Sequence[tuple[int, int]]] | None = None,
+    widths: Sequence[int] | None = None,
+    show_header: bool = True,
 ) -> Table:
     """Build a Rich table for a list of tasks.
 
@@ -147,26 +214,43 @@ def render_task_table(
     and styling; `search` additionally highlights the matched phrase.
 
     Args:
-        tasks: Tasks to render, one per row.
-        title: Table title.
-        highlight: Optional phrase to highlight within each row's content
-            (used by `search`; `list` omits it).
+        tasks: Tasks to render, one per row: `Task` objects, `TaskRow`s or
+            rows of `core.LABEL_FIELDS`.
+        title: Table title, or None for none.
+        highlight: Optional highlighting for each row's content (used by
+            `search`; `list` omits it): either a phrase to find in every row,
+            or a mapping of task id to precomputed match spans, which skips
+            the per-row regex scan.
+        widths: Fixed widths for the ID, Status, Priority and Category
+            columns. The table then fills the line with Content taking the
+            rest, so tables rendered separately line up (`list --pager`
+            renders one per page). By default columns fit their contents.
+        show_header: Whether to render the header row.
 
     Returns:
         A populated Rich `Table` ready to print.
     """
-    table = Table(title=title)
+    from rich.table import Table
+
+    table = Table(title=title, show_header=show_header, expand=widths is not None)
     table.add_column("ID", justify="right", style="cyan", no_wrap=True)
     table.add_column("Status", style="green")
     table.add_column("Priority", justify="right")
     table.add_column("Category", style="blue")
     table.add_column("Content")
+    if widths is not None:
+        *fixed, content = table.columns
+        for column, width in zip(fixed, widths, strict=True):
+            column.width = width
+        content.ratio = 1  # takes all the width the others leave
 
     for task in tasks:
         status_str = "[green]✓[/]" if task.is_done else "[yellow]○[/]"
-        content: str | Text = (
-            highlight_match(task.content, highlight) if highlight else task.content
-        )
+        content: str | Text = task.content
+        if isinstance(highlight, str):
+            content = highlight_match(task.content, highlight)
+        elif highlight is not None and task.id in highlight:
+            content = highlight_spans(task.content, highlight[task.id])
         table.add_row(
             str(task.id),
             status_str,
@@ -178,6 +262,59 @@ def render_task_table(
     return table
 
 
+#: Backslash escapes that keep a TSV field on one line and in one column.
+_TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+_TSV_SPECIAL = re.compile(r"[\\\n\r]")
+
+
+def write_tsv(
+    stream: TextIO, header: Sequence[str], rows: Iterable[Sequence[str]]
+) -> int:
+    r"""Write `header` and `rows` to `stream` as tab-separated values.
+
+    Each row is written as soon as it arrives. Tabs, newlines, carriage
+    returns and backslashes inside a field are written as ``\t``, ``\n``,
+    ``\r`` and ``\\`` (PostgreSQL's text format), so every line is one row
+    and ``cut``/``awk -F'\t'`` see the right columns.
+
+    Returns:
+        The number of rows written, not counting the header.
+    """
+    write = stream.write
+    write("\t".join(header) + "\n")
+    separators = len(header) - 1
+    count = 0
+    for row in rows:
+        line = "\t".join(row)
+        # Escaping is rare, so check the joined line once instead of each field.
+        if line.count("\t") != separators or _TSV_SPECIAL.search(line):
+            line = "\t".join([field.translate(_TSV_ESCAPES) for field in row])
+        write(line + "\n")
+        count += 1
+    return count
+
+
+def write_csv(
+    stream: TextIO, header: Sequence[str], rows: Iterable[Sequence[str]]
+) -> int:
+    """Write `header` and `rows` to `stream` as CSV, each row as it arrives.
+
+    Fields are quoted as RFC 4180 describes; lines end in a bare newline.
+
+    Returns:
+        The number of rows written, not counting the header.
+    """
+    import csv
+
+    writer = csv.writer(stream, lineterminator="\n")
+    writer.writerow(header)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
 #: Ordered (threshold, formatter) buckets for relative_time, smallest first.
 _RELATIVE_TIME_BUCKETS = (
     (timedelta(minutes=1), lambda _delta: "just now"),
@@ -209,3 +346,13 @@ def relative_time(dt: datetime, now: datetime | None = None) -> str:
             return formatter(delta)
 
     return f"{delta.days // 7}w ago"
+
+
+def file_size(num_bytes: int) -> str:
+    """Format a byte count for display (e.g. "512 B", "48.0 KiB", "1.2 GiB")."""
+    size = float(num_bytes)
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
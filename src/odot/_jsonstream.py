@@ -0,0 +1,260 @@
+"""Incremental reading and writing of large JSON arrays.
+
+`odot import` files can be exports of hundreds of thousands of tasks.
+`json.load` needs the whole text plus every decoded object in memory before
+the first row is written; `iter_json_array` instead decodes one array item at
+a time with `json.JSONDecoder.raw_decode` over a small sliding buffer, so
+memory stays bounded by the chunk and item size rather than the file size.
+`write_json_array` is the export side: it frames already-encoded items as
+they are produced instead of building the list for `json.dump`.
+
+`iter_json_lines` and `write_json_lines` are the same pair for NDJSON (one
+value per line), which a consumer can process line by line without a
+streaming parser.
+"""
+
+import json
+import re
+from collections.abc import Iterable, Iterator
+from functools import partial
+from typing import Any, TextIO
+
+#: Characters read from the stream at a time.
+CHUNK_SIZE = 64 * 1024
+
+#: Largest single array item accepted, in characters. Past this the item is
+#: reported as invalid instead of buffering more input: a task is a few
+#: hundred characters, and without a cap a malformed item early in a huge
+#: file would pull the rest of the file into memory looking for its end.
+MAX_ITEM_SIZE = 1024 * 1024
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE_CHARS = " \t\n\r"
+_WHITESPACE = re.compile(f"[{_WHITESPACE_CHARS}]*")
+_SEPARATOR = re.compile(f"[{_WHITESPACE_CHARS}]*,[{_WHITESPACE_CHARS}]*")
+_NUMBER_CHARS = "0123456789.eE+-"
+_NUMBER_TAIL = re.compile(r"[0-9.eE+-]*")
+
+
+class _ArrayReader:
+    """Sliding-window reader behind `iter_json_array`."""
+
+    def __init__(self, stream: TextIO, chunk_size: int) -> None:
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        # Where the buffer starts in the whole input, for error positions.
+        self._offset = 0
+        self._line = 1
+        self._line_start = 0
+
+    def _fill(self) -> bool:
+        """Drop consumed text and append another chunk; False once at EOF.
+
+        At EOF the buffer is left untouched, so positions into it stay valid.
+        """
+        if self._eof:
+            return False
+        chunk = self._stream.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        newlines = self._buffer.count("\n", 0, self._pos)
+        if newlines:
+            last_newline = self._buffer.rfind("\n", 0, self._pos)
+            self._line += newlines
+            self._line_start = self._offset + last_newline + 1
+        self._offset += self._pos
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character, or "" at EOF."""
+        while True:
+            if self._pos < len(self._buffer):
+                char = self._buffer[self._pos]
+                if char not in _WHITESPACE_CHARS:
+                    return char
+                self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+                continue
+            if not self._fill():
+                return ""
+
+    def _error(self, message: str, pos: int) -> ValueError:
+        """Build an error for buffer index `pos`, positioned in the whole input."""
+        line = self._line + self._buffer.count("\n", 0, pos)
+        last_newline = self._buffer.rfind("\n", 0, pos)
+        line_start = (
+            self._offset + last_newline + 1 if last_newline >= 0 else self._line_start
+        )
+        char = self._offset + pos
+        return ValueError(
+            f"{message}: line {line} column {char - line_start + 1} (char {char})"
+        )
+
+    def _decode(self) -> Any:
+        """Decode the value at the current position, reading more as needed."""
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                # The item may just be cut off at the end of the buffer.
+                if len(self._buffer) - self._pos < MAX_ITEM_SIZE and self._fill():
+                    continue
+                raise self._error(e.msg, e.pos) from None
+            # A number cut off by the buffer end ("12" of "123", "1." of
+            # "1.5") still decodes; only more input can tell.
+            if (end == len(self._buffer) or self._buffer[end] in _NUMBER_CHARS) and (
+                _NUMBER_TAIL.fullmatch(self._buffer, end) and self._fill()
+            ):
+                continue
+            self._pos = end
+            return value
+
+    def _expect_end(self) -> None:
+        """Reject anything but whitespace after the closing bracket."""
+        if self._peek():
+            raise self._error("Extra data", self._pos)
+
+    def _buffered_items(self) -> Iterator[Any]:
+        """Yield the items that are complete in the buffer, then stop.
+
+        The fast path for all but the last item of each chunk: an item
+        followed by a ``,`` in the buffer is known to be whole, so no refill
+        or number-tail check is needed. Anything else (the end of the
+        buffer, the closing bracket, an error) is left to `_decode`.
+        """
+        buffer = self._buffer
+        try:
+            while True:
+                value, end = _DECODER.raw_decode(buffer, self._pos)
+                separator = _SEPARATOR.match(buffer, end)
+                if separator is None or separator.end() == len(buffer):
+                    return
+                self._pos = separator.end()
+                yield value
+        except json.JSONDecodeError:
+            return
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._peek() != "[":
+            raise self._error("Expecting a JSON array", self._pos)
+        self._pos += 1
+        if self._peek() == "]":
+            self._pos += 1
+            self._expect_end()
+            return
+        while True:
+            self._peek()
+            yield from self._buffered_items()
+            yield self._decode()
+            delimiter = self._peek()
+            self._pos += 1
+            if delimiter == "]":
+                self._expect_end()
+                return
+            if delimiter != ",":
+                raise self._error("Expecting ',' delimiter", self._pos - 1)
+
+
+def iter_json_array(stream: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    """Yield the items of the JSON array in `stream` one at a time.
+
+    The stream is read in `chunk_size` pieces and each item is decoded as soon
+    as it is complete, so memory use does not grow with the array length.
+    Items are validated as they are reached: an error late in the input is
+    raised only after the earlier items have been yielded.
+
+    Args:
+        stream: Text stream positioned at the start of a JSON array.
+        chunk_size: Characters to read at a time.
+
+    Raises:
+        ValueError: If the input is not a well-formed JSON array, or an item is
+            larger than `MAX_ITEM_SIZE`. The message carries the line, column
+            and character offset in the whole input, like `json.JSONDecodeError`.
+    """
+    return iter(_ArrayReader(stream, chunk_size))
+
+
+def write_json_array(
+    stream: TextIO, items: Iterable[str], *, pretty: bool = False
+) -> int:
+    """Write already-encoded JSON values to `stream` as one JSON array.
+
+    The output is exactly what `json.dump` writes for the decoded list, each
+    item written as soon as it arrives. With `pretty`, every item must be
+    encoded with ``indent=2`` on its own (as ``json.dumps(value, indent=2)``
+    gives) and is nested one level in, matching ``json.dump(..., indent=2)``.
+    Raw newlines only occur between tokens in JSON, so re-indenting an item
+    is a plain replace.
+
+    Args:
+        stream: Text stream to write to.
+        items: JSON-encoded values.
+        pretty: Whether to lay the array out with an indent of 2.
+
+    Returns:
+        The number of items written.
+    """
+    write = stream.write
+    opening, separator = ("[\n  ", ",\n  ") if pretty else ("[", ", ")
+    count = 0
+    for item in items:
+        write(separator if count else opening)
+        write(item.replace("\n", "\n  ") if pretty else item)
+        count += 1
+    if not count:
+        write("[]")
+    else:
+        write("\n]" if pretty else "]")
+    return count
+
+
+def write_json_lines(stream: TextIO, items: Iterable[str]) -> int:
+    """Write already-encoded JSON values to `stream` as NDJSON, one per line.
+
+    Items must be compact (no raw newlines), as `json.dumps` writes by default.
+
+    Returns:
+        The number of items written.
+    """
+    write = stream.write
+    count = 0
+    for item in items:
+        write(item)
+        write("\n")
+        count += 1
+    return count
+
+
+def iter_json_lines(stream: TextIO) -> Iterator[Any]:
+    """Yield the value on each line of the NDJSON `stream`.
+
+    Blank lines are skipped. Lines are read one at a time and capped at
+    `MAX_ITEM_SIZE`, so memory use stays bounded like `iter_json_array`'s.
+
+    Raises:
+        ValueError: If a line is not a single JSON value, or is longer than
+            `MAX_ITEM_SIZE`. The message carries the line, column and character
+            offset in the whole input, like `json.JSONDecodeError`.
+    """
+    offset = 0
+    for lineno, line in enumerate(
+        iter(partial(stream.readline, MAX_ITEM_SIZE + 1), ""), 1
+    ):
+        if len(line) > MAX_ITEM_SIZE and not line.endswith("\n"):
+            msg = f"Line longer than {MAX_ITEM_SIZE} characters"
+            raise ValueError(f"{msg}: line {lineno} column 1 (char {offset})")
+        text = line.rstrip("\r\n")
+        if text.strip(_WHITESPACE_CHARS):
+            try:
+                yield json.loads(text)
+            except json.JSONDecodeError as e:
+                raise ValueError(
+                    f"{e.msg}: line {lineno} column {e.pos + 1} (char {offset + e.pos})"
+                ) from None
+        offset += len(line)
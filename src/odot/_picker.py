@@ -0,0 +1,248 @@
+"""Indexed type-to-filter task picker for large task lists.
+
+`questionary.autocomplete`'s default completer holds a label for every task
+and, on each keystroke, tests every label and yields a completion for every
+match, which prompt_toolkit then lays out; on tens of thousands of tasks each
+keystroke lags visibly. `TaskIndex` is built once per prompt instead: the
+searchable text of every task lowercased into one string, with a table of
+where each task starts, so a search is a C-speed `str.find` that stops as
+soon as a window of matches is found, and labels are only built for the
+tasks about to be shown. Query words that are each common but rarely
+together would send that scan across every task, so past a few windows'
+worth of work it gives way to a word index whose posting lists are
+intersected instead. `TaskCompleter` serves it to prompt_toolkit.
+
+Imported only when a picker is opened, since prompt_toolkit is slow to load.
+"""
+
+import re
+from bisect import bisect_right
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import accumulate, islice
+from typing import Any
+
+from prompt_toolkit.completion import CompleteEvent, Completer, Completion
+from prompt_toolkit.document import Document
+
+from odot._format import choice_label, priority_display_plain
+
+#: Most completions offered at once. The menu shows a handful; past this the
+#: user narrows the search rather than scrolls, so the rest are never built.
+WINDOW = 50
+
+#: Most distinct task words one query word is looked up in. A query word
+#: inside more of them (a digit among the ids, say) is common enough to be
+#: checked task by task among the matches of the others instead.
+LOOKUP_LIMIT = 1000
+
+_LABEL_ID = re.compile(r"#\s*(\d+) │ ")
+
+
+class TaskIndex:
+    """Substring index over the tasks a picker offers, in display order.
+
+    Each task's searchable text (id, content, category and priority label,
+    as the picker label shows them) is lowercased and joined into one string.
+    A query matches the tasks whose text contains every one of its words,
+    like ``match_middle`` autocomplete did over the full labels. Since query
+    words hold no whitespace, a task contains one exactly when one of its
+    own words does, so every distinct word also gets a posting list of the
+    rows it occurs in.
+    """
+
+    def __init__(self, rows: Iterable[Sequence[Any]]) -> None:
+        """Index `rows`, task label fields in `core.LABEL_FIELDS` order.
+
+        Args:
+            rows: Rows as `core.iter_task_choices` yields them, in the order
+                the picker should offer them.
+        """
+        self._tasks: list[tuple[int, str, str, int, bool]] = []
+        texts: list[str] = []
+        for task_id, content, category, priority, is_done in rows:
+            self._tasks.append((task_id, content, category, priority, bool(is_done)))
+            text = f"{task_id} {content} {category} {priority_display_plain(priority)}"
+            texts.append(text.lower())
+        # Newlines separate the tasks: query words never contain one, so a
+        # match never spans two tasks.
+        self._text = "\n".join(texts)
+        self._starts = _offsets(texts)
+        # A row may be listed twice for a word it holds twice; lookups
+        # gather postings into sets, so that costs nothing.
+        postings: defaultdict[str, list[int]] = defaultdict(list)
+        for row, text in enumerate(texts):
+            for word in text.split():
+                postings[word].append(row)
+        # The distinct words, joined and offset like the task text, so the
+        # words containing a query word are found by `str.find` as well.
+        self._words = "\n".join(postings)
+        self._word_starts = _offsets(postings)
+        self._postings = list(postings.values())
+        # The rows containing each word of the last search (None for words
+        # past `LOOKUP_LIMIT`), reused while the next query keeps the word.
+        self._lookups: dict[str, set[int] | None] = {}
+        self._rows = {task[0]: row for row, task in enumerate(self._tasks)}
+        self._id_width = max((len(str(task[0])) for task in self._tasks), default=0)
+        self._category_width = max((len(task[2]) for task in self._tasks), default=0)
+        # The last search that found every match (fewer than its limit), as
+        # (lowercased query, rows): typing on only ever narrows it.
+        self._complete: tuple[str, list[int]] | None = None
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def search(self, query: str, limit: int = WINDOW) -> list[int]:
+        """Return the rows of up to `limit` tasks matching `query`, in order.
+
+        An empty query matches every task. A query that extends the last one
+        to have found every match only rechecks those matches, so typing on
+        once the matches run short never rescans the whole index.
+        """
+        query = query.lower()
+        words = sorted(set(query.split()), key=len, reverse=True)
+        if not words:
+            return list(range(min(limit, len(self._tasks))))
+        text, starts = self._text, self._starts
+        if self._complete is not None and query.startswith(self._complete[0]):
+            found = [
+                row
+                for row in self._complete[1]
+                if all(
+                    text.find(word, starts[row], starts[row + 1]) >= 0 for word in words
+                )
+            ][:limit]
+        else:
+            found = self._scan(words, limit, budget=2 * len(words) * (limit + 1))
+            if found is None:
+                found = self._intersect(words, limit)
+        if len(found) < limit:
+            self._complete = (query, found)
+        return found
+
+    def _scan(
+        self, words: list[str], limit: int, budget: int | None = None
+    ) -> list[int] | None:
+        """Find the first `limit` rows containing every one of `words`.
+
+        Each word is looked for from the start of the current candidate row;
+        if it next occurs in a later row, that row becomes the candidate, so
+        the scan leaps ahead as far as the rarest word allows. Words that
+        keep leaping past each other could go on for every task, so with a
+        `budget` the scan gives up (returning None) after that many lookups.
+        """
+        text, starts = self._text, self._starts
+        found: list[int] = []
+        row = 0
+        while len(found) < limit:
+            for word in words:
+                if budget is not None:
+                    budget -= 1
+                    if budget < 0:
+                        return None
+                position = text.find(word, starts[row])
+                if position < 0:
+                    return found
+                hit = bisect_right(starts, position) - 1
+                if hit > row:
+                    row = hit
+                    break
+            else:
+                found.append(row)
+                row += 1
+        return found
+
+    def _intersect(self, words: list[str], limit: int) -> list[int]:
+        """Find the first `limit` rows containing every one of `words`.
+
+        The rows of each word come from the posting lists and are
+        intersected, so the work follows the size of the postings rather than
+        how often the words pass each other; words too common to look up are
+        then checked in the text of the rows left.
+        """
+        self._lookups = {
+            word: self._lookups[word] if word in self._lookups else self._lookup(word)
+            for word in words
+        }
+        rows: set[int] | None = None
+        common = []
+        for word, matches in self._lookups.items():
+            if matches is None:
+                common.append(word)
+            else:
+                rows = matches if rows is None else rows & matches
+        if rows is None:
+            # No word narrows the search; words this common seldom all miss
+            # a task for long, so scanning to the end is cheap.
+            return self._scan(words, limit) or []
+        text, starts = self._text, self._starts
+        found = (
+            row
+            for row in sorted(rows)
+            if all(
+                text.find(word, starts[row], starts[row + 1]) >= 0 for word in common
+            )
+        )
+        return list(islice(found, limit))
+
+    def _lookup(self, word: str) -> set[int] | None:
+        """Return the rows containing `word`, or None if it is too common.
+
+        The rows are the union of the postings of the task words `word` is
+        part of; past `LOOKUP_LIMIT` such words, None is returned instead.
+        """
+        words, starts = self._words, self._word_starts
+        rows: set[int] = set()
+        matched = 0
+        position = words.find(word)
+        while position >= 0:
+            matched += 1
+            if matched > LOOKUP_LIMIT:
+                return None
+            index = bisect_right(starts, position) - 1
+            rows.update(self._postings[index])
+            position = words.find(word, starts[index + 1])
+        return rows
+
+    def label(self, row: int) -> str:
+        """Return the picker label for `row`, built on demand."""
+        task_id, content, category, priority, is_done = self._tasks[row]
+        return choice_label(
+            task_id,
+            content,
+            category,
+            priority,
+            is_done,
+            id_width=self._id_width,
+            category_width=self._category_width,
+        )
+
+    def resolve(self, answer: str) -> int | None:
+        """Return the id of the task whose label is `answer`, or None."""
+        match = _LABEL_ID.match(answer)
+        row = self._rows.get(int(match[1])) if match else None
+        if row is None or self.label(row) != answer:
+            return None
+        return self._tasks[row][0]
+
+
+def _offsets(texts: Iterable[str]) -> list[int]:
+    """Return where each of `texts` starts once newline-joined, and the end."""
+    return list(accumulate((len(text) + 1 for text in texts), initial=0))
+
+
+class TaskCompleter(Completer):
+    """prompt_toolkit completer offering the `TaskIndex` matches for the input."""
+
+    def __init__(self, index: TaskIndex, window: int = WINDOW) -> None:
+        self._index = index
+        self._window = window
+
+    def get_completions(
+        self,
+        document: Document,
+        complete_event: CompleteEvent,  # noqa: ARG002  # part of the Completer API
+    ) -> Iterator[Completion]:
+        query = document.text_before_cursor
+        for row in self._index.search(query, self._window):
+            yield Completion(self._index.label(row), start_position=-len(query))
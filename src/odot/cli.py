@@ -1,23 +1,36 @@
 """Typer CLI application."""
 
-import importlib.metadata
+import contextlib
+import dataclasses
+import functools
+import itertools
 import json
-from dataclasses import dataclass
+import sys
+from collections.abc import Callable, Iterable, Iterator
 from enum import StrEnum
 from pathlib import Path
-from typing import Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any, cast
 
-import questionary
 import typer
-from pydantic import ValidationError
-from rich.console import Console
-from rich.prompt import Prompt
-from rich.table import Table
-from sqlmodel import Session
 
-from odot import core, database
-from odot._format import build_task_choice_labels, relative_time, render_task_table
-from odot.models import Task, TaskCreate, TaskUpdate
+from odot import _daemon, database
+from odot._format import (
+    build_task_choice_labels,
+    file_size,
+    relative_time,
+    render_task_table,
+)
+
+# Startup cost matters for a CLI that scripts call hundreds of times an hour,
+# so only typer and stdlib load with this module. SQLModel (via `core` and
+# `models`), rich, questionary and pydantic are imported inside the commands
+# that use them; `test_cli_subprocess` keeps an import-time budget.
+if TYPE_CHECKING:
+    from rich.console import Console
+    from sqlmodel import Session
+
+    from odot.core import TaskCounts
+    from odot.models import Task, TaskCreate
 
 DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
@@ -26,18 +39,35 @@ DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 #: prompt, which stays usable when a plain list would be too long to scan.
 AUTOCOMPLETE_THRESHOLD = 20
 
+#: Tasks `list --pager` fetches and renders at a time: a few screens, so the
+#: first appears at once and only the page being drawn is held in memory.
+PAGER_PAGE_SIZE = 100
 
-@dataclass
+
+@dataclasses.dataclass
 class AppContext:
     """Per-invocation state stored on `ctx.obj`.
 
     Holds the shared database session plus whether the global (or per-command)
     `--json` flag was set, so every command can consult one place to decide
-    between Rich output and machine-readable JSON.
+    between Rich output and machine-readable JSON. The session is opened on
+    first use, so commands that never query (e.g. `daemon`) don't pay for it.
     """
 
-    session: Session
     json_output: bool = False
+    _session: "Session | None" = dataclasses.field(default=None, repr=False)
+
+    @property
+    def session(self) -> "Session":
+        """The invocation's database session, opened on first access."""
+        if self._session is None:
+            self._session = database.get_session()
+        return self._session
+
+    def close(self) -> None:
+        """Close the session if one was opened."""
+        if self._session is not None:
+            self._session.close()
 
 
 class SortField(StrEnum):
@@ -55,6 +85,53 @@ class SortField(StrEnum):
     STATUS = "status"
 
 
+class SearchTokenizer(StrEnum):
+    """Tokenizers accepted by the --tokenizer option on `reindex`.
+
+    Mirrors `database.SEARCH_TOKENIZERS`; a test asserts the two stay in sync.
+    """
+
+    UNICODE61 = "unicode61"
+    TRIGRAM = "trigram"
+
+
+class OutputFormat(StrEnum):
+    """Formats accepted by the --format option on `list` and `search`.
+
+    ``json`` is the same array `--json` prints; ``ndjson`` writes one task
+    object per line as rows stream out, so consumers can start at once.
+    ``tsv`` and ``csv`` stream plain delimited rows for `awk`, `cut` or a
+    spreadsheet, with none of the table's markup or layout work.
+    """
+
+    TABLE = "table"
+    JSON = "json"
+    NDJSON = "ndjson"
+    TSV = "tsv"
+    CSV = "csv"
+
+    @property
+    def delimited(self) -> bool:
+        """Whether this is one of the plain-text row formats."""
+        return self in (OutputFormat.TSV, OutputFormat.CSV)
+
+
+class FileFormat(StrEnum):
+    """Formats accepted by the --format option on `export` and `import`."""
+
+    JSON = "json"
+    NDJSON = "ndjson"
+
+
+class CountersAction(StrEnum):
+    """Actions accepted by `odot counters`."""
+
+    ENABLE = "enable"
+    CHECK = "check"
+    REBUILD = "rebuild"
+    DISABLE = "disable"
+
+
 # invoke_without_command lets `odot` with no subcommand fall through to
 # main_callback instead of auto-printing help (see #61); help remains
 # reachable via --help since Typer still special-cases that flag.
@@ -63,9 +140,65 @@ app = typer.Typer(
     help="A minimalist CLI task manager.",
     invoke_without_command=True,
 )
-console = Console()
+
+
+class _LazyConsole:
+    """Stand-in for a `rich.console.Console`, built on first attribute access.
+
+    Constructing a Console imports most of rich, which `--json` commands and
+    the daemon client never need.
+    """
+
+    def __init__(self, *, stderr: bool = False) -> None:
+        self._stderr = stderr
+        self._console: Console | None = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console(stderr=self._stderr)
+        return getattr(self._console, name)
+
+    def reset(self) -> None:
+        """Drop the built Console, so the next use builds a fresh one."""
+        self._console = None
+
+    # Special-method lookups skip __getattr__, so the context-manager protocol
+    # (rich's Live enters its console) is forwarded explicitly.
+    def __enter__(self) -> "Console":
+        return self.__getattr__("__enter__")()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.__getattr__("__exit__")(*exc_info)
+
+
+console = cast("Console", _LazyConsole())
 #: Errors are written here so stdout stays a clean JSON channel under --json.
-err_console = Console(stderr=True)
+err_console = cast("Console", _LazyConsole(stderr=True))
+
+
+def reset_consoles() -> None:
+    """Rebuild `console` and `err_console` on next use.
+
+    Rich reads ``NO_COLOR``, ``COLUMNS`` and the like when a Console is built,
+    so the daemon calls this before each forwarded command to pick up the
+    client's environment.
+    """
+    for lazy in (console, err_console):
+        cast("_LazyConsole", lazy).reset()
+
+
+#: Reusable `--format` option for commands that print task lists.
+FormatOption = Annotated[
+    OutputFormat | None,
+    typer.Option(
+        "--format",
+        help=(
+            "Output format: table, json, ndjson (one JSON object per line), tsv or csv"
+        ),
+    ),
+]
 
 #: Reusable per-command `--json` option. The global flag on the app callback
 #: (`odot --json <cmd>`) is the primary form, but the issue's examples also
@@ -76,6 +209,17 @@ JsonOption = Annotated[
     typer.Option("--json", help="Output machine-readable JSON instead of a table."),
 ]
 
+#: Reusable option narrowing the interactive picker of commands that take a
+#: task id. It filters what is offered only; an explicit id is used as given.
+PickCategoryOption = Annotated[
+    str | None,
+    typer.Option(
+        "-c",
+        "--category",
+        help="When picking a task interactively, only offer this category",
+    ),
+]
+
 
 def emit_json(data: object) -> None:
     """Print a JSON document to stdout as the sole output of a `--json` command.
@@ -86,11 +230,68 @@ def emit_json(data: object) -> None:
 
     Args:
         data: Any JSON-serializable value (a list of task dicts, a single task
-            dict, or a small summary dict).
+            dict, or a small summary dict), or a `Task` or `TaskRow`, which
+            is printed as its ``model_dump(mode="json")`` with the keys in
+            `TASK_JSON_KEYS` order.
     """
+    if hasattr(data, "model_dump"):
+        from odot.models import TASK_JSON_KEYS
+
+        dumped = data.model_dump(mode="json")
+        data = {key: dumped[key] for key in TASK_JSON_KEYS}
     print(json.dumps(data))
 
 
+def emit_json_array(items: Iterable[str]) -> None:
+    """Stream already-encoded JSON values to stdout as one JSON array.
+
+    Produces exactly what `emit_json` prints for the decoded list, but writes
+    each element as it arrives, so a large result is never held as Python
+    objects (or as one big string) before printing.
+
+    Args:
+        items: JSON-encoded values, e.g. from `core.iter_tasks_json`.
+    """
+    from odot._jsonstream import write_json_array
+
+    write_json_array(sys.stdout, items)
+    sys.stdout.write("\n")
+
+
+def emit_json_lines(items: Iterable[str]) -> None:
+    """Stream already-encoded JSON values to stdout as NDJSON, one per line."""
+    from odot._jsonstream import write_json_lines
+
+    write_json_lines(sys.stdout, items)
+
+
+def emit_json_items(items: Iterable[str], fmt: OutputFormat) -> None:
+    """Stream encoded JSON values as an array, or as NDJSON for ``ndjson``."""
+    if fmt is OutputFormat.NDJSON:
+        emit_json_lines(items)
+    else:
+        emit_json_array(items)
+
+
+def emit_delimited(rows: Iterable[tuple[Any, ...]], fmt: OutputFormat) -> None:
+    """Stream raw task rows to stdout as TSV or CSV under a header line.
+
+    Each row is written as the query yields it: no Rich rendering, markup or
+    column measurement. A reader that exits early (``| head``) surfaces as a
+    broken pipe, which Click turns into a quiet exit.
+
+    Args:
+        rows: Rows whose first fields are `core.TASK_COLUMNS`, e.g. from
+            `core.iter_task_rows`.
+        fmt: `OutputFormat.TSV` or `OutputFormat.CSV`.
+    """
+    from odot import core
+    from odot._format import write_csv, write_tsv
+
+    write = write_tsv if fmt is OutputFormat.TSV else write_csv
+    write(sys.stdout, core.TASK_COLUMNS, map(core.task_fields, rows))
+
+
 def json_enabled(ctx: typer.Context, local: bool) -> bool:
     """Return whether JSON output is active for the current command.
 
@@ -100,6 +301,19 @@ def json_enabled(ctx: typer.Context, local: bool) -> bool:
     return bool(getattr(ctx.obj, "json_output", False)) or local
 
 
+def output_format(
+    ctx: typer.Context, json_output: bool, fmt: OutputFormat | None
+) -> OutputFormat:
+    """Return the output format for `list` or `search`.
+
+    An explicit --format wins; otherwise the --json flags select JSON, and
+    the default is the Rich table.
+    """
+    if fmt is not None:
+        return fmt
+    return OutputFormat.JSON if json_enabled(ctx, json_output) else OutputFormat.TABLE
+
+
 def json_error(message: str, *, code: int = 1) -> typer.Exit:
     """Print an error to stderr and return an `Exit` to raise.
 
@@ -111,18 +325,27 @@ def json_error(message: str, *, code: int = 1) -> typer.Exit:
 
 
 def require_task_id(
-    ctx: typer.Context, task_id: int | None, action: str, *, as_json: bool
+    ctx: typer.Context,
+    task_id: int | None,
+    action: str,
+    *,
+    as_json: bool,
+    is_done: bool | None = None,
+    category: str | None = None,
 ) -> int:
     """Resolve a task id, prompting interactively unless JSON mode is active.
 
     Under --json there is no TTY to prompt on, so a missing id is a usage
     error (exit 2) written to stderr instead of an interactive selection.
+    `is_done` and `category` narrow the tasks the picker offers.
     """
     if task_id is not None:
         return task_id
     if as_json:
         raise json_error("A task id is required in --json mode.", code=2)
-    return prompt_task_selection(ctx.obj.session, action)
+    return prompt_task_selection(
+        ctx.obj.session, action, is_done=is_done, category=category
+    )
 
 
 def require_force(force: bool, prompt: str, *, as_json: bool) -> None:
@@ -151,6 +374,8 @@ def _select_task(labels: list[tuple[str, int]], action: str) -> int:
     `use_jk_keys=False` because questionary does not allow both simultaneously
     (j/k can be part of the search string).
     """
+    import questionary
+
     choices = [questionary.Choice(title=label, value=tid) for label, tid in labels]
     task_id = questionary.select(
         f"Select a task to {action}:",
@@ -165,56 +390,92 @@ def _select_task(labels: list[tuple[str, int]], action: str) -> int:
     return task_id
 
 
-def _autocomplete_task(labels: list[tuple[str, int]], action: str) -> int:
+def _autocomplete_task(
+    db: "Session", action: str, *, is_done: bool | None, category: str | None
+) -> int:
     """Pick a task via a type-to-filter `questionary.autocomplete` (large lists).
 
-    `match_middle=True` lets a substring anywhere in the label narrow the list
-    (e.g. typing a category or a word from the content). The free-text answer
-    is validated against the known labels; an unrecognized entry is a hard
-    error (exit 1) rather than a silent miss.
+    Completions come from an `odot._picker.TaskIndex` built once over every
+    task offered, so each keystroke searches one prebuilt string and builds
+    labels only for the window of matches shown, however many tasks there
+    are. Any word typed may match anywhere in the label (e.g. a category or a
+    word from the content). The free-text answer is validated against the
+    index; an unrecognized entry is a hard error (exit 1) rather than a
+    silent miss.
     """
-    label_to_id = dict(labels)
+    import questionary
+
+    from odot import core
+    from odot._picker import TaskCompleter, TaskIndex
+
+    index = TaskIndex(core.iter_task_choices(db, is_done=is_done, category=category))
     answer = questionary.autocomplete(
         f"Select a task to {action} (type to filter):",
-        choices=[label for label, _ in labels],
-        match_middle=True,
+        choices=[],
+        completer=TaskCompleter(index),
     ).ask()
     if answer is None:
         raise _cancelled()
-    if answer not in label_to_id:
+    task_id = index.resolve(answer)
+    if task_id is None:
         console.print(f'[red]No task matches "{answer}".[/red]')
         raise typer.Exit(code=1)
-    return label_to_id[answer]
+    return task_id
 
 
-def prompt_task_selection(db: Session, action: str) -> int:
+def prompt_task_selection(
+    db: "Session",
+    action: str,
+    *,
+    is_done: bool | None = None,
+    category: str | None = None,
+) -> int:
     """Prompt the user to select a task using an interactive TUI.
 
     Small task lists use a scrollable `questionary.select` menu; once the
     count reaches `AUTOCOMPLETE_THRESHOLD` it switches to a type-to-filter
     `questionary.autocomplete` prompt so long lists stay navigable. Both
     branches share the same aligned, plain-text labels and cancel handling.
+
+    `is_done` and `category` filter the tasks offered in the query itself
+    (`odot done` only offers open tasks), and only the columns the labels
+    show are read, so a large database opens the picker at once.
     """
-    tasks = core.list_tasks(db=db)
+    from odot import core
+
+    tasks = core.list_tasks(
+        db,
+        is_done=is_done,
+        category=category,
+        limit=AUTOCOMPLETE_THRESHOLD,
+        fields=core.LABEL_FIELDS,
+    )
     if not tasks:
-        console.print("[yellow]No tasks available.[/yellow]")
+        status_word = (
+            f"{'completed' if is_done else 'pending'} " if is_done is not None else ""
+        )
+        category_suffix = f' in "{category}"' if category is not None else ""
+        console.print(
+            f"[yellow]No {status_word}tasks{category_suffix} available.[/yellow]"
+        )
         raise typer.Exit
 
-    labels = build_task_choice_labels(tasks)
     if len(tasks) >= AUTOCOMPLETE_THRESHOLD:
-        return _autocomplete_task(labels, action)
-    return _select_task(labels, action)
+        return _autocomplete_task(db, action, is_done=is_done, category=category)
+    return _select_task(build_task_choice_labels(tasks), action)
 
 
 def version_callback(value: bool) -> None:
     """Callback for version printing."""
     if value:
+        import importlib.metadata
+
         version = importlib.metadata.version("odot")
         console.print(f"odot version: {version}")
         raise typer.Exit
 
 
-def print_summary_footer(tasks: list[Task], *, category: str | None = None) -> None:
+def print_summary_footer(counts: "TaskCounts", *, category: str | None = None) -> None:
     """Print a dim counts line beneath a task table (#55).
 
     The pending/done breakdown already reflects any active --done/--todo
@@ -222,20 +483,24 @@ def print_summary_footer(tasks: list[Task], *, category: str | None = None) -> N
     echoed explicitly for context.
 
     Args:
-        tasks: The (already filtered) tasks being displayed.
+        counts: Counts for the active filters, from `core.count_tasks`.
         category: The active --category filter, if any, echoed for context.
     """
-    done_count = sum(1 for t in tasks if t.is_done)
-    pending_count = len(tasks) - done_count
+    console.print(summary_footer(counts, category=category))
+
 
+def summary_footer(counts: "TaskCounts", *, category: str | None = None) -> str:
+    """Return the markup `print_summary_footer` prints."""
     category_suffix = f' in "{category}"' if category is not None else ""
-    console.print(
-        f"[dim]{len(tasks)} tasks{category_suffix} "
-        f"({pending_count} pending, {done_count} done)[/dim]"
+    return (
+        f"[dim]{counts.total} tasks{category_suffix} "
+        f"({counts.pending} pending, {counts.done} done)[/dim]"
     )
 
 
-def print_empty_state(db: Session, *, category: str | None, done: bool | None) -> None:
+def print_empty_state(
+    db: "Session", *, category: str | None, done: bool | None
+) -> None:
     """Print a helpful empty-state message for `list` (#58).
 
     Distinguishes a genuinely empty database (onboarding message) from a
@@ -245,10 +510,12 @@ def print_empty_state(db: Session, *, category: str | None, done: bool | None) -
     unfiltered total is also 0, at least one filter must be active — the
     filtered/onboarding branches are mutually exhaustive by construction.
     """
-    total = len(core.list_tasks(db=db))
-    if total == 0:
+    from odot import core
+
+    if not core.has_tasks(db):
         console.print('No tasks yet. Add one with:  odot add "Your first task"')
         return
+    total = core.count_tasks(db).total
 
     status_word = f"{'completed' if done else 'pending'} " if done is not None else ""
     category_suffix = f' in "{category}"' if category is not None else ""
@@ -276,24 +543,40 @@ def main_callback(
             "--json",
             help=(
                 "Output machine-readable JSON. Applies to list/show/add/update/"
-                "done/undo/search/count/rm/clean/purge/import; ignored by "
-                "export/report/init-db, which produce their own artifacts."
+                "done/undo/search/count/rm/clean/purge/import/migrate/reindex/"
+                "backup/restore; "
+                "ignored by export/report/init-db, which produce their own "
+                "artifacts."
             ),
         ),
     ] = False,
 ) -> None:
     """A minimalist CLI task manager."""
     if getattr(ctx, "obj", None) is None:
+        try:
+            database.get_db_profile()
+        except ValueError as e:
+            # Checked up front: the engine reads it on first connect, deep
+            # inside whichever command runs first.
+            raise json_error(str(e)) from e
         db_path = database.get_db_path()
         # Auto-init's "Database initialized" notice would corrupt the JSON on
         # stdout, so route it to stderr when JSON output is requested.
+        notice = None
         if not db_path.exists():
             database.create_db_and_tables()
             notice = f"[dim]Database initialized at {db_path}[/dim]"
+        elif ctx.invoked_subcommand != "migrate" and database.migrate():
+            # Existing databases pick up new indexes/tables on first use;
+            # `odot migrate` skips this so it can report what it applied.
+            notice = (
+                f"[dim]Database schema upgraded to version "
+                f"{database.SCHEMA_VERSION}[/dim]"
+            )
+        if notice:
             (err_console if json_output else console).print(notice)
-        session = Session(database.get_engine())
-        ctx.obj = AppContext(session=session, json_output=json_output)
-        ctx.call_on_close(session.close)
+        ctx.obj = AppContext(json_output=json_output)
+        ctx.call_on_close(ctx.obj.close)
 
     # Bare `odot` (#61): show the task list, the most common intent, rather
     # than help. `--help` is unaffected since Typer intercepts it earlier.
@@ -301,10 +584,61 @@ def main_callback(
         ctx.invoke(list_tasks, ctx=ctx)
 
 
+def _stdin_tasks(priority: int, category: str) -> "Iterator[TaskCreate]":
+    """Yield a `TaskCreate` per non-blank stdin line, validated as it is read.
+
+    Raises:
+        ValueError: Naming the line number, if a line is not a valid task.
+    """
+    from pydantic import ValidationError
+
+    from odot.models import TaskCreate
+
+    for number, line in enumerate(sys.stdin, start=1):
+        content = line.strip()
+        if not content:
+            continue
+        try:
+            yield TaskCreate(content=content, priority=priority, category=category)
+        except ValidationError as e:
+            msg = f"Invalid task data on line {number}: {e}"
+            raise ValueError(msg) from e
+
+
+def add_from_stdin(
+    ctx: typer.Context, *, priority: int, category: str, as_json: bool
+) -> None:
+    """Run `odot add -`: add every stdin line as a task in one transaction."""
+    from odot import core
+
+    try:
+        ids = core.add_tasks_many(ctx.obj.session, _stdin_tasks(priority, category))
+    except ValueError as e:
+        # add_tasks_many rolled back, so no line was added.
+        if as_json:
+            raise json_error(str(e)) from e
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(code=1) from e
+
+    if as_json:
+        emit_json({"added": len(ids), "ids": ids})
+        return
+    if not ids:
+        console.print("[yellow]No tasks to add.[/yellow]")
+        return
+    noun = "task" if len(ids) == 1 else "tasks"
+    id_range = f"{ids[0]}" if len(ids) == 1 else f"{ids[0]}-{ids[-1]}"
+    console.print(f"[green]✅ Added {len(ids)} {noun} ({id_range}).[/green]")
+    console.print(f"[dim]   Priority: {priority} │ Category: {category}[/dim]")
+
+
 @app.command()
 def add(
     ctx: typer.Context,
-    content: Annotated[str | None, typer.Argument(help="Task content")] = None,
+    content: Annotated[
+        str | None,
+        typer.Argument(help="Task content, or - to add one task per stdin line"),
+    ] = None,
     priority: Annotated[
         int, typer.Option("-p", "--priority", help="Priority from 1 to 3")
     ] = 1,
@@ -314,7 +648,16 @@ def add(
     json_output: JsonOption = False,
 ) -> None:
     """Add a new task."""
+    from pydantic import ValidationError
+    from rich.prompt import Prompt
+
+    from odot import core
+    from odot.models import TaskCreate
+
     as_json = json_enabled(ctx, json_output)
+    if content == "-":
+        add_from_stdin(ctx, priority=priority, category=category, as_json=as_json)
+        return
     if content is None:
         if as_json:
             raise json_error("Task content is required in --json mode.", code=2)
@@ -331,7 +674,7 @@ def add(
         raise typer.Exit(code=1) from e
     task = core.add_task(db=db, task_data=task_data)
     if as_json:
-        emit_json(task.model_dump(mode="json"))
+        emit_json(task)
         return
     console.print(f'[green]✅ Added task {task.id}: "{task.content}"[/green]')
     console.print(
@@ -344,13 +687,18 @@ def add(
 def show(
     ctx: typer.Context,
     task_id: Annotated[int | None, typer.Argument(help="Task ID to show")] = None,
+    category: PickCategoryOption = None,
     json_output: JsonOption = False,
 ) -> None:
     """Show details for a specific task."""
+    from rich.table import Table
+
+    from odot import core
+
     as_json = json_enabled(ctx, json_output)
     db = ctx.obj.session
-    task_id = require_task_id(ctx, task_id, "show", as_json=as_json)
-    task = core.get_task(db=db, task_id=task_id)
+    task_id = require_task_id(ctx, task_id, "show", as_json=as_json, category=category)
+    task = core.get_task_row(db=db, task_id=task_id)
     if not task:
         if as_json:
             raise json_error(f"Task {task_id} not found.")
@@ -358,7 +706,7 @@ def show(
         raise typer.Exit(code=1)
 
     if as_json:
-        emit_json(task.model_dump(mode="json"))
+        emit_json(task)
         return
 
     table = Table(title=f"Task {task.id}")
@@ -414,31 +762,264 @@ def list_tasks(
             help="Reverse the sort order (descending)",
         ),
     ] = False,
+    limit: Annotated[
+        int | None,
+        typer.Option("-n", "--limit", min=1, help="Show at most N tasks per page"),
+    ] = None,
+    cursor: Annotated[
+        str | None,
+        typer.Option("--cursor", help="Continue after a previous page's cursor"),
+    ] = None,
+    pager: Annotated[
+        bool,
+        typer.Option(
+            "--pager",
+            help="Show the table in $PAGER, fetching tasks as you scroll",
+        ),
+    ] = False,
     json_output: JsonOption = False,
+    fmt: FormatOption = None,
 ) -> None:
-    """List tasks, optionally filtered and sorted."""
-    as_json = json_enabled(ctx, json_output)
+    """List tasks, optionally filtered, sorted and paged."""
+    from odot import core
+
+    fmt = output_format(ctx, json_output, fmt)
     db = ctx.obj.session
 
+    if limit is not None or cursor is not None:
+        listing = {"is_done": done, "category": category, "sort_by": sort}
+        print_task_page(ctx, fmt, listing, reverse=reverse, limit=limit, cursor=cursor)
+        return
+
+    # Like git, a pager only makes sense in front of a person.
+    if pager and fmt is OutputFormat.TABLE and console.is_terminal:
+        page_task_table(
+            db, is_done=done, category=category, sort_by=sort, reverse=reverse
+        )
+        return
+
+    if fmt.delimited:
+        rows = core.iter_task_rows(
+            db, is_done=done, category=category, sort_by=sort, reverse=reverse
+        )
+        emit_delimited(rows, fmt)
+        return
+    if fmt is not OutputFormat.TABLE:
+        # Raw sqlite3 rows straight to JSON; no Task objects are built.
+        items = core.iter_tasks_json(
+            db, is_done=done, category=category, sort_by=sort, reverse=reverse
+        )
+        emit_json_items(items, fmt)
+        return
+
     tasks = core.list_tasks(
         db=db,
         is_done=done,
         category=category,
         sort_by=sort,
         reverse=reverse,
+        fields=core.LABEL_FIELDS,
     )
 
-    if as_json:
-        emit_json([task.model_dump(mode="json") for task in tasks])
-        return
-
     if not tasks:
         print_empty_state(db, category=category, done=done)
         return
 
     table = render_task_table(tasks, title="Odot Tasks")
     console.print(table)
-    print_summary_footer(tasks, category=category)
+    print_summary_footer(
+        core.count_tasks(db, is_done=done, category=category), category=category
+    )
+
+
+def _pager_command() -> list[str]:
+    """Return the pager to run: $PAGER, or ``less``."""
+    import os
+    import shlex
+
+    return shlex.split(os.environ.get("PAGER") or "less")
+
+
+def page_task_table(
+    db: "Session",
+    *,
+    is_done: bool | None,
+    category: str | None,
+    sort_by: str | None,
+    reverse: bool,
+) -> None:
+    """Show the `odot list` table in a pager, fetching pages as it reads them.
+
+    Tasks are fetched `PAGER_PAGE_SIZE` at a time by keyset and each page is
+    rendered and written to the pager's stdin in turn. The pipe blocks once
+    the pager stops reading, so the next page is only fetched as the user
+    scrolls towards it, and quitting the pager stops the query. Pages after
+    the first use fixed column widths and their tables are spliced together
+    (inner borders dropped), so the result reads as one table. ``less`` gets
+    ``LESS=FRX`` unless set, so a list that fits on screen prints as usual.
+    """
+    import os
+    import subprocess
+
+    from rich.console import Console
+    from rich.segment import Segments
+
+    from odot import core
+
+    listing = {"is_done": is_done, "category": category, "sort_by": sort_by}
+    pages = core.iter_task_pages(
+        db, **listing, reverse=reverse, size=PAGER_PAGE_SIZE, rows=True
+    )
+    first = next(pages, None)
+    if first is None:
+        print_empty_state(db, category=category, done=is_done)
+        return
+
+    command = _pager_command()
+    try:
+        process = subprocess.Popen(  # noqa: S603  # the user's own $PAGER
+            command,
+            stdin=subprocess.PIPE,
+            encoding="utf-8",
+            env={"LESS": "FRX", **os.environ},
+        )
+    except OSError as e:
+        raise json_error(f"Could not run pager {command[0]!r}: {e.strerror}") from e
+    # Rendered to strings and written by hand: a Console writing to the pipe
+    # itself would treat the pager quitting as stdout closing and exit.
+    out = Console(
+        force_terminal=True, color_system=console.color_system, width=console.width
+    )
+
+    def write(renderable: Any) -> None:
+        with out.capture() as capture:
+            out.print(renderable)
+        stdin.write(capture.get())
+
+    widths = None
+    if first.next_cursor is not None:
+        longest = max(len(task.category) for task in first.items)
+        widths = (
+            max(len("ID"), len(str(core.max_task_id(db)))),
+            len("Status"),
+            len("Priority"),
+            max(len("Category"), longest),
+        )
+
+    stdin = process.stdin
+    assert stdin is not None
+    try:
+        with contextlib.suppress(BrokenPipeError):  # the user quit the pager
+            for page in itertools.chain([first], pages):
+                table = render_task_table(
+                    page.items,
+                    title="Odot Tasks" if page is first else None,
+                    widths=widths,
+                    show_header=page is first,
+                )
+                lines = out.render_lines(table, new_lines=True)
+                # Splice onto the previous page's table: no top edge here, no
+                # bottom edge while another page follows.
+                start = 0 if page is first else 1
+                stop = len(lines) if page.next_cursor is None else -1
+                write(Segments(itertools.chain.from_iterable(lines[start:stop])))
+            counts = core.count_tasks(db, is_done=is_done, category=category)
+            write(summary_footer(counts, category=category))
+            stdin.close()
+    finally:
+        with contextlib.suppress(BrokenPipeError):
+            stdin.close()
+        process.wait()
+
+
+def print_task_page(
+    ctx: typer.Context,
+    fmt: OutputFormat,
+    listing: dict[str, Any],
+    *,
+    reverse: bool,
+    limit: int | None,
+    cursor: str | None,
+) -> None:
+    """Print one page of `odot list --limit/--cursor` in `fmt`.
+
+    JSON becomes ``{"tasks": [...], "next_cursor": ...}`` so scripts can page
+    without parsing prose; NDJSON, TSV and CSV keep one task per line on
+    stdout and report the next cursor on stderr, like the table's footer does.
+    """
+    from odot import core
+
+    db = ctx.obj.session
+    if fmt is OutputFormat.TABLE:
+        page_of: Callable[..., core.TaskPage[Any]] = functools.partial(
+            core.list_tasks_page, rows=True
+        )
+    else:
+        page_of = core.task_rows_page if fmt.delimited else core.tasks_page_json
+    try:
+        page = page_of(db, **listing, reverse=reverse, limit=limit, after=cursor)
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="--cursor") from e
+
+    if fmt is OutputFormat.JSON:
+        from odot._jsonstream import write_json_array
+
+        sys.stdout.write('{"tasks": ')
+        write_json_array(sys.stdout, page.items)
+        sys.stdout.write(f', "next_cursor": {json.dumps(page.next_cursor)}}}\n')
+        return
+    hint = f"Next page: --cursor {page.next_cursor}" if page.next_cursor else None
+    if fmt is not OutputFormat.TABLE:
+        if fmt.delimited:
+            emit_delimited(page.items, fmt)
+        else:
+            emit_json_lines(page.items)
+        if hint:
+            err_console.print(f"[dim]{hint}[/dim]", highlight=False, soft_wrap=True)
+        return
+
+    if not page.items:
+        if cursor is None:
+            print_empty_state(db, category=listing["category"], done=listing["is_done"])
+        else:
+            console.print("No more tasks.")
+        return
+    console.print(render_task_table(page.items, title="Odot Tasks"))
+    print_summary_footer(
+        core.count_tasks(db, is_done=listing["is_done"], category=listing["category"]),
+        category=listing["category"],
+    )
+    if hint:
+        console.print(f"[dim]{hint}[/dim]", highlight=False, soft_wrap=True)
+
+
+def _counts_dict(counts: "TaskCounts") -> dict[str, int]:
+    """Return the `count --json` object for `counts`."""
+    return {"total": counts.total, "pending": counts.pending, "done": counts.done}
+
+
+def print_category_counts(
+    ctx: typer.Context, *, done: bool | None, category: str | None, as_json: bool
+) -> None:
+    """Print `count --by-category`: one line (or JSON object) per category."""
+    from odot import core
+
+    by_category = core.count_tasks_by_category(
+        ctx.obj.session, is_done=done, category=category
+    )
+    if as_json:
+        emit_json({name: _counts_dict(counts) for name, counts in by_category.items()})
+        return
+    if not by_category:
+        console.print("No tasks found.")
+        return
+    width = max(len(name) for name in by_category)
+    for name, counts in by_category.items():
+        console.print(
+            f"{name:<{width}}  {counts.total} tasks "
+            f"({counts.pending} pending, {counts.done} done)",
+            highlight=False,
+        )
 
 
 @app.command()
@@ -450,24 +1031,28 @@ def count(
     category: Annotated[
         str | None, typer.Option("-c", "--category", help="Filter by category")
     ] = None,
+    by_category: Annotated[
+        bool,
+        typer.Option("--by-category", help="Break the counts down by category"),
+    ] = False,
     json_output: JsonOption = False,
 ) -> None:
     """Print task counts without rendering a full table."""
-    db = ctx.obj.session
-    tasks = core.list_tasks(db=db, is_done=done, category=category)
+    from odot import core
+
+    if by_category:
+        print_category_counts(
+            ctx, done=done, category=category, as_json=json_enabled(ctx, json_output)
+        )
+        return
+
+    counts = core.count_tasks(ctx.obj.session, is_done=done, category=category)
 
     if json_enabled(ctx, json_output):
         # Report the full total/pending/done breakdown regardless of the
         # active filter so the JSON shape is stable for scripts; the filter is
         # already reflected in which tasks were counted.
-        done_count = sum(1 for t in tasks if t.is_done)
-        emit_json(
-            {
-                "total": len(tasks),
-                "pending": len(tasks) - done_count,
-                "done": done_count,
-            }
-        )
+        emit_json(_counts_dict(counts))
         return
 
     # done/todo filters collapse the line to a single count since the other
@@ -476,16 +1061,14 @@ def count(
     if done is not None:
         status_word = "completed" if done else "pending"
         category_prefix = f"{category} " if category else ""
-        noun = "task" if len(tasks) == 1 else "tasks"
-        console.print(f"{len(tasks)} {status_word} {category_prefix}{noun}")
+        noun = "task" if counts.total == 1 else "tasks"
+        console.print(f"{counts.total} {status_word} {category_prefix}{noun}")
         return
 
-    done_count = sum(1 for t in tasks if t.is_done)
-    pending_count = len(tasks) - done_count
     category_suffix = f' in "{category}"' if category else ""
     console.print(
-        f"{len(tasks)} tasks{category_suffix} ({pending_count} pending, "
-        f"{done_count} done)"
+        f"{counts.total} tasks{category_suffix} ({counts.pending} pending, "
+        f"{counts.done} done)"
     )
 
 
@@ -493,21 +1076,37 @@ def count(
 def search(
     ctx: typer.Context,
     phrase: Annotated[str, typer.Argument(help="Phrase to search for in task content")],
+    limit: Annotated[
+        int | None,
+        typer.Option("-n", "--limit", min=1, help="Show at most N best matches"),
+    ] = None,
     json_output: JsonOption = False,
+    fmt: FormatOption = None,
 ) -> None:
-    """Search for tasks containing a specific phrase."""
-    db = ctx.obj.session
-    tasks = core.search_tasks(db=db, phrase=phrase)
+    """Search for tasks containing a specific phrase, best matches first."""
+    from odot import core
 
-    if json_enabled(ctx, json_output):
-        emit_json([task.model_dump(mode="json") for task in tasks])
+    fmt = output_format(ctx, json_output, fmt)
+    db = ctx.obj.session
+    if fmt.delimited:
+        emit_delimited(core.iter_search_rows(db, phrase, limit=limit), fmt)
+        return
+    if fmt is not OutputFormat.TABLE:
+        items = core.iter_search_json(db, phrase, limit=limit)
+        emit_json_items(items, fmt)
         return
 
-    if not tasks:
+    hits = core.search_hits(db=db, phrase=phrase, limit=limit)
+
+    if not hits:
         console.print(f"No tasks matching '{phrase}' found.")
         return
 
-    table = render_task_table(tasks, title="Search Results", highlight=phrase)
+    table = render_task_table(
+        [hit.task for hit in hits],
+        title="Search Results",
+        highlight={hit.task.id: hit.spans for hit in hits if hit.task.id is not None},
+    )
     console.print(table)
 
 
@@ -523,6 +1122,9 @@ def _prompt_update_fields() -> dict[str, Any] | None:
         no-op update). Returns None only if the initial checkbox itself was
         cancelled/empty, which the caller treats as a hard error.
     """
+    import questionary
+    from rich.prompt import Prompt
+
     choices = questionary.checkbox(
         "Select fields to update:",
         choices=["content", "priority", "category", "done"],
@@ -548,7 +1150,7 @@ def _prompt_update_fields() -> dict[str, Any] | None:
     return update_kwargs
 
 
-def _snapshot(task: Task) -> dict[str, Any]:
+def _snapshot(task: "Task") -> dict[str, Any]:
     """Copy the fields `update` diffs into a plain dict.
 
     SQLAlchemy's identity map returns the *same* Python object for repeated
@@ -565,7 +1167,7 @@ def _snapshot(task: Task) -> dict[str, Any]:
     }
 
 
-def _print_update_diff(before: dict[str, Any], after: Task) -> None:
+def _print_update_diff(before: dict[str, Any], after: "Task") -> None:
     """Print a field-by-field diff line for each value `update` changed (#57)."""
     for field in ("content", "priority", "category"):
         old_value = before[field]
@@ -595,12 +1197,28 @@ def update(
         bool | None,
         typer.Option("-d/-t", "--done/--todo", help="Update completion status"),
     ] = None,
+    in_category: Annotated[
+        str | None,
+        typer.Option(
+            "--in-category",
+            help="When picking a task interactively, only offer this category",
+        ),
+    ] = None,
     json_output: JsonOption = False,
 ) -> None:
     """Update properties of an existing task."""
+    from pydantic import ValidationError
+
+    from odot import core
+    from odot.models import TaskUpdate
+
     as_json = json_enabled(ctx, json_output)
     db = ctx.obj.session
-    task_id = require_task_id(ctx, task_id, "update", as_json=as_json)
+    # -c/--category sets the new category here, so the picker filter that
+    # the other commands call --category is --in-category.
+    task_id = require_task_id(
+        ctx, task_id, "update", as_json=as_json, category=in_category
+    )
 
     # Collect only the arguments the user explicitly provided on the command line.
     provided_args = {
@@ -652,7 +1270,7 @@ def update(
         raise typer.Exit(code=1)
 
     if as_json:
-        emit_json(task.model_dump(mode="json"))
+        emit_json(task)
         return
 
     console.print(f"[green]✏️  Updated task #{task.id}[/green]")
@@ -665,12 +1283,18 @@ def done(
     task_id: Annotated[
         int | None, typer.Argument(help="Task ID to mark as done")
     ] = None,
+    category: PickCategoryOption = None,
     json_output: JsonOption = False,
 ) -> None:
     """Mark a task as done."""
+    from odot import core
+    from odot.models import TaskUpdate
+
     as_json = json_enabled(ctx, json_output)
     db = ctx.obj.session
-    task_id = require_task_id(ctx, task_id, "mark done", as_json=as_json)
+    task_id = require_task_id(
+        ctx, task_id, "mark done", as_json=as_json, is_done=False, category=category
+    )
     task = core.update_task(db=db, task_id=task_id, data=TaskUpdate(is_done=True))
     if not task:
         if as_json:
@@ -678,7 +1302,7 @@ def done(
         console.print(f"[red]Task {task_id} not found.[/red]")
         raise typer.Exit(code=1)
     if as_json:
-        emit_json(task.model_dump(mode="json"))
+        emit_json(task)
         return
     console.print(f'[green]✅ Marked done: "{task.content}" (task #{task.id})[/green]')
 
@@ -687,12 +1311,18 @@ def done(
 def undo(
     ctx: typer.Context,
     task_id: Annotated[int | None, typer.Argument(help="Task ID to re-open")] = None,
+    category: PickCategoryOption = None,
     json_output: JsonOption = False,
 ) -> None:
     """Re-open a completed task."""
+    from odot import core
+    from odot.models import TaskUpdate
+
     as_json = json_enabled(ctx, json_output)
     db = ctx.obj.session
-    task_id = require_task_id(ctx, task_id, "re-open", as_json=as_json)
+    task_id = require_task_id(
+        ctx, task_id, "re-open", as_json=as_json, is_done=True, category=category
+    )
     task = core.update_task(db=db, task_id=task_id, data=TaskUpdate(is_done=False))
     if not task:
         if as_json:
@@ -700,7 +1330,7 @@ def undo(
         console.print(f"[red]Task {task_id} not found.[/red]")
         raise typer.Exit(code=1)
     if as_json:
-        emit_json(task.model_dump(mode="json"))
+        emit_json(task)
         return
     console.print(f'[green]↩️  Re-opened: "{task.content}" (task #{task.id})[/green]')
 
@@ -712,12 +1342,17 @@ def rm(
     force: Annotated[
         bool, typer.Option("-f", "--force", help="Force deletion without confirmation")
     ] = False,
+    category: PickCategoryOption = None,
     json_output: JsonOption = False,
 ) -> None:
     """Remove a task."""
+    from odot import core
+
     as_json = json_enabled(ctx, json_output)
     db = ctx.obj.session
-    task_id = require_task_id(ctx, task_id, "remove", as_json=as_json)
+    task_id = require_task_id(
+        ctx, task_id, "remove", as_json=as_json, category=category
+    )
 
     # Fetched once up front and reused for both the confirmation prompt and
     # the deletion message, so content is echoed in the destructive
@@ -755,6 +1390,8 @@ def clean(
     json_output: JsonOption = False,
 ) -> None:
     """Delete all completed tasks from the database."""
+    from odot import core
+
     as_json = json_enabled(ctx, json_output)
     db = ctx.obj.session
 
@@ -785,6 +1422,8 @@ def purge(
     json_output: JsonOption = False,
 ) -> None:
     """Delete all tasks, completely resetting the database."""
+    from odot import core
+
     as_json = json_enabled(ctx, json_output)
     db = ctx.obj.session
 
@@ -822,16 +1461,31 @@ def export_cmd(
     pretty: Annotated[
         bool, typer.Option("-p", "--pretty", help="Pretty print JSON output")
     ] = False,
+    fmt: Annotated[
+        FileFormat,
+        typer.Option("--format", help="json (one array) or ndjson (one task per line)"),
+    ] = FileFormat.JSON,
 ) -> None:
     """Export tasks to a JSON file.
 
     A global `--json` flag is accepted but ignored here: `export` already
     produces JSON as its whole purpose, so it has no separate JSON mode.
     """
+    from odot import core
+
+    if pretty and fmt is FileFormat.NDJSON:
+        msg = "cannot be combined with --format ndjson."
+        raise typer.BadParameter(msg, param_hint="--pretty")
+
     db = ctx.obj.session
 
     count_exported = core.export_tasks(
-        db=db, path=path, is_done=done, category=category, pretty=pretty
+        db=db,
+        path=path,
+        is_done=done,
+        category=category,
+        pretty=pretty,
+        ndjson=fmt is FileFormat.NDJSON,
     )
     if path:
         console.print(f"[green]✅ Exported {count_exported} tasks to {path}[/green]")
@@ -847,9 +1501,15 @@ def import_cmd(
     clear: Annotated[
         bool, typer.Option("--clear", help="Purge existing database before importing")
     ] = False,
+    fmt: Annotated[
+        FileFormat,
+        typer.Option("--format", help="json (one array) or ndjson (one task per line)"),
+    ] = FileFormat.JSON,
     json_output: JsonOption = False,
 ) -> None:
     """Import tasks from a JSON file."""
+    from odot import core
+
     as_json = json_enabled(ctx, json_output)
     db = ctx.obj.session
 
@@ -868,7 +1528,9 @@ def import_cmd(
         )
 
     try:
-        count_imported = core.import_tasks(db=db, path=path, clear=clear)
+        count_imported = core.import_tasks(
+            db=db, path=path, clear=clear, ndjson=fmt is FileFormat.NDJSON
+        )
     except (OSError, json.JSONDecodeError, KeyError, ValueError) as e:
         if as_json:
             raise json_error(f"Failed to import tasks: {e}") from e
@@ -909,29 +1571,39 @@ def report_cmd(
     A global `--json` flag is accepted but ignored: `report` writes its own
     Markdown/HTML artifact and has no JSON mode.
     """
-    db = ctx.obj.session
+    from odot import core
 
-    tasks = core.list_tasks(
-        db=db, is_done=done, category=category, sort_by=sort, reverse=reverse
-    )
+    db = ctx.obj.session
 
-    if not tasks:
+    if not core.has_tasks(db, is_done=done, category=category):
         console.print("No tasks found matching criteria.")
         return
 
     extension = path.suffix.lower()
     if extension == ".md":
-        content = core.generate_markdown_report(tasks)
+        write_report = core.write_markdown_report
     elif extension in [".html", ".htm"]:
-        content = core.generate_html_report(tasks)
+        write_report = core.write_html_report
     else:
         console.print(
             f"[bold red]Unsupported format: {extension}. Use .md or .html[/bold red]"
         )
         raise typer.Exit(code=1)
 
+    # Streamed straight into the file, a batch of tasks at a time, so memory
+    # stays flat however many tasks the report covers.
+    tasks = core.iter_tasks(
+        db,
+        is_done=done,
+        category=category,
+        sort_by=sort,
+        reverse=reverse,
+        by_category=True,
+        fields=core.LABEL_FIELDS,
+    )
     try:
-        path.write_text(content, encoding="utf-8")
+        with path.open("w", encoding="utf-8") as f:
+            write_report(f, tasks)
         console.print(f"[green]✅ Generated report at {path}[/green]")
     except OSError as e:
         console.print(f"[bold red]Failed to write report: {e}[/bold red]")
@@ -945,8 +1617,284 @@ def init_db() -> None:
     console.print("[green]✅ Database initialized successfully.[/green]")
 
 
+@app.command()
+def reindex(
+    ctx: typer.Context,
+    tokenizer: Annotated[
+        SearchTokenizer | None,
+        typer.Option(
+            "--tokenizer",
+            help=(
+                "Search tokenizer: trigram (any substring) or unicode61 "
+                "(whole words, a smaller index). Defaults to the current one."
+            ),
+        ),
+    ] = None,
+    json_output: JsonOption = False,
+) -> None:
+    """Rebuild the full-text search index from the task table."""
+    as_json = json_enabled(ctx, json_output)
+    try:
+        used = database.rebuild_search_index(tokenizer)
+    except ValueError as e:
+        if as_json:
+            raise json_error(str(e)) from e
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(code=1) from e
+    if as_json:
+        emit_json({"tokenizer": used})
+        return
+    console.print(f"[green]✅ Rebuilt the search index ({used} tokenizer).[/green]")
+
+
+def _counters_error(message: str, *, as_json: bool) -> typer.Exit:
+    """Report an `odot counters` failure and return an `Exit` to raise."""
+    if as_json:
+        return json_error(message)
+    console.print(f"[red]{message}[/red]")
+    return typer.Exit(code=1)
+
+
+def _check_counters(*, as_json: bool) -> None:
+    """Run `odot counters check`, exiting 1 if the counters drifted."""
+    try:
+        drift = database.check_counters()
+    except ValueError as e:
+        message = f"{e} Run `odot counters enable` first."
+        raise _counters_error(message, as_json=as_json) from e
+
+    if as_json:
+        emit_json(
+            {
+                "consistent": not drift,
+                "drift": [
+                    {
+                        "category": category,
+                        "is_done": is_done,
+                        "stored": stored,
+                        "actual": actual,
+                    }
+                    for (category, is_done), (stored, actual) in drift.items()
+                ],
+            }
+        )
+    elif not drift:
+        console.print("[green]✅ Summary counters match the task table.[/green]")
+    else:
+        for (category, is_done), (stored, actual) in drift.items():
+            status = "done" if is_done else "pending"
+            console.print(
+                f'[red]"{category}" {status}: counters say {stored}, '
+                f"table has {actual}[/red]"
+            )
+        console.print("Run `odot counters rebuild` to repair them.")
+    if drift:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def counters(
+    ctx: typer.Context,
+    action: Annotated[
+        CountersAction,
+        typer.Argument(
+            help=(
+                "enable: create and fill the counters; check: compare them "
+                "with the task table; rebuild: recompute them; disable: drop "
+                "them."
+            ),
+            show_default=False,
+        ),
+    ],
+    json_output: JsonOption = False,
+) -> None:
+    """Manage the optional summary counters that make `count` constant-time.
+
+    While enabled, every task write also updates a small per-category table,
+    so `odot count` and the `list` footer stay instant on very large lists.
+    """
+    as_json = json_enabled(ctx, json_output)
+
+    if action is CountersAction.CHECK:
+        _check_counters(as_json=as_json)
+        return
+
+    if action is CountersAction.DISABLE:
+        was_enabled = database.drop_counters()
+        if as_json:
+            emit_json({"enabled": False})
+        elif was_enabled:
+            console.print("[green]✅ Summary counters disabled.[/green]")
+        else:
+            console.print("Summary counters were not enabled.")
+        return
+
+    if action is CountersAction.REBUILD:
+        with database.get_engine().connect() as conn:
+            enabled = database.counters_enabled(conn)
+        if not enabled:
+            message = (
+                "Summary counters are not enabled. Run `odot counters enable` first."
+            )
+            raise _counters_error(message, as_json=as_json)
+
+    database.rebuild_counters()
+    if as_json:
+        emit_json({"enabled": True})
+        return
+    verb = "Rebuilt" if action is CountersAction.REBUILD else "Enabled"
+    console.print(f"[green]✅ {verb} the summary counters.[/green]")
+
+
+@contextlib.contextmanager
+def _page_progress(
+    description: str, *, disable: bool
+) -> Iterator[Callable[[int, int], None]]:
+    """Show a transient progress bar fed by a `database.backup` callback.
+
+    Only drawn on a terminal: redirected output gets the result line alone.
+    """
+    from rich.progress import Progress
+
+    disable = disable or not console.is_terminal
+    with Progress(console=console, transient=True, disable=disable) as bar:
+        task = bar.add_task(description, total=None)
+
+        def update(copied: int, total: int) -> None:
+            bar.update(task, completed=copied, total=total)
+
+        yield update
+
+
+def _snapshot_error(action: str, error: Exception, *, as_json: bool) -> typer.Exit:
+    """Report a failed backup or restore and return an `Exit` to raise."""
+    message = f"Failed to {action} the database: {error}"
+    if as_json:
+        return json_error(message)
+    console.print(f"[bold red]{message}[/bold red]")
+    return typer.Exit(code=1)
+
+
+@app.command()
+def backup(
+    ctx: typer.Context,
+    path: Annotated[
+        Path, typer.Argument(help="File to write the snapshot to", dir_okay=False)
+    ],
+    force: Annotated[
+        bool, typer.Option("-f", "--force", help="Overwrite an existing file")
+    ] = False,
+    json_output: JsonOption = False,
+) -> None:
+    """Snapshot the database to a file, without blocking other commands."""
+    import sqlite3
+
+    as_json = json_enabled(ctx, json_output)
+    if path.exists() and not force:
+        error = FileExistsError(f"{path} already exists (use --force to overwrite)")
+        raise _snapshot_error("back up", error, as_json=as_json)
+
+    try:
+        with _page_progress("Backing up", disable=as_json) as progress:
+            pages = database.backup(path, progress=progress)
+    except (OSError, ValueError, sqlite3.Error) as e:
+        raise _snapshot_error("back up", e, as_json=as_json) from e
+
+    size = path.stat().st_size
+    if as_json:
+        emit_json({"path": str(path), "pages": pages, "bytes": size})
+        return
+    console.print(
+        f"[green]✅ Backed up the database to {path} ({file_size(size)}).[/green]"
+    )
+
+
+@app.command()
+def restore(
+    ctx: typer.Context,
+    path: Annotated[
+        Path,
+        typer.Argument(
+            help="Snapshot written by `odot backup`", exists=True, dir_okay=False
+        ),
+    ],
+    force: Annotated[
+        bool, typer.Option("-f", "--force", help="Restore without confirmation")
+    ] = False,
+    json_output: JsonOption = False,
+) -> None:
+    """Replace the database with a snapshot written by `odot backup`."""
+    import sqlite3
+
+    as_json = json_enabled(ctx, json_output)
+    if not force and not as_json:
+        console.print(
+            "[bold red]WARNING: This will replace ALL tasks with the contents "
+            f"of {path}.[/bold red]"
+        )
+    require_force(
+        force, "Are you sure you want to replace the database?", as_json=as_json
+    )
+
+    try:
+        with _page_progress("Restoring", disable=as_json) as progress:
+            pages = database.restore(path, progress=progress)
+    except (ValueError, sqlite3.Error) as e:
+        raise _snapshot_error("restore", e, as_json=as_json) from e
+
+    if as_json:
+        emit_json({"path": str(path), "pages": pages})
+        return
+    console.print(f"[green]✅ Restored the database from {path}.[/green]")
+
+
+@app.command()
+def migrate(ctx: typer.Context, json_output: JsonOption = False) -> None:
+    """Upgrade the database schema to the latest version."""
+    applied = database.migrate()
+    version = database.SCHEMA_VERSION
+    if json_enabled(ctx, json_output):
+        emit_json({"applied": applied, "version": version})
+        return
+    if applied == 0:
+        console.print(f"Database schema is up to date (version {version}).")
+        return
+    noun = "migration" if applied == 1 else "migrations"
+    console.print(
+        f"[green]✅ Applied {applied} {noun}; schema is now at version "
+        f"{version}.[/green]"
+    )
+
+
+@app.command()
+def daemon() -> None:
+    """Serve commands from a warm background process (Ctrl-C to stop).
+
+    While it runs, scripted calls (stdout redirected, nothing to read on
+    stdin) are forwarded to it over a Unix socket next to the database, skipping the
+    per-call import and connection cost. Set ODOT_NO_DAEMON=1 to opt out.
+    """
+    path = _daemon.socket_path()
+    try:
+        server = _daemon.make_server(path)
+    except _daemon.DaemonError as e:
+        console.print(f"[bold red]{e}[/bold red]")
+        raise typer.Exit(code=1) from e
+    console.print(f"[green]odot daemon listening on {path}[/green] (Ctrl-C to stop)")
+    _daemon.serve(server)
+
+
 def main() -> None:
-    """CLI entrypoint."""
+    """CLI entrypoint.
+
+    Hands the invocation to a running `odot daemon` when one answers and the
+    call is non-interactive; otherwise (or if it isn't running) runs in-process.
+    """
+    argv = sys.argv[1:]
+    if _daemon.should_forward(argv):
+        code = _daemon.forward(argv)
+        if code is not None:
+            sys.exit(code)
     app()
 
 
@@ -1,38 +1,233 @@
 """Core library logic (CRUD operations)."""
 
+import base64
 import json
+import re
+import sqlite3
 import sys
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from html import escape
-from itertools import groupby
+from itertools import groupby, islice
+from json.encoder import encode_basestring_ascii
 from pathlib import Path
-from typing import TextIO
-
+from typing import Any, Generic, TextIO, TypeVar, overload
+
+from pydantic import TypeAdapter
+from sqlalchemy import (
+    Integer,
+    Row,
+    Select,
+    String,
+    bindparam,
+    column,
+    func,
+    inspect,
+    literal_column,
+    table,
+    tuple_,
+)
+from sqlalchemy.dialects import sqlite
 from sqlmodel import Session, col, delete, select
+from sqlmodel.sql.expression import SelectOfScalar
 
-from odot.models import Task, TaskCreate, TaskUpdate
+from odot import database
+from odot._jsonstream import (
+    iter_json_array,
+    iter_json_lines,
+    write_json_array,
+    write_json_lines,
+)
+from odot.models import Task, TaskCreate, TaskImport, TaskRow, TaskUpdate
 
 #: Fields accepted by `list_tasks`'s `sort_by` parameter (case-insensitive).
 VALID_SORT_FIELDS = ("priority", "date", "category", "status")
 
+#: Rows per INSERT batch in `add_tasks_many`: bounds memory for unbounded
+#: input while keeping statement overhead negligible. Batches shrink to fit
+#: SQLite's bound-variable limit (999 before 3.32).
+INSERT_BATCH_SIZE = 1000
+
+#: Whether the SQLite library supports ``INSERT ... RETURNING`` (3.35+),
+#: which the trusted insert path needs; older ones insert through the ORM.
+_SQLITE_RETURNING = sqlite3.sqlite_version_info >= (3, 35)
+
+#: Tasks `iter_tasks` and `iter_search` load from SQLite per batch by default.
+FETCH_BATCH_SIZE = 1000
+
+#: Optional import item keys `import_tasks` passes to `TaskImport`; any other
+#: key in the file is ignored.
+_IMPORT_FIELDS = ("priority", "category", "is_done", "created_at", "updated_at")
+
+#: The FTS5 search index created by migration 3 (see `odot.database`).
+_TASK_FTS = table("task_fts", column("rowid"), column("content"))
+
+#: The optional summary counters table (see `database.COUNTERS_SQL`).
+_TASK_COUNTERS = table(
+    "task_counters", column("category"), column("is_done"), column("n")
+)
+
+#: A phrase the unicode61 tokenizer indexes whole: letters and digits in
+#: words separated by single spaces. It drops anything else, so other phrases
+#: would match tasks that do not contain them.
+_WORDS_RE = re.compile(r"[^\W_]+(?: [^\W_]+)*")
+
+_SelectT = TypeVar("_SelectT", bound=Select[Any])
+_ItemT = TypeVar("_ItemT")
+
 
 def add_task(db: Session, task_data: TaskCreate) -> Task:
     """Add a new task to the database.
 
+    `task_data` has already been validated, so it is written as a trusted
+    row (see `_insert_batches`) instead of being copied into a `Task` and
+    flushed through the ORM; the returned Task is loaded back from the
+    database.
+
     Args:
         db: SQLModel Session instance.
         task_data: Validated properties used for creating a new Task.
 
     Returns:
         The created Task record.
+
+    Raises:
+        RuntimeError: If the insert does not report exactly one new id, or
+            the new task cannot be read back.
     """
-    task = Task(**task_data.model_dump())
-    db.add(task)
+    task_ids = [
+        task_id
+        for batch in _insert_batches(db, [_new_task_row(task_data)])
+        for task_id in batch
+    ]
+    if len(task_ids) != 1:
+        msg = f"Inserting a task returned {len(task_ids)} ids instead of 1."
+        raise RuntimeError(msg)
+    task_id = task_ids[0]
     db.commit()
-    db.refresh(task)
+    task = db.get(Task, task_id)
+    if task is None:
+        msg = f"Task {task_id} was inserted but could not be read back."
+        raise RuntimeError(msg)
     return task
 
 
+#: Columns of the rows `_insert_batches` writes, in tuple order.
+_INSERT_COLUMNS = (
+    "content",
+    "priority",
+    "category",
+    "is_done",
+    "created_at",
+    "updated_at",
+)
+
+_INSERT_ROW_SQL = f"({', '.join('?' * len(_INSERT_COLUMNS))})"
+
+
+def _new_task_row(task: TaskCreate) -> tuple[Any, ...]:
+    """Return the trusted insert row for a new, open task created now.
+
+    Reads the validated attributes directly: `model_dump` would copy them
+    through pydantic's serializer on every row for nothing.
+    """
+    created_at = _stored_value(datetime.now(UTC))
+    return (task.content, task.priority, task.category, 0, created_at, None)
+
+
+def _insert_batches(
+    db: Session, rows: Iterable[tuple[Any, ...]]
+) -> Iterator[list[int]]:
+    """Insert trusted task rows in batches within the session's transaction.
+
+    This is the trusted construction path: each row is a tuple of
+    `_INSERT_COLUMNS` values that callers have already validated and put in
+    stored form (`_stored_value`), so the rows go straight to the session's
+    sqlite3 connection, skipping model construction and SQLAlchemy's
+    per-row parameter processing. Each batch is one multi-row
+    ``INSERT ... RETURNING id``, sized to the connection's bound-variable
+    limit; `rows` is read one batch ahead of the database, so it may be
+    unbounded. SQLite before 3.35 has no ``RETURNING``, so there each batch
+    is flushed through the ORM instead (see `_insert_orm`). Nothing is
+    committed here.
+
+    Yields:
+        The new ids of each batch, in input order.
+    """
+    connection = db.connection().connection.driver_connection
+    variables = connection.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+    batch_size = min(INSERT_BATCH_SIZE, variables // len(_INSERT_COLUMNS))
+    # Without AUTOINCREMENT, each row of a multi-row INSERT gets max(id) + 1,
+    # so sorting the RETURNING ids puts them in input order.
+    columns = ", ".join(_INSERT_COLUMNS)
+    insert_sql = f"INSERT INTO {Task.__tablename__} ({columns}) VALUES "  # noqa: S608  # constant identifiers; values are bound
+    rows = iter(rows)
+    while batch := list(islice(rows, batch_size)):
+        if not _SQLITE_RETURNING:
+            yield _insert_orm(db, batch)
+            continue
+        statement = insert_sql + ", ".join([_INSERT_ROW_SQL] * len(batch))
+        params = [value for row in batch for value in row]
+        returned = connection.execute(statement + " RETURNING id", params)
+        yield sorted(task_id for (task_id,) in returned)
+
+
+def _insert_orm(db: Session, batch: list[tuple[Any, ...]]) -> list[int]:
+    """Insert trusted rows as `Task`s flushed through the ORM; return their ids.
+
+    The fallback for SQLite without ``RETURNING``: the ORM learns each id
+    from the cursor instead. The tasks are detached once flushed, so a long
+    import does not pile them up in the session.
+    """
+    tasks = []
+    for content, priority, category, is_done, created_at, updated_at in batch:
+        tasks.append(
+            Task(
+                content=content,
+                priority=priority,
+                category=category,
+                is_done=bool(is_done),
+                created_at=_stored_datetime(created_at),
+                updated_at=None if updated_at is None else _stored_datetime(updated_at),
+            )
+        )
+    db.add_all(tasks)
+    db.flush()
+    ids = []
+    for task in tasks:
+        ids.append(task.id)
+        db.expunge(task)
+    return ids
+
+
+def add_tasks_many(db: Session, tasks: Iterable[TaskCreate]) -> list[int]:
+    """Add many tasks in one transaction.
+
+    Unlike calling `add_task` in a loop, this commits (and fsyncs) once and
+    never reloads the inserted rows, so it returns ids rather than `Task`
+    objects. `tasks` is consumed lazily in batches of up to `INSERT_BATCH_SIZE`, so
+    it may be a generator over input of any size. If anything fails, including
+    validation raised while the iterable is being consumed, the whole call is
+    rolled back.
+
+    Args:
+        db: SQLModel Session instance.
+        tasks: Validated properties for each task to create.
+
+    Returns:
+        The ids of the created tasks, in input order.
+    """
+    rows = map(_new_task_row, tasks)
+    try:
+        ids = [task_id for batch in _insert_batches(db, rows) for task_id in batch]
+    except BaseException:
+        db.rollback()
+        raise
+    db.commit()
+    return ids
+
+
 def get_task(db: Session, task_id: int) -> Task | None:
     """Retrieve a single task by its id.
 
@@ -46,14 +241,263 @@ def get_task(db: Session, task_id: int) -> Task | None:
     return db.get(Task, task_id)
 
 
+def _filter_tasks(
+    statement: _SelectT,
+    is_done: bool | None,
+    category: str | None,
+    *,
+    counters: bool = False,
+) -> _SelectT:
+    """Apply the status and category filters shared by every task listing.
+
+    With `counters`, the filters apply to the ``task_counters`` table instead.
+    """
+    source = _TASK_COUNTERS.c if counters else Task
+    if is_done is not None:
+        statement = statement.where(col(source.is_done) == is_done)
+    if category is not None:
+        # Filters are trimmed and lowercased to match normalized storage (#107).
+        statement = statement.where(col(source.category) == category.strip().lower())
+    return statement
+
+
+#: The column each `sort_by` orders by. Every listing then breaks ties by
+#: ``id``: SQLite appends the rowid to each index, so the indexes on `Task`
+#: serve the tiebreak without a temp sort.
+_SORT_COLUMNS: dict[str, str] = {
+    "priority": "priority",
+    "date": "created_at",
+    "category": "category",
+    "status": "is_done",
+}
+
+
+def _sort_key(
+    field: str | None, is_done: bool | None, category: str | None
+) -> tuple[str, ...]:
+    """Return the columns a listing is ordered by: the sort field, then the id.
+
+    The id makes the order total, which keyset paging relies on, so a page
+    comes in the same order as the full listing, and ties come in creation
+    order as they always have. A sort on a column a filter pins orders
+    nothing and is left out: in a cursor's row-value comparison it would stop
+    SQLite from seeking the index on the id after it.
+    """
+    column = None if field is None else _SORT_COLUMNS[field]
+    pinned = (is_done is not None and column == "is_done") or (
+        category is not None and column == "category"
+    )
+    return ("id",) if column is None or pinned else (column, "id")
+
+
+def _sort_field(sort_by: str | None) -> str | None:
+    """Normalize `sort_by` to a key of `_SORT_COLUMNS`.
+
+    Raises:
+        ValueError: If `sort_by` is set but is not one of `VALID_SORT_FIELDS`.
+    """
+    if not sort_by:
+        return None
+    normalized = sort_by.lower()
+    if normalized not in VALID_SORT_FIELDS:
+        msg = f"Invalid sort field: {sort_by!r}. Must be one of {VALID_SORT_FIELDS}."
+        raise ValueError(msg)
+    return normalized
+
+
+def _stored_value(value: Any) -> Any:
+    """Return `value` as SQLite stores it: bools as 0/1, datetimes as UTC text."""
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(UTC)
+        return value.strftime("%Y-%m-%d %H:%M:%S.%f")
+    return value
+
+
+def page_cursor(
+    task: Task | tuple[Any, ...],
+    is_done: bool | None = None,
+    category: str | None = None,
+    sort_by: str | None = None,
+    reverse: bool = False,
+) -> str:
+    """Return the opaque cursor that continues a listing after `task`.
+
+    Pass the last task of a page (a `Task`, a `TaskRow` or an `iter_task_rows`
+    row), with the filters and ordering the page was listed with, then pass
+    the cursor as ``after`` with those same arguments to get the next page.
+    The cursor holds that task's sort key and id, so it stays valid however
+    many tasks are added or removed in between.
+
+    Raises:
+        ValueError: If `sort_by` is set but is not one of `VALID_SORT_FIELDS`.
+    """
+    field = _sort_field(sort_by)
+    values = (
+        dict(zip(TASK_COLUMNS, task, strict=False))
+        if isinstance(task, tuple)
+        else task.model_dump()
+    )
+    names = _sort_key(field, is_done, category)
+    key = [_stored_value(values[name]) for name in names]
+    listing = _cursor_listing(field, reverse, is_done, category)
+    payload = json.dumps([*listing, key], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _cursor_listing(
+    field: str | None, reverse: bool, is_done: bool | None, category: str | None
+) -> list[Any]:
+    """Return what a cursor records of its listing: ordering and filters.
+
+    `reverse` only applies with a sort field, and the category is normalized
+    as `_filter_tasks` normalizes it, so equivalent listings share cursors.
+    """
+    normalized = None if category is None else category.strip().lower()
+    return [field, reverse and field is not None, is_done, normalized]
+
+
+def _decode_cursor(cursor: str, listing: list[Any], size: int) -> list[Any]:
+    """Return the sort key in `cursor`, checking it was made for `listing`.
+
+    Raises:
+        ValueError: If `cursor` is malformed, or belongs to another ordering
+            or filter than `listing` (from `_cursor_listing`).
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        *cursor_listing, key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        msg = f"Invalid cursor: {cursor!r}"
+        raise ValueError(msg) from e
+    if not isinstance(key, list):
+        msg = f"Invalid cursor: {cursor!r}"
+        raise ValueError(msg)  # noqa: TRY004  # same error as any other bad cursor
+    if cursor_listing != listing or len(key) != size:
+        msg = "Cursor was made for a different sort order or filter."
+        raise ValueError(msg)
+    return key
+
+
+#: The fields a one-line view of a task shows: table rows, picker labels and
+#: reports. Pass as ``fields=`` to `list_tasks` or `search_tasks` to load
+#: just these.
+LABEL_FIELDS = ("id", "content", "category", "priority", "is_done")
+
+
+def _task_columns(fields: Sequence[str]) -> list[Any]:
+    """Return the `Task` columns named in `fields`, in that order.
+
+    Raises:
+        ValueError: If `fields` is empty or names something `Task` lacks.
+    """
+    unknown = [name for name in fields if name not in Task.model_fields]
+    if unknown or not fields:
+        msg = (
+            f"Invalid task fields: {list(fields)!r}. "
+            f"Must be drawn from {tuple(Task.model_fields)}."
+        )
+        raise ValueError(msg)
+    return [col(getattr(Task, name)) for name in fields]
+
+
+def _select_tasks(
+    is_done: bool | None = None,
+    category: str | None = None,
+    sort_by: str | None = None,
+    reverse: bool = False,
+    *,
+    limit: int | None = None,
+    after: str | None = None,
+    by_category: bool = False,
+) -> SelectOfScalar[Task]:
+    """Build the filtered, sorted `select` behind `list_tasks`.
+
+    Split out so other read paths (and the query-plan tests) share exactly the
+    statement `list_tasks` runs, which the indexes on `Task` are shaped
+    around. Tasks come in the total order of `_sort_key`. Paging is
+    keyset-based: `after` becomes a row-value comparison on that key, which
+    SQLite answers by seeking the index, so a late page costs the same as the
+    first. `reverse` only applies with `sort_by`. `by_category` orders by
+    category ahead of the sort key, for reports.
+
+    Raises:
+        ValueError: If `sort_by` is set but is not one of `VALID_SORT_FIELDS`,
+            or `after` is not a cursor for this ordering.
+    """
+    statement = _filter_tasks(select(Task), is_done=is_done, category=category)
+    field = _sort_field(sort_by)
+    reverse = reverse and field is not None
+    names = _sort_key(field, is_done, category)
+    columns = [col(getattr(Task, name)) for name in names]
+    if after is not None:
+        listing = _cursor_listing(field, reverse, is_done, category)
+        key = _decode_cursor(after, listing, len(names))
+        # Explicitly typed binds compare against the stored text as is, and
+        # keep the compiled parameters plain for the raw sqlite3 path.
+        bounds = tuple_(
+            *(
+                bindparam(
+                    None, value, type_=String() if isinstance(value, str) else Integer()
+                )
+                for value in key
+            )
+        )
+        position = tuple_(*columns)
+        statement = statement.where(position < bounds if reverse else position > bounds)
+    orderings = [column.desc() if reverse else column.asc() for column in columns]
+    if by_category:
+        orderings.insert(0, col(Task.category).asc())
+    statement = statement.order_by(*orderings)
+    if limit is not None:
+        statement = statement.limit(limit)
+    return statement
+
+
+@overload
+def list_tasks(
+    db: Session,
+    is_done: bool | None = None,
+    category: str | None = None,
+    sort_by: str | None = None,
+    reverse: bool = False,
+    limit: int | None = None,
+    after: str | None = None,
+    fields: None = None,
+) -> list[Task]: ...
+
+
+@overload
+def list_tasks(
+    db: Session,
+    is_done: bool | None = None,
+    category: str | None = None,
+    sort_by: str | None = None,
+    reverse: bool = False,
+    limit: int | None = None,
+    after: str | None = None,
+    *,
+    fields: Sequence[str],
+) -> list[Row[Any]]: ...
+
+
 def list_tasks(
     db: Session,
     is_done: bool | None = None,
     category: str | None = None,
     sort_by: str | None = None,
     reverse: bool = False,
-) -> list[Task]:
-    """Retrieve tasks with optional filtering and sorting.
+    limit: int | None = None,
+    after: str | None = None,
+    fields: Sequence[str] | None = None,
+) -> list[Task] | list[Row[Any]]:
+    """Retrieve tasks with optional filtering, sorting and paging.
+
+    Without `sort_by`, tasks come in id order; with it, ties in the sort
+    field come in id order. The order is total, so consecutive pages never
+    overlap or skip.
 
     Args:
         db: SQLModel Session instance.
@@ -61,61 +505,909 @@ def list_tasks(
         category: Filter by category if set; otherwise returns all tasks.
         sort_by: Field to sort by, one of `VALID_SORT_FIELDS`
             ('priority', 'date', 'category', 'status'). Case-insensitive.
-        reverse: If True, sort descending.
+        reverse: If True, sort descending. Ignored without `sort_by`.
+        limit: Return at most this many tasks.
+        after: Cursor from `page_cursor` for the last task of the previous
+            page; only tasks after it are returned.
+        fields: Load only these `Task` fields (e.g. `LABEL_FIELDS`): each
+            task comes back as a read-only row with just those attributes,
+            skipping the model building and validation a full `Task` costs.
 
     Returns:
-        A list of matching Task schemas.
+        A list of matching Task schemas, or rows of `fields`.
+
+    Raises:
+        ValueError: If `sort_by` is set but is not one of `VALID_SORT_FIELDS`,
+            `after` is not a cursor for this ordering, or `fields` names a
+            field `Task` does not have.
+    """
+    statement = _select_tasks(
+        is_done=is_done,
+        category=category,
+        sort_by=sort_by,
+        reverse=reverse,
+        limit=limit,
+        after=after,
+    )
+    if fields is None:
+        return list(db.exec(statement).all())
+    projected = statement.with_only_columns(*_task_columns(fields))
+    return list(db.execute(projected).all())
+
+
+@overload
+def iter_tasks(
+    db: Session,
+    is_done: bool | None = None,
+    category: str | None = None,
+    sort_by: str | None = None,
+    reverse: bool = False,
+    *,
+    batch_size: int = FETCH_BATCH_SIZE,
+    by_category: bool = False,
+    fields: None = None,
+) -> Iterator[Task]: ...
+
+
+@overload
+def iter_tasks(
+    db: Session,
+    is_done: bool | None = None,
+    category: str | None = None,
+    sort_by: str | None = None,
+    reverse: bool = False,
+    *,
+    batch_size: int = FETCH_BATCH_SIZE,
+    by_category: bool = False,
+    fields: Sequence[str],
+) -> Iterator[Row[Any]]: ...
+
+
+def iter_tasks(
+    db: Session,
+    is_done: bool | None = None,
+    category: str | None = None,
+    sort_by: str | None = None,
+    reverse: bool = False,
+    *,
+    batch_size: int = FETCH_BATCH_SIZE,
+    by_category: bool = False,
+    fields: Sequence[str] | None = None,
+) -> Iterator[Task] | Iterator[Row[Any]]:
+    """Yield the tasks `list_tasks` would return, loading them in batches.
+
+    Tasks are built `batch_size` rows at a time and detached from the session
+    as they are yielded, so the identity map does not keep every one alive:
+    memory stays flat however many tasks there are, provided the caller does
+    not hold on to them either. Detached tasks read as usual, but changes to
+    them are not saved. Tasks the session had already loaded stay attached.
+
+    With `by_category`, tasks come grouped by category (in category order),
+    in the requested order within each, ready for `write_markdown_report`.
+    `fields` yields rows of just those fields, as in `list_tasks`.
+
+    Raises:
+        ValueError: If `sort_by` is set but is not one of `VALID_SORT_FIELDS`,
+            or `fields` names a field `Task` does not have.
+    """
+    statement = _select_tasks(
+        is_done=is_done,
+        category=category,
+        sort_by=sort_by,
+        reverse=reverse,
+        by_category=by_category,
+    )
+    if fields is not None:
+        projected = statement.with_only_columns(*_task_columns(fields))
+        return _iter_rows(db, projected, batch_size)
+    return _iter_detached(db, statement, batch_size)
+
+
+def _iter_rows(
+    db: Session, statement: Select[Any], batch_size: int
+) -> Iterator[Row[Any]]:
+    """Run a projected `statement` with ``yield_per``, yielding its rows."""
+    result = db.execute(statement.execution_options(yield_per=batch_size))
+    try:
+        yield from result
+    finally:
+        result.close()
+
+
+def _iter_detached(
+    db: Session, statement: SelectOfScalar[Task], batch_size: int
+) -> Iterator[Task]:
+    """Run `statement` with ``yield_per``, expunging each new task it yields."""
+    loaded = set(db.identity_map.keys())
+    result = db.exec(statement.execution_options(yield_per=batch_size))
+    try:
+        for task in result:
+            if inspect(task).identity_key not in loaded:
+                db.expunge(task)
+            yield task
+    finally:
+        result.close()
+
+
+@dataclass(frozen=True)
+class TaskPage(Generic[_ItemT]):
+    """One page of a keyset-paged listing, from `list_tasks_page`.
+
+    Attributes:
+        items: The page's tasks, as `Task` objects or encoded JSON objects.
+        next_cursor: Cursor for the following page, or None on the last one.
+    """
+
+    items: list[_ItemT]
+    next_cursor: str | None
+
+
+def _take_page(
+    items: Iterable[_ItemT], limit: int | None, cursor: Callable[[_ItemT], str]
+) -> TaskPage[_ItemT]:
+    """Cut `items`, fetched with one extra, to a page of `limit`.
+
+    The extra item only signals that another page exists, which saves the
+    caller a request that would come back empty.
+    """
+    page = list(items)
+    if limit is None or len(page) <= limit:
+        return TaskPage(page, None)
+    del page[limit:]
+    return TaskPage(page, cursor(page[-1]))
+
+
+def list_tasks_page(
+    db: Session,
+    is_done: bool | None = None,
+    category: str | None = None,
+    sort_by: str | None = None,
+    reverse: bool = False,
+    *,
+    limit: int | None,
+    after: str | None = None,
+    rows: bool = False,
+) -> TaskPage[Task] | TaskPage[TaskRow]:
+    """Return one page of `list_tasks` and the cursor for the next.
+
+    Args:
+        db: SQLModel Session instance.
+        is_done: Filter by completion status, as in `list_tasks`.
+        category: Filter by category, as in `list_tasks`.
+        sort_by: Sort field, as in `list_tasks`.
+        reverse: If True, sort descending.
+        limit: Page size; None returns every task after `after`.
+        after: The previous page's `TaskPage.next_cursor`, or None to start.
+        rows: Return the page as `TaskRow`s, via `list_task_rows`.
+
+    Raises:
+        ValueError: If `sort_by` is set but is not one of `VALID_SORT_FIELDS`,
+            or `after` is not a cursor for this ordering.
+    """
+    tasks = (list_task_rows if rows else list_tasks)(
+        db,
+        is_done=is_done,
+        category=category,
+        sort_by=sort_by,
+        reverse=reverse,
+        limit=None if limit is None else limit + 1,
+        after=after,
+    )
+    return _take_page(
+        tasks,
+        limit,
+        lambda task: page_cursor(task, is_done, category, sort_by, reverse),
+    )
+
+
+def iter_task_pages(
+    db: Session,
+    is_done: bool | None = None,
+    category: str | None = None,
+    sort_by: str | None = None,
+    reverse: bool = False,
+    *,
+    size: int,
+    rows: bool = False,
+) -> Iterator[TaskPage[Task]] | Iterator[TaskPage[TaskRow]]:
+    """Yield `list_tasks` one page of `size` tasks at a time.
+
+    Each page is queried only when the previous one has been consumed, by
+    keyset from where it ended, so a consumer that stops early (a pager the
+    user quits) never reads the rest, and only the current page is held in
+    memory. A page's `next_cursor` is None exactly when it is the last.
+    `rows` yields pages of `TaskRow`s, as in `list_tasks_page`.
 
     Raises:
         ValueError: If `sort_by` is set but is not one of `VALID_SORT_FIELDS`.
     """
-    statement = select(Task)
+    _sort_field(sort_by)  # fail on the call, not on the first next()
+    return _iter_task_pages(db, is_done, category, sort_by, reverse, size, rows)
 
-    if is_done is not None:
-        statement = statement.where(col(Task.is_done) == is_done)
-    if category is not None:
-        # Filters are trimmed and lowercased to match normalized storage (#107).
-        statement = statement.where(col(Task.category) == category.strip().lower())
 
-    if sort_by:
-        normalized = sort_by.lower()
-        if normalized not in VALID_SORT_FIELDS:
-            msg = (
-                f"Invalid sort field: {sort_by!r}. Must be one of {VALID_SORT_FIELDS}."
+def _iter_task_pages(
+    db: Session,
+    is_done: bool | None,
+    category: str | None,
+    sort_by: str | None,
+    reverse: bool,
+    size: int,
+    rows: bool,
+) -> Iterator[TaskPage[Task]] | Iterator[TaskPage[TaskRow]]:
+    """The generator behind `iter_task_pages`."""
+    cursor = None
+    while True:
+        page = list_tasks_page(
+            db, is_done, category, sort_by, reverse, limit=size, after=cursor, rows=rows
+        )
+        if page.items:
+            yield page
+        if page.next_cursor is None:
+            return
+        cursor = page.next_cursor
+
+
+def max_task_id(db: Session) -> int:
+    """Return the highest task id in use, or 0 for an empty database.
+
+    Answered from the end of the rowid b-tree, so it costs the same however
+    many tasks there are.
+    """
+    return db.exec(select(func.max(Task.id))).one() or 0
+
+
+@dataclass(frozen=True)
+class TaskCounts:
+    """Task totals returned by `count_tasks`.
+
+    Attributes:
+        total: Every task matching the filters.
+        pending: Matching tasks not yet done.
+        done: Matching tasks marked done.
+    """
+
+    total: int
+    pending: int
+    done: int
+
+
+def _count_statement(
+    is_done: bool | None = None,
+    category: str | None = None,
+    *,
+    by_category: bool = False,
+    counters: bool = False,
+) -> Select[Any]:
+    """Build the ``GROUP BY`` query behind `count_tasks`.
+
+    Rows are ``(is_done, n)``, or ``(category, is_done, n)`` with
+    `by_category`. With `counters` the sums come from the ``task_counters``
+    table rather than counting tasks.
+    """
+    source = _TASK_COUNTERS.c if counters else Task
+    tally = func.sum(_TASK_COUNTERS.c.n) if counters else func.count()
+    keys = [col(source.category)] if by_category else []
+    keys.append(col(source.is_done))
+    return _filter_tasks(
+        select(*keys, tally).group_by(*keys).order_by(*keys),
+        is_done=is_done,
+        category=category,
+        counters=counters,
+    )
+
+
+def _counts(by_status: dict[bool, int]) -> TaskCounts:
+    """Fold ``{is_done: n}`` into a `TaskCounts`."""
+    pending, done = by_status.get(False, 0), by_status.get(True, 0)
+    return TaskCounts(total=pending + done, pending=pending, done=done)
+
+
+def count_tasks(
+    db: Session, is_done: bool | None = None, category: str | None = None
+) -> TaskCounts:
+    """Count tasks by status with one aggregate query.
+
+    Runs ``SELECT is_done, count(*) ... GROUP BY is_done`` with the same
+    filters as `list_tasks`, so no rows are loaded; SQLite answers it from
+    the ``is_done``-leading indexes without touching the table. When the
+    summary counters are enabled (`database.rebuild_counters`) it sums their
+    few rows instead, which costs the same for any number of tasks.
+
+    Args:
+        db: SQLModel Session instance.
+        is_done: Count only tasks with this completion status if set.
+        category: Count only tasks in this category if set.
+
+    Returns:
+        The total, pending and done counts for the matching tasks.
+    """
+    statement = _count_statement(
+        is_done=is_done,
+        category=category,
+        counters=database.counters_enabled(db.connection()),
+    )
+    return _counts(dict(db.exec(statement).all()))
+
+
+def count_tasks_by_category(
+    db: Session, is_done: bool | None = None, category: str | None = None
+) -> dict[str, TaskCounts]:
+    """Count tasks per category and status with one aggregate query.
+
+    Like `count_tasks`, this reads the summary counters when they are enabled.
+
+    Args:
+        db: SQLModel Session instance.
+        is_done: Count only tasks with this completion status if set.
+        category: Count only tasks in this category if set.
+
+    Returns:
+        Counts keyed by category, in category order. Categories without a
+        matching task are omitted.
+    """
+    statement = _count_statement(
+        is_done=is_done,
+        category=category,
+        by_category=True,
+        counters=database.counters_enabled(db.connection()),
+    )
+    return {
+        name: _counts({status: n for _, status, n in rows})
+        for name, rows in groupby(db.exec(statement).all(), key=lambda row: row[0])
+    }
+
+
+def has_tasks(
+    db: Session, is_done: bool | None = None, category: str | None = None
+) -> bool:
+    """Return whether any task matches the filters.
+
+    A ``LIMIT 1`` probe that stops at the first matching index entry, for
+    callers that only need to know whether a count would be zero.
+
+    Args:
+        db: SQLModel Session instance.
+        is_done: Consider only tasks with this completion status if set.
+        category: Consider only tasks in this category if set.
+    """
+    statement = _filter_tasks(
+        select(col(Task.id)).limit(1), is_done=is_done, category=category
+    )
+    return db.exec(statement).first() is not None
+
+
+def _search_match(phrase: str, tokenizer: str | None) -> str | None:
+    """Translate a search phrase into an FTS5 MATCH expression.
+
+    Returns None when the full-text index cannot answer the phrase and
+    `search_tasks` must fall back to a ``LIKE`` scan: there is no index, the
+    phrase is shorter than the three characters a trigram index needs, or a
+    unicode61 index would drop some of its characters (``c++`` would search
+    for words starting with "c").
+    """
+    if tokenizer == "trigram":
+        return _quoted_phrase(phrase) if len(phrase) >= 3 else None
+    if tokenizer is None or not _WORDS_RE.fullmatch(phrase):
+        return None
+    # unicode61 matches whole words, so the last word is matched as a prefix
+    # to keep "groc" finding "groceries".
+    return _quoted_phrase(phrase) + "*"
+
+
+def _quoted_phrase(phrase: str) -> str:
+    """Quote `phrase` as an FTS5 string, so its syntax characters are literal."""
+    return '"' + phrase.replace('"', '""') + '"'
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """One `search_hits` result: a task plus how and where it matched.
+
+    Attributes:
+        task: The matching task.
+        score: BM25 relevance, higher is better; None when the phrase was
+            answered by the substring fallback, which has no ranking.
+        spans: ``(start, end)`` character offsets of each match within
+            ``task.content``, in order, ready to style without re-scanning.
+    """
+
+    task: Task
+    score: float | None
+    spans: tuple[tuple[int, int], ...]
+
+
+#: Sentinels `highlight()` wraps around each match; `_marked_spans` turns them
+#: back into offsets. Control characters that never appear in typed content.
+_MATCH_OPEN, _MATCH_CLOSE = "\x02", "\x03"
+
+
+def _marked_spans(
+    marked: str, content: str, phrase: str
+) -> tuple[tuple[int, int], ...]:
+    """Convert FTS5 `highlight()` output into match offsets within `content`."""
+    spans: list[tuple[int, int]] = []
+    plain: list[str] = []
+    start = 0
+    for char in marked:
+        if char == _MATCH_OPEN:
+            start = len(plain)
+        elif char == _MATCH_CLOSE:
+            spans.append((start, len(plain)))
+        else:
+            plain.append(char)
+    if "".join(plain) != content:
+        # The content itself contains a sentinel; recompute the slow way.
+        return _substring_spans(content, phrase)
+    return tuple(spans)
+
+
+def _substring_spans(content: str, phrase: str) -> tuple[tuple[int, int], ...]:
+    """Return case-insensitive occurrences of `phrase` in `content`."""
+    return tuple(
+        match.span() for match in re.finditer(re.escape(phrase), content, re.IGNORECASE)
+    )
+
+
+def _search_statement(
+    db: Session,
+    phrase: str,
+    limit: int | None,
+    columns: Sequence[Any] = (Task,),
+    *,
+    scored: bool = True,
+) -> tuple[Select[Any], bool]:
+    """Build the query behind `search_hits` and report whether it is ranked.
+
+    A ranked statement selects `columns` (a whole `Task` by default) from the
+    full-text index, followed by ``bm25`` and the highlighted content when
+    `scored`; the substring fallback selects bare `columns`.
+    """
+    match = _search_match(phrase, database.get_search_tokenizer(db.connection()))
+    if match is None:
+        statement = (
+            select(*columns)
+            .where(col(Task.content).icontains(phrase))
+            .order_by(col(Task.id))
+            .limit(limit)
+        )
+        return statement, False
+
+    fts = literal_column("task_fts")
+    rank = func.bm25(fts)
+    extras = (rank, func.highlight(fts, 0, _MATCH_OPEN, _MATCH_CLOSE)) if scored else ()
+    ranked = (
+        select(*columns, *extras)
+        .join(_TASK_FTS, _TASK_FTS.c.rowid == Task.id)
+        .where(fts.match(match))
+        .order_by(rank, col(Task.id))
+        .limit(limit)
+    )
+    return ranked, True
+
+
+def search_hits(db: Session, phrase: str, limit: int | None = None) -> list[SearchHit]:
+    """Search tasks by content phrase, best matches first.
+
+    Uses the ``task_fts`` full-text index, so cost grows with the number of
+    matches rather than the table size. With the default "trigram" tokenizer
+    the phrase matches any substring of three or more characters; an index
+    rebuilt with the "unicode61" tokenizer matches a run of whole words, the
+    last one as a prefix ("buy groc" finds "Buy groceries", "roc" does not).
+    Either way matching is case-insensitive, results are ranked by BM25 (ties
+    broken by id), and match offsets come from FTS5's `highlight()`.
+
+    Phrases the index cannot answer (see `_search_match`), and databases that
+    predate the index, fall back to a case-insensitive substring scan in id
+    order: both the column and the phrase are lowered via SQL `lower()`
+    rather than relying on SQLite's default `LIKE` case-folding (which is
+    ASCII-only and an implementation detail we don't want to depend on
+    implicitly).
+
+    Args:
+        db: SQLModel Session instance.
+        phrase: The phrase to search for (case-insensitive).
+        limit: Return at most this many hits; None returns every match.
+
+    Returns:
+        A list of `SearchHit`, best first.
+    """
+    statement, ranked = _search_statement(db, phrase, limit)
+    if not ranked:
+        return [
+            SearchHit(
+                task=task, score=None, spans=_substring_spans(task.content, phrase)
             )
-            raise ValueError(msg)
+            for task in db.exec(statement).all()
+        ]
+    # bm25() is negative with the best match lowest; flip it so a higher
+    # score means more relevant, which is what JSON consumers expect.
+    return [
+        SearchHit(
+            task=task, score=-bm25, spans=_marked_spans(text, task.content, phrase)
+        )
+        for task, bm25, text in db.exec(statement).all()
+    ]
+
 
-        field_map = {
-            "priority": Task.priority,
-            "date": Task.created_at,
-            "category": Task.category,
-            "status": Task.is_done,
-        }
+@overload
+def search_tasks(
+    db: Session, phrase: str, limit: int | None = None, fields: None = None
+) -> list[Task]: ...
 
-        target_field = field_map[normalized]
-        ordering = col(target_field).desc() if reverse else col(target_field).asc()
-        statement = statement.order_by(ordering)
 
-    return list(db.exec(statement).all())
+@overload
+def search_tasks(
+    db: Session, phrase: str, limit: int | None = None, *, fields: Sequence[str]
+) -> list[Row[Any]]: ...
 
 
-def search_tasks(db: Session, phrase: str) -> list[Task]:
-    """Search tasks by content phrase.
+def search_tasks(
+    db: Session,
+    phrase: str,
+    limit: int | None = None,
+    fields: Sequence[str] | None = None,
+) -> list[Task] | list[Row[Any]]:
+    """Search tasks by content phrase, best matches first.
 
-    Matching is explicitly case-insensitive: both the column and the search
-    phrase are lowered via SQL `lower()` before comparison, rather than
-    relying on SQLite's default `LIKE` case-folding (which is ASCII-only and
-    an implementation detail we don't want to depend on implicitly).
+    The plain-task form of `search_hits`; see it for the matching rules.
 
     Args:
         db: SQLModel Session instance.
-        phrase: The substring to search for (case-insensitive).
+        phrase: The phrase to search for (case-insensitive).
+        limit: Return at most this many tasks; None returns every match.
+        fields: Load only these `Task` fields, as rows, like `list_tasks`.
 
     Returns:
-        A list of matching Task schemas.
+        A list of matching Task schemas (or rows of `fields`), most relevant
+        first.
+
+    Raises:
+        ValueError: If `fields` names a field `Task` does not have.
+    """
+    if fields is None:
+        return [hit.task for hit in search_hits(db, phrase, limit=limit)]
+    columns = _task_columns(fields)
+    statement, _ = _search_statement(db, phrase, limit, columns, scored=False)
+    return list(db.execute(statement).all())
+
+
+def iter_search(
+    db: Session,
+    phrase: str,
+    limit: int | None = None,
+    *,
+    batch_size: int = FETCH_BATCH_SIZE,
+) -> Iterator[Task]:
+    """Yield the tasks `search_tasks` would return, loading them in batches.
+
+    Best matches first, batched and detached from the session like
+    `iter_tasks`; no scores or match spans are computed.
+    """
+    statement, _ = _search_statement(db, phrase, limit, scored=False)
+    return _iter_detached(db, statement, batch_size)
+
+
+#: Columns of every raw task row, in table order.
+TASK_COLUMNS = (
+    "content",
+    "priority",
+    "category",
+    "id",
+    "is_done",
+    "created_at",
+    "updated_at",
+)
+
+#: sqlite dialect with named placeholders, so compiled parameters can be passed
+#: to the DB-API cursor as the dict SQLAlchemy already holds.
+_RAW_DIALECT = sqlite.dialect(paramstyle="named")
+
+#: Serializes the rare timestamp not stored in SQLAlchemy's canonical format
+#: exactly as ``model_dump(mode="json")`` would.
+_DATETIME_JSON = TypeAdapter(datetime)
+
+
+def _raw_rows(db: Session, statement: Select[Any]) -> Iterator[tuple[Any, ...]]:
+    """Run a statement on the session's sqlite3 connection, yielding plain tuples.
+
+    The SQL is compiled from the same statement the ORM path executes, so
+    filters, ordering and query plan are identical; only result processing
+    and model hydration are skipped. Bound values here are str, int and bool,
+    which sqlite3 adapts exactly as SQLAlchemy's bind processors do.
+    """
+    compiled = statement.compile(dialect=_RAW_DIALECT)
+    connection = db.connection().connection.driver_connection
+    cursor = connection.cursor()
+    try:
+        yield from cursor.execute(str(compiled), compiled.params)
+    finally:
+        cursor.close()
+
+
+def _datetime_json(value: str | None) -> str:
+    """Encode a stored timestamp exactly as the ORM path's JSON shows it.
+
+    SQLModel's ``UTCDateTime`` reads the naive text SQLite holds as UTC, and
+    pydantic renders that as ISO 8601 with a ``Z`` suffix, dropping an
+    all-zero fraction. SQLAlchemy writes ``YYYY-MM-DD HH:MM:SS.ffffff``, which
+    is rewritten as text; anything else (hand-edited or legacy rows) is
+    parsed and converted the way the ORM does, then serialized by pydantic.
+    """
+    if value is None:
+        return "null"
+    if len(value) == 26 and value[10] == " " and value[19] == ".":
+        if value.endswith(".000000"):
+            return f'"{value[:10]}T{value[11:19]}Z"'
+        return f'"{value[:10]}T{value[11:]}Z"'
+    return _DATETIME_JSON.dump_json(_stored_datetime(value)).decode()
+
+
+def _stored_datetime(value: str) -> datetime:
+    """Parse a stored timestamp into the aware UTC datetime the ORM reads."""
+    if len(value) == 26 and value[10] == " " and value[19] == ".":
+        # SQLAlchemy's own format, the common case: skip the offset logic.
+        return datetime.fromisoformat(value).replace(tzinfo=UTC)
+    parsed = datetime.fromisoformat(value)
+    if parsed.utcoffset() is None:
+        return parsed.replace(tzinfo=UTC)
+    return parsed.astimezone(UTC)
+
+
+def task_row(row: tuple[Any, ...]) -> TaskRow:
+    """Convert a raw `TASK_COLUMNS` row into a `TaskRow`.
+
+    Values get the types the ORM gives them (``is_done`` as a bool,
+    timestamps as aware UTC datetimes), so the `TaskRow` compares and dumps
+    like the `Task` loaded from the same row.
+    """
+    content, priority, category, task_id, is_done, created_at, updated_at = row[:7]
+    return TaskRow(
+        content,
+        priority,
+        category,
+        task_id,
+        bool(is_done),
+        _stored_datetime(created_at),
+        None if updated_at is None else _stored_datetime(updated_at),
+    )
+
+
+def _task_json(row: tuple[Any, ...], *, pretty: bool = False) -> str:
+    """Encode a raw task row like ``json.dumps(task.model_dump(mode="json"))``.
+
+    Values, separators and escaping match; keys follow `models.TASK_JSON_KEYS`. With
+    `pretty`, the layout is ``json.dumps(..., indent=2)``'s.
+    """
+    content, priority, category, task_id, is_done, created_at, updated_at = row[:7]
+    fields = (
+        f'"priority": {priority}',
+        f'"content": {encode_basestring_ascii(content)}',
+        f'"category": {encode_basestring_ascii(category)}',
+        f'"created_at": {_datetime_json(created_at)}',
+        f'"id": {task_id}',
+        f'"is_done": {"true" if is_done else "false"}',
+        f'"updated_at": {_datetime_json(updated_at)}',
+    )
+    if pretty:
+        return "{\n  " + ",\n  ".join(fields) + "\n}"
+    return "{" + ", ".join(fields) + "}"
+
+
+def iter_task_rows(
+    db: Session,
+    is_done: bool | None = None,
+    category: str | None = None,
+    sort_by: str | None = None,
+    reverse: bool = False,
+    limit: int | None = None,
+    after: str | None = None,
+) -> Iterator[tuple[Any, ...]]:
+    """Stream the rows `list_tasks` would return, as plain tuples.
+
+    The read-only fast path for machine-readable output: the same filters and
+    ordering as `list_tasks`, without building a `Task` per row. Each tuple
+    holds the `TASK_COLUMNS` as SQLite stores them (``is_done`` as 0/1,
+    timestamps as text). `limit` and `after` page as in `list_tasks`.
+
+    Raises:
+        ValueError: If `sort_by` is set but is not one of `VALID_SORT_FIELDS`,
+            or `after` is not a cursor for this ordering.
+    """
+    statement = _select_tasks(
+        is_done=is_done,
+        category=category,
+        sort_by=sort_by,
+        reverse=reverse,
+        limit=limit,
+        after=after,
+    )
+    return _raw_rows(db, statement)
+
+
+def list_task_rows(
+    db: Session,
+    is_done: bool | None = None,
+    category: str | None = None,
+    sort_by: str | None = None,
+    reverse: bool = False,
+    limit: int | None = None,
+    after: str | None = None,
+) -> list[TaskRow]:
+    """Return the tasks `list_tasks` would, as `TaskRow`s.
+
+    For read-only callers: the rows come through the raw sqlite3 path and
+    are a fraction of a `Task`'s size and cost to build. Takes the same
+    arguments as `list_tasks`.
+
+    Raises:
+        ValueError: If `sort_by` is set but is not one of `VALID_SORT_FIELDS`,
+            or `after` is not a cursor for this ordering.
+    """
+    rows = iter_task_rows(
+        db,
+        is_done=is_done,
+        category=category,
+        sort_by=sort_by,
+        reverse=reverse,
+        limit=limit,
+        after=after,
+    )
+    return list(map(task_row, rows))
+
+
+def get_task_row(db: Session, task_id: int) -> TaskRow | None:
+    """Return the task with `task_id` as a `TaskRow`, or None if there is none."""
+    statement = select(Task).where(col(Task.id) == task_id)
+    raw = next(_raw_rows(db, statement), None)
+    return None if raw is None else task_row(raw)
+
+
+def iter_task_choices(
+    db: Session,
+    is_done: bool | None = None,
+    category: str | None = None,
+    limit: int | None = None,
+) -> Iterator[tuple[Any, ...]]:
+    """Stream the `LABEL_FIELDS` of the tasks `list_tasks` would return.
+
+    The raw form of ``list_tasks(fields=LABEL_FIELDS)`` for the large-list
+    picker, which indexes every task: plain tuples in `LABEL_FIELDS` order
+    (``is_done`` as 0/1), with the same filters and ordering.
     """
-    statement = select(Task).where(col(Task.content).icontains(phrase))
-    return list(db.exec(statement).all())
+    statement = _select_tasks(is_done=is_done, category=category, limit=limit)
+    return _raw_rows(db, statement.with_only_columns(*_task_columns(LABEL_FIELDS)))
+
+
+def iter_tasks_json(
+    db: Session,
+    is_done: bool | None = None,
+    category: str | None = None,
+    sort_by: str | None = None,
+    reverse: bool = False,
+    limit: int | None = None,
+    after: str | None = None,
+) -> Iterator[str]:
+    """Yield each task `list_tasks` would return as an encoded JSON object.
+
+    Each string decodes to exactly ``task.model_dump(mode="json")`` for the
+    same task and uses `json.dumps`'s separators and escaping, so JSON
+    consumers see no difference; keys come in `models.TASK_JSON_KEYS` order.
+
+    Raises:
+        ValueError: If `sort_by` is set but is not one of `VALID_SORT_FIELDS`,
+            or `after` is not a cursor for this ordering.
+    """
+    rows = iter_task_rows(
+        db,
+        is_done=is_done,
+        category=category,
+        sort_by=sort_by,
+        reverse=reverse,
+        limit=limit,
+        after=after,
+    )
+    return map(_task_json, rows)
+
+
+def task_rows_page(
+    db: Session,
+    is_done: bool | None = None,
+    category: str | None = None,
+    sort_by: str | None = None,
+    reverse: bool = False,
+    *,
+    limit: int | None,
+    after: str | None = None,
+) -> TaskPage[tuple[Any, ...]]:
+    """Return one page of `iter_task_rows` and the cursor for the next.
+
+    Takes the same arguments as `list_tasks_page`; the items are raw rows
+    read through the sqlite3 fast path.
+    """
+    rows = iter_task_rows(
+        db,
+        is_done=is_done,
+        category=category,
+        sort_by=sort_by,
+        reverse=reverse,
+        limit=None if limit is None else limit + 1,
+        after=after,
+    )
+    return _take_page(
+        rows, limit, lambda row: page_cursor(row, is_done, category, sort_by, reverse)
+    )
+
+
+def tasks_page_json(
+    db: Session,
+    is_done: bool | None = None,
+    category: str | None = None,
+    sort_by: str | None = None,
+    reverse: bool = False,
+    *,
+    limit: int | None,
+    after: str | None = None,
+) -> TaskPage[str]:
+    """Return one page of `iter_tasks_json` and the cursor for the next.
+
+    Takes the same arguments as `list_tasks_page`; the items are encoded JSON
+    objects read through the raw sqlite3 path.
+    """
+    page = task_rows_page(
+        db, is_done, category, sort_by, reverse, limit=limit, after=after
+    )
+    return TaskPage([_task_json(row) for row in page.items], page.next_cursor)
+
+
+def task_fields(row: tuple[Any, ...]) -> tuple[str, ...]:
+    """Return a raw task row's `TASK_COLUMNS` values as text, for TSV/CSV.
+
+    Values read as in the JSON output: ``true``/``false`` for `is_done` and
+    ISO 8601 UTC timestamps, with an empty field for a missing `updated_at`.
+    """
+    content, priority, category, task_id, is_done, created_at, updated_at = row[:7]
+    return (
+        content,
+        str(priority),
+        category,
+        str(task_id),
+        "true" if is_done else "false",
+        _datetime_json(created_at)[1:-1],
+        "" if updated_at is None else _datetime_json(updated_at)[1:-1],
+    )
+
+
+def iter_search_rows(
+    db: Session, phrase: str, limit: int | None = None
+) -> Iterator[tuple[Any, ...]]:
+    """Stream the tasks `search_hits` would return, as raw rows.
+
+    The first `TASK_COLUMNS` of each row are the task's, as in
+    `iter_task_rows`; for plain-text output that needs no score or spans.
+    """
+    statement, _ = _search_statement(db, phrase, limit)
+    return _raw_rows(db, statement)
+
+
+def iter_search_json(
+    db: Session, phrase: str, limit: int | None = None
+) -> Iterator[str]:
+    """Yield each `search_hits` result as an encoded JSON object.
+
+    Each decodes to the task's ``model_dump(mode="json")`` extended with
+    ``"score"`` and ``"matches"``, the shape ``odot search --json`` prints.
+    """
+    statement, ranked = _search_statement(db, phrase, limit)
+    for row in _raw_rows(db, statement):
+        content = row[0]
+        if ranked:
+            score = json.dumps(-row[7])
+            spans = _marked_spans(row[8], content, phrase)
+        else:
+            score = "null"
+            spans = _substring_spans(content, phrase)
+        matches = ", ".join(f"[{start}, {end}]" for start, end in spans)
+        yield f'{_task_json(row)[:-1]}, "score": {score}, "matches": [{matches}]}}'
 
 
 def update_task(db: Session, task_id: int, data: TaskUpdate) -> Task | None:
@@ -202,9 +1494,15 @@ def export_tasks(
     category: str | None = None,
     pretty: bool = False,
     output: TextIO | None = None,
+    ndjson: bool = False,
 ) -> int:
     """Export tasks to a JSON file, or to a stream when no path is given.
 
+    Rows are encoded and written as SQLite steps through them, so memory use
+    does not grow with the number of tasks. Keys come in `models.TASK_JSON_KEYS` order;
+    otherwise the output is byte-for-byte what `json.dump` of the dumped
+    tasks writes, compact or with ``indent=2``.
+
     Args:
         db: SQLModel Session instance.
         path: File path to save the JSON output. If None, JSON is written to
@@ -214,106 +1512,152 @@ def export_tasks(
         pretty: Whether to format the JSON string with indentation.
         output: Stream to write JSON to when `path` is None. Defaults to
             `sys.stdout`. Ignored if `path` is provided.
+        ndjson: Write one compact task object per line instead of an array.
 
     Returns:
         The total number of exported records.
+
+    Raises:
+        ValueError: If both `pretty` and `ndjson` are set.
     """
-    tasks = list_tasks(db=db, is_done=is_done, category=category)
-    export_data = [task.model_dump(mode="json") for task in tasks]
-    indent = 2 if pretty else None
+    if pretty and ndjson:
+        msg = "NDJSON output cannot be pretty-printed."
+        raise ValueError(msg)
+
+    rows = iter_task_rows(db, is_done=is_done, category=category)
+
+    def write(stream: TextIO) -> int:
+        if ndjson:
+            return write_json_lines(stream, map(_task_json, rows))
+        return write_json_array(
+            stream, (_task_json(row, pretty=pretty) for row in rows), pretty=pretty
+        )
 
     if path is None:
         stream = output or sys.stdout
-        json.dump(export_data, stream, indent=indent)
-        # Match the old print() behavior so shell prompts land on a new line.
-        stream.write("\n")
+        count = write(stream)
+        if not ndjson:
+            # Match the old print() behavior so shell prompts land on a new line.
+            stream.write("\n")
     else:
-        # File output deliberately has no trailing newline (unchanged behavior).
+        # JSON file output deliberately has no trailing newline (unchanged
+        # behavior); NDJSON ends every line, the last included.
         file_path = Path(path)
         with file_path.open("w", encoding="utf-8") as f:
-            json.dump(export_data, f, indent=indent)
+            count = write(f)
 
-    return len(tasks)
+    return count
 
 
-def import_tasks(db: Session, path: Path | str, clear: bool = False) -> int:
-    """Import tasks from a JSON file.
+def _import_rows(items: Iterable[dict[str, Any]]) -> Iterator[tuple[Any, ...]]:
+    """Validate import items into trusted `_insert_batches` rows.
+
+    Raises:
+        KeyError: If an item has no ``content``.
+        ValueError: If an item fails validation.
+    """
+    for item in items:
+        fields = {key: item[key] for key in _IMPORT_FIELDS if key in item}
+        task = TaskImport(content=item["content"], **fields)
+        yield (
+            task.content,
+            task.priority,
+            task.category,
+            int(task.is_done),
+            _stored_value(task.created_at or datetime.now(UTC)),
+            None if task.updated_at is None else _stored_value(task.updated_at),
+        )
+
+
+def import_tasks(
+    db: Session, path: Path | str, clear: bool = False, ndjson: bool = False
+) -> int:
+    """Import tasks from a JSON file in one transaction.
+
+    The file is streamed with `iter_json_array` (or `iter_json_lines` for
+    NDJSON), so memory use stays flat however large it is. Items are
+    validated and inserted in batches as multi-row INSERTs, each row written
+    once with its ``is_done`` and, when the file has them, its
+    ``created_at``/``updated_at``. The purge requested
+    by `clear` runs in the same transaction, so a failed import (including
+    malformed JSON past the first batch) rolls back completely and leaves the
+    database exactly as it was.
 
     Args:
         db: SQLModel Session instance.
         path: File path mapping to the JSON input.
         clear: Whether to purge existing tasks before importing.
+        ndjson: Read one task object per line instead of a JSON array.
 
     Returns:
         The total number of imported records.
     """
-    if clear:
-        delete_all_tasks(db=db)
-
     file_path = Path(path)
-    with file_path.open("r", encoding="utf-8") as f:
-        import_data = json.load(f)
-
-    count = 0
-    for item in import_data:
-        task_data = TaskCreate(
-            content=item["content"],
-            priority=item.get("priority", 1),
-            category=item.get("category", "general"),
-        )
-        task = add_task(db=db, task_data=task_data)
-
-        # Manually apply completion status if previously true
-        if item.get("is_done") and task.id is not None:
-            update_task(db=db, task_id=task.id, data=TaskUpdate(is_done=True))
+    try:
+        with file_path.open("r", encoding="utf-8") as f:
+            if clear:
+                db.exec(delete(Task))
+            items = iter_json_lines(f) if ndjson else iter_json_array(f)
+            rows = _import_rows(items)
+            count = sum(len(batch) for batch in _insert_batches(db, rows))
+    except BaseException:
+        db.rollback()
+        raise
+    db.commit()
+    return count
 
-        count += 1
 
-    return count
+def _category(task: Task | TaskRow | Row[Any]) -> str:
+    """Return a report entry's section: its category."""
+    return task.category
 
 
-def generate_markdown_report(tasks: list[Task]) -> str:
+def generate_markdown_report(tasks: Iterable[Task | TaskRow | Row[Any]]) -> str:
     """Generate a Markdown report of tasks.
 
     Args:
-        tasks: List of Task objects.
+        tasks: `Task` objects, `TaskRow`s, or rows with at least the
+            `LABEL_FIELDS`.
 
     Returns:
         A Markdown formatted string representing the tasks.
     """
-    lines = [
-        "# Odot Task Report",
-        # Report timestamps are naive local time by design for display.
-        f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*",  # noqa: DTZ005
-        "",
-    ]
+    return "\n".join(_markdown_lines(sorted(tasks, key=_category)))
 
-    if not tasks:
-        lines.append("No tasks found.")
-        return "\n".join(lines)
 
-    # Group by category (requires sorting by category first)
-    sorted_tasks = sorted(tasks, key=lambda t: t.category)
-    for category, category_tasks in groupby(sorted_tasks, key=lambda t: t.category):
-        lines.append(f"## {category}")
-        for task in category_tasks:
-            checkbox = "[x]" if task.is_done else "[ ]"
-            lines.append(f"- {checkbox} {task.content} (Priority: {task.priority})")
-        lines.append("")
+def write_markdown_report(
+    stream: TextIO, tasks: Iterable[Task | TaskRow | Row[Any]]
+) -> None:
+    """Write `generate_markdown_report`'s report to `stream` as tasks arrive.
 
-    return "\n".join(lines)
+    `tasks` must already come grouped by category, as
+    ``iter_tasks(..., by_category=True)`` yields them, so only one task is
+    held at a time.
+    """
+    _write_lines(stream, _markdown_lines(tasks))
 
 
-def generate_html_report(tasks: list[Task]) -> str:
-    """Generate an HTML report of tasks.
+def _markdown_lines(tasks: Iterable[Task | TaskRow | Row[Any]]) -> Iterator[str]:
+    """Yield the lines of a Markdown report of `tasks`, grouped by category."""
+    yield "# Odot Task Report"
+    # Report timestamps are naive local time by design for display.
+    yield f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*"  # noqa: DTZ005
+    yield ""
 
-    Args:
-        tasks: List of Task objects.
+    empty = True
+    for category, category_tasks in groupby(tasks, key=_category):
+        empty = False
+        yield f"## {category}"
+        for task in category_tasks:
+            checkbox = "[x]" if task.is_done else "[ ]"
+            yield f"- {checkbox} {task.content} (Priority: {task.priority})"
+        yield ""
+    if empty:
+        yield "No tasks found."
 
-    Returns:
-        An HTML formatted string representing the tasks.
-    """
-    css = """
+
+#: Stylesheet embedded in every HTML report.
+_REPORT_CSS = """
     body {
         font-family: system-ui, -apple-system, sans-serif;
         max-width: 800px; margin: 0 auto; padding: 20px;
@@ -342,14 +1686,41 @@ def generate_html_report(tasks: list[Task]) -> str:
     .meta { font-size: 0.9em; color: #666; font-style: italic; }
     """
 
-    html = [
+
+def generate_html_report(tasks: Iterable[Task | TaskRow | Row[Any]]) -> str:
+    """Generate an HTML report of tasks.
+
+    Args:
+        tasks: `Task` objects, `TaskRow`s, or rows with at least the
+            `LABEL_FIELDS`.
+
+    Returns:
+        An HTML formatted string representing the tasks.
+    """
+    return "\n".join(_html_lines(sorted(tasks, key=_category)))
+
+
+def write_html_report(
+    stream: TextIO, tasks: Iterable[Task | TaskRow | Row[Any]]
+) -> None:
+    """Write `generate_html_report`'s report to `stream` as tasks arrive.
+
+    `tasks` must already come grouped by category, as for
+    `write_markdown_report`.
+    """
+    _write_lines(stream, _html_lines(tasks))
+
+
+def _html_lines(tasks: Iterable[Task | TaskRow | Row[Any]]) -> Iterator[str]:
+    """Yield the lines of an HTML report of `tasks`, grouped by category."""
+    yield from [
         "<!DOCTYPE html>",
         "<html lang='en'>",
         "<head>",
         "    <meta charset='UTF-8'>",
         "    <meta name='viewport' content='width=device-width, initial-scale=1.0'>",
         "    <title>Odot Task Report</title>",
-        f"    <style>{css}</style>",
+        f"    <style>{_REPORT_CSS}</style>",
         "</head>",
         "<body>",
         "    <h1>Odot Task Report</h1>",
@@ -357,27 +1728,33 @@ def generate_html_report(tasks: list[Task]) -> str:
         f"    <p class='meta'>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>",  # noqa: DTZ005, E501
     ]
 
-    if not tasks:
-        html.append("    <p>No tasks found.</p>")
-    else:
-        sorted_tasks = sorted(tasks, key=lambda t: t.category)
-        for category, category_tasks in groupby(sorted_tasks, key=lambda t: t.category):
-            html.append(f"    <h2>{escape(category)}</h2>")
-            html.append("    <ul class='task-list'>")
-            for task in category_tasks:
-                status_class = "done" if task.is_done else "pending"
-                checkbox = "✓" if task.is_done else "○"
-                html.append(f"        <li class='task-item {status_class}'>")
-                html.append(f"            <span class='checkbox'>{checkbox}</span>")
-                html.append(
-                    f"            <span class='content'>{escape(task.content)}</span>"
-                )
-                html.append(
-                    f"            <span class='priority'>Priority: {task.priority}</span>"  # noqa: E501
-                )
-                html.append("        </li>")
-            html.append("    </ul>")
+    empty = True
+    for category, category_tasks in groupby(tasks, key=_category):
+        empty = False
+        yield f"    <h2>{escape(category)}</h2>"
+        yield "    <ul class='task-list'>"
+        for task in category_tasks:
+            status_class = "done" if task.is_done else "pending"
+            checkbox = "✓" if task.is_done else "○"
+            yield f"        <li class='task-item {status_class}'>"
+            yield f"            <span class='checkbox'>{checkbox}</span>"
+            yield f"            <span class='content'>{escape(task.content)}</span>"
+            yield f"            <span class='priority'>Priority: {task.priority}</span>"
+            yield "        </li>"
+        yield "    </ul>"
+    if empty:
+        yield "    <p>No tasks found.</p>"
+
+    yield "</body>"
+    yield "</html>"
 
-    html.extend(["</body>", "</html>"])
 
-    return "\n".join(html)
+def _write_lines(stream: TextIO, lines: Iterable[str]) -> None:
+    """Write `lines` to `stream` one after another, newline-separated.
+
+    The output matches joining them with newlines, with no trailing newline.
+    """
+    separator = ""
+    for line in lines:
+        stream.write(separator + line)
+        separator = "\n"
@@ -1,13 +1,51 @@
 """Database connection and session management."""
 
+from __future__ import annotations
+
 import os
+import sqlite3
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+# SQLAlchemy/SQLModel are imported where an engine or session is first built,
+# so path helpers (used by the daemon client) stay cheap to import.
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-from sqlalchemy.engine import Engine
-from sqlmodel import SQLModel, create_engine
+    from sqlalchemy.engine import Connection, Engine
+    from sqlmodel import Session
 
 _engine: Engine | None = None
 
+#: Connect-time PRAGMA profiles, selected with the ``ODOT_DB_PROFILE``
+#: environment variable. Every profile runs in WAL mode so readers never block
+#: behind a writer; they differ in how often SQLite fsyncs. "safe" keeps full
+#: durability, "fast" may lose the last commits on power loss (but never
+#: corrupts), and "bulk" skips fsync entirely for large scripted loads.
+DB_PROFILES: dict[str, dict[str, str | int]] = {
+    "safe": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "busy_timeout": 5000,
+        "wal_autocheckpoint": 1000,
+    },
+    "fast": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,
+        "wal_autocheckpoint": 1000,
+    },
+    "bulk": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "busy_timeout": 30000,
+        "wal_autocheckpoint": 10000,
+    },
+}
+
+#: Profile used when ``ODOT_DB_PROFILE`` is unset.
+DEFAULT_DB_PROFILE = "safe"
+
 
 def get_db_path() -> Path:
     """Return the path to the SQLite database file.
@@ -21,24 +59,85 @@ def get_db_path() -> Path:
     return Path.home() / ".odot" / "db.sqlite"
 
 
+def get_db_profile() -> str:
+    """Return the name of the PRAGMA profile to apply to new connections.
+
+    Returns:
+        A key of `DB_PROFILES`, taken from ``ODOT_DB_PROFILE`` (case-insensitive)
+        or `DEFAULT_DB_PROFILE` when the variable is unset or empty.
+
+    Raises:
+        ValueError: If ``ODOT_DB_PROFILE`` names an unknown profile.
+    """
+    profile = os.environ.get("ODOT_DB_PROFILE", "").strip().lower()
+    if not profile:
+        return DEFAULT_DB_PROFILE
+    if profile not in DB_PROFILES:
+        msg = (
+            f"Invalid ODOT_DB_PROFILE: {profile!r}. "
+            f"Must be one of {tuple(DB_PROFILES)}."
+        )
+        raise ValueError(msg)
+    return profile
+
+
+def _install_pragmas(engine: Engine, profile: str) -> None:
+    """Run the profile's PRAGMAs on every new DBAPI connection of `engine`.
+
+    PRAGMAs are per-connection state (except ``journal_mode=WAL``, which
+    persists in the file), so they must be re-issued from a ``connect`` hook
+    rather than once at engine creation.
+    """
+    from sqlalchemy import event
+
+    pragmas = DB_PROFILES[profile]
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
 def get_engine() -> Engine:
     """Return the singleton database engine, creating it on first call.
 
+    New connections are configured with the PRAGMA profile returned by
+    `get_db_profile`.
+
     Returns:
         The SQLAlchemy engine instance.
     """
     global _engine  # noqa: PLW0603  # module-level singleton engine, swapped in tests
     if _engine is None:
+        from sqlmodel import create_engine
+
         db_file = get_db_path()
         if not db_file.parent.exists():
             db_file.parent.mkdir(parents=True, exist_ok=True)
 
         sqlite_url = f"sqlite:///{db_file}"
-        _engine = create_engine(sqlite_url, echo=False)
+        engine = create_engine(sqlite_url, echo=False)
+        _install_pragmas(engine, get_db_profile())
+        _engine = engine
 
     return _engine
 
 
+def get_session() -> Session:
+    """Open a new ORM session on the singleton engine.
+
+    Returns:
+        A `Session` the caller is responsible for closing.
+    """
+    from sqlmodel import Session
+
+    return Session(get_engine())
+
+
 def set_engine(engine: Engine | None) -> None:
     """Override the module-level singleton engine.
 
@@ -60,14 +159,580 @@ def reset_engine() -> None:
     set_engine(None)
 
 
+#: FTS5 tokenizers `rebuild_search_index` accepts. "unicode61" matches whole
+#: words (the last one as a prefix); "trigram" matches arbitrary substrings,
+#: like the plain ``LIKE`` search it replaced, at the cost of a larger index.
+SEARCH_TOKENIZERS = ("unicode61", "trigram")
+
+#: The tokenizer a new search index gets. "trigram" keeps `odot search`
+#: matching substrings as it always has; SQLite gained it in 3.34, and older
+#: libraries get "unicode61".
+DEFAULT_SEARCH_TOKENIZER = (
+    "trigram" if sqlite3.sqlite_version_info >= (3, 34) else "unicode61"
+)
+
+
+def _search_table_sql(tokenizer: str) -> str:
+    """Return the CREATE statement for the ``task_fts`` search index.
+
+    ``task_fts`` is an external-content FTS5 table over ``task.content``: it
+    stores only the index, and its rowid mirrors ``task.id``. unicode61 keeps
+    diacritics, so "café" does not find "cafe", as a substring search would not.
+    """
+    if tokenizer == "unicode61":
+        tokenizer += " remove_diacritics 0"
+    return (
+        "CREATE VIRTUAL TABLE IF NOT EXISTS task_fts USING fts5("
+        f"content, content='task', content_rowid='id', tokenize='{tokenizer}')"
+    )
+
+
+#: Triggers that keep ``task_fts`` in sync with ``task``. Only a content
+#: change touches the index, so done/undo stay cheap.
+_SEARCH_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS task_fts_insert AFTER INSERT ON task BEGIN
+        INSERT INTO task_fts(rowid, content) VALUES (new.id, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_fts_delete AFTER DELETE ON task BEGIN
+        INSERT INTO task_fts(task_fts, rowid, content)
+            VALUES ('delete', old.id, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_fts_update
+    AFTER UPDATE OF content ON task BEGIN
+        INSERT INTO task_fts(task_fts, rowid, content)
+            VALUES ('delete', old.id, old.content);
+        INSERT INTO task_fts(rowid, content) VALUES (new.id, new.content);
+    END
+    """,
+)
+
+
+#: Ordered schema migrations. Step N (1-based) upgrades a database whose
+#: ``PRAGMA user_version`` is N-1 to version N. Each step is a tuple of SQL
+#: statements run in one transaction together with the version bump. Steps are
+#: frozen once released: never edit one, append a new step instead, and keep
+#: the DDL idempotent (``IF NOT EXISTS``) so it is safe on databases that were
+#: created by ``SQLModel.metadata.create_all`` before versioning existed.
+MIGRATIONS: tuple[tuple[str, ...], ...] = (
+    # 1: baseline schema, identical to what create_all emitted up to 0.5.0.
+    (
+        """
+        CREATE TABLE IF NOT EXISTS task (
+            content VARCHAR(255) NOT NULL,
+            priority INTEGER NOT NULL,
+            category VARCHAR(255) NOT NULL,
+            id INTEGER NOT NULL,
+            is_done BOOLEAN NOT NULL,
+            created_at DATETIME NOT NULL,
+            updated_at DATETIME,
+            PRIMARY KEY (id)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS ix_task_category ON task (category)",
+        "CREATE INDEX IF NOT EXISTS ix_task_content ON task (content)",
+    ),
+    # 2: indexes for list_tasks filter+sort combinations.
+    (
+        "CREATE INDEX IF NOT EXISTS ix_task_priority ON task (priority)",
+        "CREATE INDEX IF NOT EXISTS ix_task_created_at ON task (created_at)",
+        "CREATE INDEX IF NOT EXISTS ix_task_is_done ON task (is_done)",
+        """
+        CREATE INDEX IF NOT EXISTS ix_task_is_done_priority
+            ON task (is_done, priority)
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS ix_task_is_done_created_at
+            ON task (is_done, created_at)
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS ix_task_is_done_category
+            ON task (is_done, category)
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS ix_task_category_priority
+            ON task (category, priority)
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS ix_task_category_created_at
+            ON task (category, created_at)
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS ix_task_category_is_done
+            ON task (category, is_done)
+        """,
+    ),
+    # 3: full-text search index, kept in sync with task by triggers.
+    (
+        _search_table_sql(DEFAULT_SEARCH_TOKENIZER),
+        *_SEARCH_TRIGGERS,
+        "INSERT INTO task_fts(task_fts) VALUES ('rebuild')",
+    ),
+)
+
+#: The schema version a fully migrated database reports in ``user_version``.
+SCHEMA_VERSION = len(MIGRATIONS)
+
+#: Steps that build the search index. A SQLite library without FTS5 skips
+#: them (the version still moves on) and searches by substring scan instead;
+#: `rebuild_search_index` adds the index once the library has FTS5.
+_SEARCH_STEPS = frozenset({3})
+
+
+def _has_fts5(conn: Connection) -> bool:
+    """Return whether the SQLite library behind `conn` has FTS5 built in."""
+    return bool(
+        conn.exec_driver_sql(
+            "SELECT sqlite_compileoption_used('ENABLE_FTS5')"
+        ).scalar_one()
+    )
+
+
+def get_schema_version(engine: Engine | None = None) -> int:
+    """Return the schema version recorded in the database header.
+
+    This is a single ``PRAGMA user_version`` read, cheap enough to run on
+    every CLI invocation.
+
+    Args:
+        engine: Engine to inspect; defaults to `get_engine()`.
+
+    Returns:
+        The stored version; 0 for a new or pre-versioning database.
+    """
+    with (engine or get_engine()).connect() as conn:
+        return conn.exec_driver_sql("PRAGMA user_version").scalar_one()
+
+
+def migrate(engine: Engine | None = None) -> int:
+    """Apply every pending step of `MIGRATIONS`, oldest first.
+
+    A current database costs one ``PRAGMA user_version`` read. Otherwise each
+    step runs in its own ``BEGIN IMMEDIATE`` transaction that re-reads the
+    version under the write lock, so concurrent invocations never apply the
+    same step twice, and a failing step leaves the database at the previous
+    version rather than half-migrated.
+
+    Args:
+        engine: Engine to migrate; defaults to `get_engine()`.
+
+    Returns:
+        The number of migration steps applied (0 if already current).
+    """
+    engine = engine or get_engine()
+    if get_schema_version(engine) >= SCHEMA_VERSION:
+        return 0
+
+    applied = 0
+    while True:
+        with engine.begin() as conn:
+            # pysqlite only opens transactions implicitly before DML, so DDL
+            # would otherwise autocommit statement by statement.
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+            version = conn.exec_driver_sql("PRAGMA user_version").scalar_one()
+            if version >= SCHEMA_VERSION:
+                return applied
+            statements = MIGRATIONS[version]
+            if version + 1 in _SEARCH_STEPS and not _has_fts5(conn):
+                statements = ()
+            for statement in statements:
+                conn.exec_driver_sql(statement)
+            conn.exec_driver_sql(f"PRAGMA user_version = {version + 1}")
+        applied += 1
+
+
+def get_search_tokenizer(conn: Connection) -> str | None:
+    """Return the tokenizer of the full-text search index, if there is one.
+
+    Args:
+        conn: An open connection to the database to inspect.
+
+    Returns:
+        One of `SEARCH_TOKENIZERS`, or None when the database has no search
+        index (it predates migration 3, or SQLite lacks FTS5).
+    """
+    sql = conn.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE name = 'task_fts'"
+    ).scalar()
+    if sql is None:
+        return None
+    return "trigram" if "'trigram'" in sql else "unicode61"
+
+
+def rebuild_search_index(
+    tokenizer: str | None = None, engine: Engine | None = None
+) -> str:
+    """Recreate the full-text search index from the task table.
+
+    Repairs an index that drifted out of sync (e.g. rows written with the
+    triggers disabled), switches tokenizers, and adds the index a database
+    migrated without FTS5 went without. The triggers refer to the index by
+    name, so they keep working across the drop and re-create.
+
+    Args:
+        tokenizer: One of `SEARCH_TOKENIZERS`; defaults to the tokenizer the
+            index already uses, or `DEFAULT_SEARCH_TOKENIZER` if there is no
+            index yet.
+        engine: Engine to rebuild; defaults to `get_engine()`.
+
+    Returns:
+        The tokenizer the rebuilt index uses.
+
+    Raises:
+        ValueError: If `tokenizer` is not one of `SEARCH_TOKENIZERS`, or the
+            SQLite library has no FTS5.
+    """
+    if tokenizer is not None and tokenizer not in SEARCH_TOKENIZERS:
+        msg = f"Invalid tokenizer: {tokenizer!r}. Must be one of {SEARCH_TOKENIZERS}."
+        raise ValueError(msg)
+
+    with (engine or get_engine()).begin() as conn:
+        if not _has_fts5(conn):
+            msg = "This SQLite library has no FTS5; search scans task contents."
+            raise ValueError(msg)
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+        tokenizer = tokenizer or get_search_tokenizer(conn) or DEFAULT_SEARCH_TOKENIZER
+        conn.exec_driver_sql("DROP TABLE IF EXISTS task_fts")
+        conn.exec_driver_sql(_search_table_sql(tokenizer))
+        for statement in _SEARCH_TRIGGERS:
+            conn.exec_driver_sql(statement)
+        conn.exec_driver_sql("INSERT INTO task_fts(task_fts) VALUES ('rebuild')")
+    return tokenizer
+
+
+#: Optional summary counters: one ``task_counters`` row per (category,
+#: is_done) pair holding how many tasks have it, kept exact by triggers so
+#: `odot count` reads a handful of rows instead of walking an index. Unlike
+#: the search index they are not part of `MIGRATIONS`: every task write pays
+#: for the triggers, which only pays off for callers that count far more often
+#: than they write (status bars polling every few seconds). Pairs whose count
+#: drops to zero are deleted, so the table always equals
+#: ``SELECT category, is_done, count(*) FROM task GROUP BY 1, 2``.
+COUNTERS_SQL: tuple[str, ...] = (
+    """
+    CREATE TABLE IF NOT EXISTS task_counters (
+        category VARCHAR(255) NOT NULL,
+        is_done BOOLEAN NOT NULL,
+        n INTEGER NOT NULL,
+        PRIMARY KEY (category, is_done)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_counters_insert AFTER INSERT ON task BEGIN
+        INSERT INTO task_counters (category, is_done, n)
+            VALUES (new.category, new.is_done, 1)
+            ON CONFLICT (category, is_done) DO UPDATE SET n = n + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_counters_delete AFTER DELETE ON task BEGIN
+        UPDATE task_counters SET n = n - 1
+            WHERE category = old.category AND is_done = old.is_done;
+        DELETE FROM task_counters
+            WHERE category = old.category AND is_done = old.is_done AND n <= 0;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_counters_update
+    AFTER UPDATE OF category, is_done ON task
+    WHEN old.category IS NOT new.category OR old.is_done IS NOT new.is_done BEGIN
+        UPDATE task_counters SET n = n - 1
+            WHERE category = old.category AND is_done = old.is_done;
+        DELETE FROM task_counters
+            WHERE category = old.category AND is_done = old.is_done AND n <= 0;
+        INSERT INTO task_counters (category, is_done, n)
+            VALUES (new.category, new.is_done, 1)
+            ON CONFLICT (category, is_done) DO UPDATE SET n = n + 1;
+    END
+    """,
+)
+
+#: Everything `COUNTERS_SQL` creates, in the order `drop_counters` removes it.
+_COUNTERS_OBJECTS = (
+    ("TRIGGER", "task_counters_insert"),
+    ("TRIGGER", "task_counters_delete"),
+    ("TRIGGER", "task_counters_update"),
+    ("TABLE", "task_counters"),
+)
+
+#: Counts recomputed from the task table, for `rebuild_counters` and
+#: `check_counters`.
+_ACTUAL_COUNTS_SQL = (
+    "SELECT category, is_done, count(*) FROM task GROUP BY category, is_done"
+)
+
+
+def counters_enabled(conn: Connection) -> bool:
+    """Return whether the database has the optional ``task_counters`` table.
+
+    Args:
+        conn: An open connection to the database to inspect.
+    """
+    return (
+        conn.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' "
+            "AND name = 'task_counters'"
+        ).first()
+        is not None
+    )
+
+
+def rebuild_counters(engine: Engine | None = None) -> None:
+    """Create the summary counters if needed and recompute them from scratch.
+
+    This both enables the counters and repairs ones that drifted (e.g. rows
+    written while the triggers were dropped, or replaced with ``INSERT OR
+    REPLACE``, which skips delete triggers). It runs under the write lock, so
+    no task write can slip in between the recount and the triggers.
+
+    Args:
+        engine: Engine to update; defaults to `get_engine()`.
+    """
+    with (engine or get_engine()).begin() as conn:
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+        for statement in COUNTERS_SQL:
+            conn.exec_driver_sql(statement)
+        conn.exec_driver_sql("DELETE FROM task_counters")
+        conn.exec_driver_sql(
+            f"INSERT INTO task_counters (category, is_done, n) {_ACTUAL_COUNTS_SQL}"
+        )
+
+
+def drop_counters(engine: Engine | None = None) -> bool:
+    """Remove the summary counters table and its triggers.
+
+    Args:
+        engine: Engine to update; defaults to `get_engine()`.
+
+    Returns:
+        Whether the counters were enabled before the call.
+    """
+    with (engine or get_engine()).begin() as conn:
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+        enabled = counters_enabled(conn)
+        for kind, name in _COUNTERS_OBJECTS:
+            conn.exec_driver_sql(f"DROP {kind} IF EXISTS {name}")
+    return enabled
+
+
+def check_counters(
+    engine: Engine | None = None,
+) -> dict[tuple[str, bool], tuple[int, int]]:
+    """Compare the summary counters against a fresh count of the task table.
+
+    Both sides are read in one transaction, so concurrent writers cannot make
+    a consistent table look drifted.
+
+    Args:
+        engine: Engine to inspect; defaults to `get_engine()`.
+
+    Returns:
+        The ``(stored, actual)`` counts of every (category, is_done) pair
+        that disagrees; empty when the counters are exact.
+
+    Raises:
+        ValueError: If the counters are not enabled.
+    """
+    with (engine or get_engine()).begin() as conn:
+        conn.exec_driver_sql("BEGIN")
+        if not counters_enabled(conn):
+            msg = "Summary counters are not enabled."
+            raise ValueError(msg)
+        stored = {
+            (category, bool(is_done)): n
+            for category, is_done, n in conn.exec_driver_sql(
+                "SELECT category, is_done, n FROM task_counters"
+            )
+        }
+        actual = {
+            (category, bool(is_done)): n
+            for category, is_done, n in conn.exec_driver_sql(_ACTUAL_COUNTS_SQL)
+        }
+    return {
+        key: (stored.get(key, 0), actual.get(key, 0))
+        for key in sorted(stored.keys() | actual.keys())
+        if stored.get(key, 0) != actual.get(key, 0)
+    }
+
+
+#: Pages `backup` and `restore` copy per step. SQLite holds the source's read
+#: lock only for the duration of a step, so other connections' writes
+#: interleave with a long copy instead of waiting for all of it.
+BACKUP_PAGES = 1024
+
+
+def _database_file(conn: Connection) -> str:
+    """Return the file behind `conn`'s main database ("" when in memory)."""
+    return conn.exec_driver_sql(
+        "SELECT file FROM pragma_database_list WHERE name = 'main'"
+    ).scalar_one()
+
+
+def _copy_pages(
+    source: sqlite3.Connection,
+    target: sqlite3.Connection,
+    pages: int,
+    progress: Callable[[int, int], None] | None,
+) -> int:
+    """Copy `source` over `target` with the backup API; return the page count."""
+    total = 0
+
+    def report(_status: int, remaining: int, count: int) -> None:
+        nonlocal total
+        total = count
+        if progress is not None:
+            progress(count - remaining, count)
+
+    source.backup(target, pages=pages, progress=report)
+    return total
+
+
+def backup(
+    path: Path | str,
+    *,
+    pages: int = BACKUP_PAGES,
+    progress: Callable[[int, int], None] | None = None,
+    engine: Engine | None = None,
+) -> int:
+    """Write a consistent snapshot of the database to `path`.
+
+    Uses SQLite's online backup API, which copies pages at disk speed instead
+    of decoding rows, `pages` at a time so concurrent writers are never
+    blocked for long. If the database is written to by another connection
+    mid-copy, SQLite restarts the copy so the snapshot is always consistent.
+    The copy goes to a temporary file next to `path` that replaces it only
+    once complete, so a failed backup never leaves a truncated file behind.
+
+    Args:
+        path: File to write; an existing file is replaced.
+        pages: Pages to copy per step.
+        progress: Called after every step with the pages copied so far and
+            the total.
+        engine: Engine to back up; defaults to `get_engine()`.
+
+    Returns:
+        The number of pages in the snapshot.
+
+    Raises:
+        ValueError: If `path` is the database file itself.
+    """
+    import sqlite3
+
+    target = Path(path)
+    partial = target.with_name(f".{target.name}.partial")
+    with (engine or get_engine()).connect() as conn:
+        live = _database_file(conn)
+        if live and target.resolve() == Path(live).resolve():
+            msg = f"Cannot back up the database onto itself: {target}"
+            raise ValueError(msg)
+        dest = sqlite3.connect(partial)
+        try:
+            total = _copy_pages(
+                conn.connection.driver_connection, dest, pages, progress
+            )
+            # The copy inherits WAL mode; a rollback-journal file is
+            # self-contained, so it can be opened read-only anywhere.
+            dest.execute("PRAGMA journal_mode=DELETE")
+        except BaseException:
+            dest.close()
+            partial.unlink(missing_ok=True)
+            raise
+        dest.close()
+    partial.replace(target)
+    return total
+
+
+def _check_snapshot(source: sqlite3.Connection) -> None:
+    """Reject a restore source that is not an intact odot database.
+
+    Raises:
+        ValueError: If the file is not SQLite, is corrupt, has no task table,
+            or has a schema newer than `SCHEMA_VERSION`.
+    """
+    import sqlite3
+
+    try:
+        check = source.execute("PRAGMA quick_check").fetchone()[0]
+        has_tasks = source.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'task'"
+        ).fetchone()
+        version = source.execute("PRAGMA user_version").fetchone()[0]
+    except sqlite3.DatabaseError as e:
+        msg = f"Not an odot database: {e}"
+        raise ValueError(msg) from e
+    if check != "ok":
+        msg = f"Backup failed its integrity check: {check}"
+        raise ValueError(msg)
+    if has_tasks is None:
+        msg = "Not an odot database: it has no task table."
+        raise ValueError(msg)
+    if version > SCHEMA_VERSION:
+        msg = (
+            f"Backup has schema version {version}, newer than this odot "
+            f"supports ({SCHEMA_VERSION})."
+        )
+        raise ValueError(msg)
+
+
+def restore(
+    path: Path | str,
+    *,
+    pages: int = BACKUP_PAGES,
+    progress: Callable[[int, int], None] | None = None,
+    engine: Engine | None = None,
+) -> int:
+    """Replace the database's contents with the snapshot at `path`.
+
+    The snapshot is opened read-only and checked with `_check_snapshot`
+    before anything is overwritten. It is then copied over the live database
+    with the backup API, which holds the write lock until the copy completes,
+    so other connections see either the old contents or the new, never a mix.
+    Snapshots from older odot versions are brought up to date by `migrate`.
+
+    Args:
+        path: Snapshot written by `backup` (or any odot database file).
+        pages: Pages to copy per step.
+        progress: Called after every step with the pages copied so far and
+            the total.
+        engine: Engine to restore into; defaults to `get_engine()`.
+
+    Returns:
+        The number of pages restored.
+
+    Raises:
+        FileNotFoundError: If `path` does not exist.
+        ValueError: If `path` is not a usable odot database, or is the
+            database file itself.
+    """
+    import sqlite3
+
+    engine = engine or get_engine()
+    source_path = Path(path).resolve(strict=True)
+    source = sqlite3.connect(f"{source_path.as_uri()}?mode=ro", uri=True)
+    try:
+        _check_snapshot(source)
+        with engine.connect() as conn:
+            live = _database_file(conn)
+            if live and source_path == Path(live).resolve():
+                msg = f"Cannot restore the database from itself: {path}"
+                raise ValueError(msg)
+            total = _copy_pages(
+                source, conn.connection.driver_connection, pages, progress
+            )
+    finally:
+        source.close()
+    migrate(engine)
+    return total
+
+
 def create_db_and_tables() -> None:
     """Create the database tables.
 
-    This function discovers the SQLModel subclasses and emits CREATE TABLE
-    queries against the engine.
+    Brings the database to `SCHEMA_VERSION` by running `migrate`, which on a
+    new file creates every table and index from scratch.
     """
-    # Import models here to prevent circular imports during module initialization.
-    # Importing Task registers it on SQLModel.metadata so create_all emits its table.
-    from odot.models import Task  # noqa: F401, PLC0415
-
-    SQLModel.metadata.create_all(get_engine())
+    migrate()
@@ -1,8 +1,10 @@
 """Models for odot."""
 
 from datetime import UTC, datetime
+from typing import Any, Literal, NamedTuple
 
-from pydantic import field_validator
+from pydantic import TypeAdapter, field_validator
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 
@@ -27,7 +29,6 @@ class TaskBase(SQLModel):
     priority: int = Field(default=1, ge=1, le=3, description="Priority from 1 to 3")
     category: str = Field(
         default="general",
-        index=True,
         min_length=1,
         max_length=255,
         description="Free-text category label; lowercased and trimmed on write.",
@@ -50,6 +51,27 @@ class TaskCreate(TaskBase):
         return _normalize_category(value)
 
 
+class TaskImport(TaskCreate):
+    """Schema for one item of an `odot import` file.
+
+    Extends ``TaskCreate`` with the state an export carries, so a round trip
+    keeps completion status and timestamps. Timestamps without an offset are
+    taken as UTC, which is how the database stores them.
+    """
+
+    is_done: bool = False
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
+    @field_validator("created_at", "updated_at")
+    @classmethod
+    def _assume_utc(cls, value: datetime | None) -> datetime | None:
+        """Attach UTC to naive timestamps."""
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=UTC)
+        return value
+
+
 class TaskUpdate(SQLModel):
     """Model for updating a task. All fields are optional."""
 
@@ -71,11 +93,80 @@ class Task(TaskBase, table=True):
     """The core Task model.
 
     This defines the 'tasks' table in SQLite.
+
+    The indexes mirror the filter/sort combinations `core.list_tasks` issues:
+    one per sort column, alone and behind each equality filter. SQLite ends
+    every index with the rowid, which breaks ties, so each listing is served
+    in index order instead of through a temporary sort.
     """
 
+    __table_args__ = (
+        Index("ix_task_category", "category"),
+        Index("ix_task_priority", "priority"),
+        Index("ix_task_created_at", "created_at"),
+        Index("ix_task_is_done", "is_done"),
+        Index("ix_task_is_done_priority", "is_done", "priority"),
+        Index("ix_task_is_done_created_at", "is_done", "created_at"),
+        Index("ix_task_is_done_category", "is_done", "category"),
+        Index("ix_task_category_priority", "category", "priority"),
+        Index("ix_task_category_created_at", "category", "created_at"),
+        Index("ix_task_category_is_done", "category", "is_done"),
+    )
+
     id: int | None = Field(default=None, primary_key=True)
     is_done: bool = Field(default=False)
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(UTC), nullable=False
     )
     updated_at: datetime | None = Field(default=None)
+
+
+#: Serializes `TaskRow` timestamps exactly as ``Task.model_dump`` does.
+_DATETIME = TypeAdapter(datetime)
+
+#: Key order of a task object in JSON output (``--json``, ``odot export``),
+#: as 0.5.0 emitted it. Scripts may compare the text, so it is kept fixed
+#: rather than following field order.
+TASK_JSON_KEYS = (
+    "priority",
+    "content",
+    "category",
+    "created_at",
+    "id",
+    "is_done",
+    "updated_at",
+)
+
+
+class TaskRow(NamedTuple):
+    """A read-only task: the fields of `Task`, without the model machinery.
+
+    A `Task` carries pydantic and SQLAlchemy state that a command which only
+    prints tasks never uses; a `TaskRow` is a plain tuple of the same values,
+    in the same order (`core.TASK_COLUMNS`), with the same types. Read paths
+    such as `core.list_task_rows` return it, and the renderers accept either.
+    """
+
+    content: str
+    priority: int
+    category: str
+    id: int
+    is_done: bool
+    created_at: datetime
+    updated_at: datetime | None
+
+    def model_dump(
+        self, *, mode: Literal["python", "json"] = "python"
+    ) -> dict[str, Any]:
+        """Return the fields as a dict, as ``Task.model_dump`` does.
+
+        Args:
+            mode: ``"json"`` renders the timestamps as ISO 8601 strings, like
+                pydantic's JSON mode.
+        """
+        values = self._asdict()
+        if mode == "json":
+            for name in ("created_at", "updated_at"):
+                if values[name] is not None:
+                    values[name] = _DATETIME.dump_python(values[name], mode="json")
+        return values
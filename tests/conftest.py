@@ -32,11 +32,18 @@ def setup_test_engine(engine):
 
 @pytest.fixture(name="session")
 def session_fixture(engine):
-    """Provides a fresh database session for tests."""
-    SQLModel.metadata.create_all(engine)
+    """Provides a fresh, fully migrated database session for tests."""
+    database.migrate(engine)
     with Session(engine) as session:
         yield session
     SQLModel.metadata.drop_all(engine)
+    # The shared in-memory engine outlives each test, so drop the objects
+    # metadata doesn't know about and rewind the schema version too;
+    # otherwise the next test's migrate() would be a no-op.
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP TABLE IF EXISTS task_fts")
+        conn.exec_driver_sql("DROP TABLE IF EXISTS task_counters")
+        conn.exec_driver_sql("PRAGMA user_version = 0")
 
 
 @pytest.fixture(name="client_session")
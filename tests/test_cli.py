@@ -1,6 +1,7 @@
 """Integration tests for CLI."""
 
 import json
+import re
 
 import pytest
 from typer.testing import CliRunner
@@ -17,7 +18,7 @@ def override_db_dependency(monkeypatch, session, tmp_path):
     def mock_session(*args, **kwargs):
         return session
 
-    monkeypatch.setattr("odot.cli.Session", mock_session)
+    monkeypatch.setattr("odot.database.get_session", mock_session)
 
     # Provide a pre-existing db path so auto-init doesn't trigger in unrelated tests
     fake_db = tmp_path / "db.sqlite"
@@ -32,6 +33,122 @@ def test_init_db():
     assert "Database initialized successfully" in result.stdout
 
 
+def _rewind_schema_version(session):
+    """Mark the test database as unversioned so migrations are pending again."""
+    session.connection().exec_driver_sql("PRAGMA user_version = 0")
+    session.commit()
+
+
+def test_migrate_command_up_to_date():
+    """`migrate` on a current database reports the version and changes nothing."""
+    result = runner.invoke(app, ["migrate"])
+    assert result.exit_code == 0
+    assert "up to date" in result.stdout
+
+
+def test_migrate_command_applies_pending_steps(session):
+    """`migrate` reports what it applied instead of the startup auto-upgrade."""
+    _rewind_schema_version(session)
+
+    result = runner.invoke(app, ["migrate"])
+    assert result.exit_code == 0
+    assert "Applied" in result.stdout
+    assert "upgraded" not in result.stdout
+
+
+def test_migrate_command_single_step_wording(session, monkeypatch):
+    """One applied step uses the singular noun."""
+    monkeypatch.setattr("odot.database.migrate", lambda: 1)
+
+    result = runner.invoke(app, ["migrate"])
+    assert result.exit_code == 0
+    assert "Applied 1 migration;" in result.stdout
+
+
+def test_json_migrate_reports_applied_and_version(session):
+    """`migrate --json` emits the applied count and resulting version."""
+    from odot.database import SCHEMA_VERSION
+
+    _rewind_schema_version(session)
+
+    result = runner.invoke(app, ["migrate", "--json"])
+    assert result.exit_code == 0
+    assert json.loads(result.stdout) == {
+        "applied": SCHEMA_VERSION,
+        "version": SCHEMA_VERSION,
+    }
+
+
+def test_startup_upgrades_outdated_schema(session):
+    """Any command first brings an existing database up to date."""
+    _rewind_schema_version(session)
+
+    result = runner.invoke(app, ["list"])
+    assert result.exit_code == 0
+    assert "Database schema upgraded" in result.stdout
+
+
+@pytest.mark.parametrize("args", [["list"], ["--json", "list"], ["add", "Task"]])
+def test_unknown_db_profile_is_a_clean_error(monkeypatch, args):
+    """A bad ODOT_DB_PROFILE names the valid profiles instead of a traceback."""
+    monkeypatch.setenv("ODOT_DB_PROFILE", "bogus")
+
+    result = runner.invoke(app, args)
+    assert result.exit_code == 1
+    assert result.stdout == ""
+    assert "Invalid ODOT_DB_PROFILE: 'bogus'" in result.stderr
+    assert "'safe', 'fast', 'bulk'" in result.stderr
+    assert result.exception is None or isinstance(result.exception, SystemExit)
+
+
+def test_json_startup_upgrade_notice_goes_to_stderr(session):
+    """The upgrade notice never corrupts JSON on stdout."""
+    _rewind_schema_version(session)
+
+    result = runner.invoke(app, ["--json", "list"])
+    assert result.exit_code == 0
+    assert json.loads(result.stdout) == []
+    assert "Database schema upgraded" in result.stderr
+
+
+def test_reindex_command_keeps_current_tokenizer():
+    """`reindex` without --tokenizer rebuilds with the index's own tokenizer."""
+    result = runner.invoke(app, ["reindex"])
+    assert result.exit_code == 0
+    assert "Rebuilt the search index (trigram tokenizer)" in result.stdout
+
+
+def test_reindex_command_switches_to_unicode61():
+    """`reindex --tokenizer unicode61` opts into whole-word search."""
+    runner.invoke(app, ["add", "Clean the kitchen"])
+
+    result = runner.invoke(app, ["reindex", "--tokenizer", "unicode61", "--json"])
+    assert result.exit_code == 0
+    assert json.loads(result.stdout) == {"tokenizer": "unicode61"}
+
+    result = runner.invoke(app, ["search", "itch", "--json"])
+    assert json.loads(result.stdout) == []
+    result = runner.invoke(app, ["search", "kit", "--json"])
+    assert [t["content"] for t in json.loads(result.stdout)] == ["Clean the kitchen"]
+
+
+@pytest.mark.parametrize("as_json", [False, True])
+def test_reindex_command_without_fts5_is_a_clean_error(monkeypatch, as_json):
+    monkeypatch.setattr("odot.database._has_fts5", lambda conn: False)
+
+    result = runner.invoke(app, ["reindex", *(["--json"] if as_json else [])])
+
+    assert result.exit_code == 1
+    assert "has no FTS5" in (result.stderr if as_json else result.stdout)
+
+
+def test_search_tokenizer_enum_matches_database_tokenizers():
+    from odot.cli import SearchTokenizer
+    from odot.database import SEARCH_TOKENIZERS
+
+    assert tuple(t.value for t in SearchTokenizer) == SEARCH_TOKENIZERS
+
+
 def test_main_callback_skips_init_when_session_present():
     """When ctx.obj already holds a session, the callback leaves it untouched."""
     from odot.cli import main_callback
@@ -103,6 +220,51 @@ def test_add_command_empty_category_is_rejected():
     assert "category" in result.stdout.lower()
 
 
+def test_add_command_reads_tasks_from_stdin():
+    """`add -` adds every non-blank stdin line with the shared options."""
+    result = runner.invoke(
+        app, ["add", "-", "-p", "2", "-c", "Work"], input="First\n\n  Second  \n"
+    )
+    assert result.exit_code == 0
+    assert "Added 2 tasks (1-2)" in result.stdout
+
+    result = runner.invoke(app, ["list", "--json"])
+    assert [
+        (t["content"], t["priority"], t["category"]) for t in json.loads(result.stdout)
+    ] == [
+        ("First", 2, "work"),
+        ("Second", 2, "work"),
+    ]
+
+
+def test_add_command_stdin_json_and_single_task():
+    result = runner.invoke(app, ["add", "-", "--json"], input="One\nTwo\n")
+    assert json.loads(result.stdout) == {"added": 2, "ids": [1, 2]}
+
+    result = runner.invoke(app, ["add", "-"], input="Three\n")
+    assert "Added 1 task (3)" in result.stdout
+
+
+def test_add_command_empty_stdin_adds_nothing():
+    result = runner.invoke(app, ["add", "-"], input="\n")
+    assert result.exit_code == 0
+    assert "No tasks to add" in result.stdout
+
+
+@pytest.mark.parametrize("as_json", [False, True])
+def test_add_command_stdin_invalid_line_adds_nothing(as_json):
+    """A bad line aborts the whole batch and names the line."""
+    lines = "Fine\n" + "x" * 300 + "\nAlso fine\n"
+    result = runner.invoke(
+        app, ["add", "-", *(["--json"] if as_json else [])], input=lines
+    )
+    assert result.exit_code == 1
+    assert "line 2" in (result.stderr if as_json else result.stdout)
+
+    result = runner.invoke(app, ["count", "--json"])
+    assert json.loads(result.stdout)["total"] == 0
+
+
 def test_prompt_task_selection_raises_when_no_tasks(session):
     """Selecting a task with an empty task list exits instead of prompting."""
     import typer
@@ -157,6 +319,96 @@ def test_prompt_task_selection_select_labels_include_metadata(monkeypatch, sessi
     assert captured["kwargs"]["use_search_filter"] is True
 
 
+def _offered_ids(monkeypatch, args):
+    """Run `args` with no task id, returning the ids the select menu offered."""
+    captured: dict = {}
+
+    class MockSelect:
+        def ask(self):
+            return None
+
+    def fake_select(*args, **kwargs):
+        captured["choices"] = kwargs["choices"]
+        return MockSelect()
+
+    monkeypatch.setattr("questionary.select", fake_select)
+    runner.invoke(app, args)
+    return [choice.value for choice in captured.get("choices", [])]
+
+
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    [
+        (["done"], [1, 3]),
+        (["undo"], [2, 4]),
+        (["done", "-c", "work"], [3]),
+        (["undo", "--category", "work"], [4]),
+        (["rm", "-c", "home"], [1, 2]),
+        (["show", "-c", "work"], [3, 4]),
+        (["update", "--in-category", "work"], [3, 4]),
+        (["update"], [1, 2, 3, 4]),
+    ],
+)
+def test_picker_offers_only_relevant_tasks(monkeypatch, args, expected):
+    """`done` offers open tasks, `undo` done ones, and --category narrows both."""
+    for content, category in [
+        ("A", "home"),
+        ("B", "home"),
+        ("C", "work"),
+        ("D", "work"),
+    ]:
+        runner.invoke(app, ["add", content, "-c", category])
+    runner.invoke(app, ["done", "2"])
+    runner.invoke(app, ["done", "4"])
+
+    assert _offered_ids(monkeypatch, args) == expected
+
+
+def test_picker_with_nothing_to_offer_names_the_filter():
+    runner.invoke(app, ["add", "Open task", "-c", "work"])
+
+    result = runner.invoke(app, ["undo", "-c", "work"])
+
+    assert result.exit_code == 0
+    assert 'No completed tasks in "work" available.' in result.stdout
+
+
+def test_category_is_ignored_with_an_explicit_id():
+    runner.invoke(app, ["add", "Home task", "-c", "home"])
+
+    result = runner.invoke(app, ["done", "1", "-c", "work"])
+
+    assert result.exit_code == 0
+    assert "Marked done" in result.stdout
+
+
+def test_autocomplete_picker_is_filtered(monkeypatch, session):
+    """The large-list picker indexes only the tasks the filters allow."""
+    from prompt_toolkit.completion import CompleteEvent
+    from prompt_toolkit.document import Document
+
+    from odot.cli import AUTOCOMPLETE_THRESHOLD, prompt_task_selection
+
+    _seed_tasks(AUTOCOMPLETE_THRESHOLD + 1)
+    runner.invoke(app, ["done", "1"])
+
+    captured: dict = {}
+
+    class MockAutocomplete:
+        def ask(self):
+            completer = captured["kwargs"]["completer"]
+            first = next(completer.get_completions(Document(""), CompleteEvent()))
+            return first.text
+
+    def fake_autocomplete(*args, **kwargs):
+        captured["kwargs"] = kwargs
+        return MockAutocomplete()
+
+    monkeypatch.setattr("questionary.autocomplete", fake_autocomplete)
+
+    assert prompt_task_selection(session, "mark done", is_done=False) == 2
+
+
 def test_prompt_task_selection_raises_on_cancel(monkeypatch, session):
     """Cancelling the TUI selection (ask returns None) exits."""
     import typer
@@ -183,6 +435,9 @@ def _seed_tasks(count: int) -> None:
 
 def test_prompt_task_selection_autocomplete_at_threshold(monkeypatch, session):
     """At exactly AUTOCOMPLETE_THRESHOLD tasks, the autocomplete branch is used."""
+    from prompt_toolkit.completion import CompleteEvent
+    from prompt_toolkit.document import Document
+
     from odot.cli import AUTOCOMPLETE_THRESHOLD, prompt_task_selection
 
     _seed_tasks(AUTOCOMPLETE_THRESHOLD)
@@ -191,8 +446,10 @@ def test_prompt_task_selection_autocomplete_at_threshold(monkeypatch, session):
 
     class MockAutocomplete:
         def ask(self):
-            # Echo back the label for task id 1 so the mapping resolves it.
-            return captured["kwargs"]["choices"][0]
+            # Echo back the first completion (task id 1) so the index resolves it.
+            completer = captured["kwargs"]["completer"]
+            first = next(completer.get_completions(Document(""), CompleteEvent()))
+            return first.text
 
     def fake_autocomplete(*args, **kwargs):
         captured["kwargs"] = kwargs
@@ -207,7 +464,7 @@ def test_prompt_task_selection_autocomplete_at_threshold(monkeypatch, session):
 
     result = prompt_task_selection(session, "select")
     assert result == 1
-    assert captured["kwargs"]["match_middle"] is True
+    assert captured["kwargs"]["choices"] == []
 
 
 def test_prompt_task_selection_autocomplete_invalid_answer(monkeypatch, session):
@@ -280,7 +537,9 @@ def test_show_command_missing_task():
 def test_show_command_interactive_prompt(monkeypatch):
     """Omitting a task id falls back to the interactive selection prompt."""
     runner.invoke(app, ["add", "Show me"])
-    monkeypatch.setattr("odot.cli.prompt_task_selection", lambda db, action: 1)
+    monkeypatch.setattr(
+        "odot.cli.prompt_task_selection", lambda db, action, **kwargs: 1
+    )
 
     result = runner.invoke(app, ["show"])
     assert result.exit_code == 0
@@ -509,7 +768,9 @@ def test_update_command_interactive_all_fields(monkeypatch):
 def test_update_command_explicit_fields_skip_task_prompt(monkeypatch):
     """With explicit update flags given, no task-selection prompt should appear."""
     runner.invoke(app, ["add", "Old Task"])
-    monkeypatch.setattr("odot.cli.prompt_task_selection", lambda db, action: 1)
+    monkeypatch.setattr(
+        "odot.cli.prompt_task_selection", lambda db, action, **kwargs: 1
+    )
 
     result = runner.invoke(app, ["update", "--priority", "1"])
     assert result.exit_code == 0
@@ -617,7 +878,9 @@ def test_done_command_missing_task():
 def test_done_command_interactive_prompt(monkeypatch):
     """Omitting a task id falls back to the interactive selection prompt."""
     runner.invoke(app, ["add", "Finish me"])
-    monkeypatch.setattr("odot.cli.prompt_task_selection", lambda db, action: 1)
+    monkeypatch.setattr(
+        "odot.cli.prompt_task_selection", lambda db, action, **kwargs: 1
+    )
 
     result = runner.invoke(app, ["done"])
     assert result.exit_code == 0
@@ -649,7 +912,9 @@ def test_undo_command_interactive_prompt(monkeypatch):
     """Omitting a task id falls back to the interactive selection prompt."""
     runner.invoke(app, ["add", "Already done"])
     runner.invoke(app, ["done", "1"])
-    monkeypatch.setattr("odot.cli.prompt_task_selection", lambda db, action: 1)
+    monkeypatch.setattr(
+        "odot.cli.prompt_task_selection", lambda db, action, **kwargs: 1
+    )
 
     result = runner.invoke(app, ["undo"])
     assert result.exit_code == 0
@@ -683,7 +948,9 @@ def test_rm_command_aborted_confirmation():
 def test_rm_command_interactive_prompt_confirmed(monkeypatch):
     """Confirmed deletion via the interactive task-id prompt removes the task."""
     runner.invoke(app, ["add", "Delete me too"])
-    monkeypatch.setattr("odot.cli.prompt_task_selection", lambda db, action: 1)
+    monkeypatch.setattr(
+        "odot.cli.prompt_task_selection", lambda db, action, **kwargs: 1
+    )
 
     result = runner.invoke(app, ["rm"], input="y\n")
     assert result.exit_code == 0
@@ -868,6 +1135,51 @@ def test_import_command_malformed_json(tmp_path):
     assert "Failed to import tasks" in result.stdout
 
 
+def test_export_command_ndjson_round_trips_through_import(tmp_path):
+    """`--format ndjson` writes one task per line that import reads back."""
+    runner.invoke(app, ["add", "Line one", "-c", "work"])
+    runner.invoke(app, ["add", "Line two"])
+
+    export_file = tmp_path / "export.ndjson"
+    result = runner.invoke(app, ["export", str(export_file), "--format", "ndjson"])
+    assert result.exit_code == 0
+    assert "Exported 2 tasks" in result.stdout
+    lines = export_file.read_text().splitlines()
+    assert [json.loads(line)["content"] for line in lines] == ["Line one", "Line two"]
+
+    result = runner.invoke(
+        app, ["import", str(export_file), "--format", "ndjson", "--clear"], input="y\n"
+    )
+    assert result.exit_code == 0
+    assert "Imported 2 tasks" in result.stdout
+
+
+def test_export_command_ndjson_to_stdout():
+    runner.invoke(app, ["add", "Line one"])
+
+    result = runner.invoke(app, ["export", "--format", "ndjson"])
+    assert result.exit_code == 0
+    [line] = result.stdout.splitlines()
+    assert result.stdout == line + "\n"
+    assert json.loads(line)["content"] == "Line one"
+
+
+def test_export_command_ndjson_rejects_pretty():
+    result = runner.invoke(app, ["export", "--format", "ndjson", "--pretty"])
+    assert result.exit_code == 2
+    assert "--pretty" in result.stderr
+
+
+def test_import_command_malformed_ndjson_names_the_line(tmp_path):
+    bad_file = tmp_path / "bad.ndjson"
+    bad_file.write_text('{"content": "ok"}\n{"content": \n')
+
+    result = runner.invoke(app, ["import", str(bad_file), "--format", "ndjson"])
+    assert result.exit_code == 1
+    assert "line 2 column 13" in result.stdout
+    assert "Failed to import tasks" in result.stdout
+
+
 @pytest.fixture
 def seeded_report_tasks():
     """Seed a work task and a completed personal task for report tests."""
@@ -957,6 +1269,7 @@ def test_main_execution(monkeypatch):
         called = True
 
     monkeypatch.setattr("odot.cli.app", mock_app)
+    monkeypatch.setattr("odot._daemon.should_forward", lambda argv: False)
 
     from odot.cli import main
 
@@ -964,6 +1277,83 @@ def test_main_execution(monkeypatch):
     assert called
 
 
+def test_main_forwards_to_running_daemon(monkeypatch):
+    """Scripted calls exit with the daemon's code without running in-process."""
+    monkeypatch.setattr("sys.argv", ["odot", "count", "--json"])
+    monkeypatch.setattr("odot._daemon.should_forward", lambda argv: True)
+    forwarded = []
+    monkeypatch.setattr(
+        "odot._daemon.forward", lambda argv: forwarded.append(argv) or 3
+    )
+    monkeypatch.setattr("odot.cli.app", lambda: pytest.fail("ran in-process"))
+
+    from odot.cli import main
+
+    with pytest.raises(SystemExit) as excinfo:
+        main()
+    assert excinfo.value.code == 3
+    assert forwarded == [["count", "--json"]]
+
+
+def test_main_falls_back_when_daemon_not_running(monkeypatch):
+    """No daemon answering means the command runs in-process as usual."""
+    called = False
+
+    def mock_app():
+        nonlocal called
+        called = True
+
+    monkeypatch.setattr("odot._daemon.should_forward", lambda argv: True)
+    monkeypatch.setattr("odot._daemon.forward", lambda argv: None)
+    monkeypatch.setattr("odot.cli.app", mock_app)
+
+    from odot.cli import main
+
+    main()
+    assert called
+
+
+def test_daemon_command_serves_on_database_socket(monkeypatch, tmp_path):
+    """`daemon` announces and serves on the socket beside the database."""
+    served = []
+    monkeypatch.setattr("odot._daemon.serve", served.append)
+
+    result = runner.invoke(app, ["daemon"])
+    [server] = served
+    server.server_close()
+    assert result.exit_code == 0
+    assert "listening" in result.stdout
+    assert server.server_address == str(tmp_path / "db.sock")
+
+
+def test_command_without_queries_opens_no_session(monkeypatch):
+    """The session is opened lazily, so `daemon` never creates one."""
+    monkeypatch.setattr("odot._daemon.serve", lambda server: server.server_close())
+    monkeypatch.setattr(
+        "odot.database.get_session", lambda: pytest.fail("session opened")
+    )
+
+    result = runner.invoke(app, ["daemon"])
+    assert result.exit_code == 0
+
+
+def test_daemon_command_already_running(monkeypatch):
+    """A second daemon on the same database exits 1 with the reason, without
+    first claiming to listen."""
+    from odot._daemon import DaemonError
+
+    def refuse(path):
+        raise DaemonError(f"An odot daemon is already listening on {path}")
+
+    monkeypatch.setattr("odot._daemon.make_server", refuse)
+    monkeypatch.setattr("odot._daemon.serve", lambda server: pytest.fail("served"))
+
+    result = runner.invoke(app, ["daemon"])
+    assert result.exit_code == 1
+    assert "already listening" in result.stdout
+    assert "daemon listening" not in result.stdout
+
+
 def test_module_execution():
     """Test that python -m odot.cli works without errors."""
     import subprocess
@@ -1165,6 +1555,184 @@ def test_count_command_with_category_no_status_filter():
     assert '1 tasks in "work" (1 pending, 0 done)' in result.stdout
 
 
+def test_count_command_by_category():
+    runner.invoke(app, ["add", "Task A", "--category", "work"])
+    runner.invoke(app, ["add", "Task B", "--category", "home"])
+    runner.invoke(app, ["add", "Task C", "--category", "work"])
+    runner.invoke(app, ["done", "3"])
+
+    result = runner.invoke(app, ["count", "--by-category"])
+    assert result.exit_code == 0
+    assert result.stdout.splitlines() == [
+        "home  1 tasks (1 pending, 0 done)",
+        "work  2 tasks (1 pending, 1 done)",
+    ]
+
+    result = runner.invoke(app, ["count", "--by-category", "--done", "--json"])
+    assert json.loads(result.stdout) == {"work": {"total": 1, "pending": 0, "done": 1}}
+
+
+def test_count_command_by_category_empty():
+    result = runner.invoke(app, ["count", "--by-category"])
+    assert result.exit_code == 0
+    assert "No tasks found." in result.stdout
+
+
+def test_counters_command_lifecycle():
+    runner.invoke(app, ["add", "Task A", "--category", "work"])
+
+    result = runner.invoke(app, ["counters", "enable"])
+    assert result.exit_code == 0
+    assert "Enabled the summary counters" in result.stdout
+
+    runner.invoke(app, ["add", "Task B", "--category", "work"])
+    result = runner.invoke(app, ["count", "--json"])
+    assert json.loads(result.stdout) == {"total": 2, "pending": 2, "done": 0}
+
+    result = runner.invoke(app, ["counters", "check"])
+    assert result.exit_code == 0
+    assert "match the task table" in result.stdout
+
+    result = runner.invoke(app, ["counters", "rebuild", "--json"])
+    assert result.exit_code == 0
+    assert json.loads(result.stdout) == {"enabled": True}
+
+    result = runner.invoke(app, ["counters", "disable"])
+    assert result.exit_code == 0
+    assert "Summary counters disabled" in result.stdout
+
+    result = runner.invoke(app, ["counters", "disable", "--json"])
+    assert json.loads(result.stdout) == {"enabled": False}
+    result = runner.invoke(app, ["counters", "disable"])
+    assert "were not enabled" in result.stdout
+
+
+def test_counters_command_check_reports_drift(engine):
+    runner.invoke(app, ["add", "Task A", "--category", "work"])
+    runner.invoke(app, ["counters", "enable"])
+    with engine.begin() as conn:
+        conn.exec_driver_sql("UPDATE task_counters SET n = 5")
+
+    result = runner.invoke(app, ["counters", "check"])
+    assert result.exit_code == 1
+    assert '"work" pending: counters say 5, table has 1' in result.stdout
+    assert "odot counters rebuild" in result.stdout
+
+    result = runner.invoke(app, ["counters", "check", "--json"])
+    assert result.exit_code == 1
+    assert json.loads(result.stdout) == {
+        "consistent": False,
+        "drift": [{"category": "work", "is_done": False, "stored": 5, "actual": 1}],
+    }
+
+    runner.invoke(app, ["counters", "rebuild"])
+    result = runner.invoke(app, ["counters", "check", "--json"])
+    assert result.exit_code == 0
+    assert json.loads(result.stdout) == {"consistent": True, "drift": []}
+
+
+@pytest.mark.parametrize("action", ["check", "rebuild"])
+def test_counters_command_requires_enabled_counters(action):
+    result = runner.invoke(app, ["counters", action])
+    assert result.exit_code == 1
+    assert "odot counters enable" in result.stdout
+
+    result = runner.invoke(app, ["counters", action, "--json"])
+    assert result.exit_code == 1
+    assert result.stdout == ""
+    assert "not enabled" in result.stderr
+
+
+def test_backup_and_restore_commands_round_trip(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    runner.invoke(app, ["add", "Keep me"])
+    snapshot = "snap.sqlite"
+
+    result = runner.invoke(app, ["backup", snapshot])
+    assert result.exit_code == 0
+    assert "Backed up the database to snap.sqlite (" in result.stdout
+
+    runner.invoke(app, ["add", "Added later"])
+    result = runner.invoke(app, ["restore", snapshot], input="y\n")
+    assert result.exit_code == 0
+    assert "This will replace ALL tasks" in result.stdout
+    assert "Restored the database from snap.sqlite" in result.stdout
+
+    tasks = json.loads(runner.invoke(app, ["list", "--json"]).stdout)
+    assert [t["content"] for t in tasks] == ["Keep me"]
+
+
+def test_backup_and_restore_commands_json(tmp_path):
+    snapshot = tmp_path / "snap.sqlite"
+
+    result = runner.invoke(app, ["backup", str(snapshot), "--json"])
+    assert result.exit_code == 0
+    data = json.loads(result.stdout)
+    assert data == {
+        "path": str(snapshot),
+        "pages": data["pages"],
+        "bytes": snapshot.stat().st_size,
+    }
+
+    result = runner.invoke(app, ["restore", str(snapshot), "--json"])
+    assert result.exit_code == 2
+    assert "--force is required" in result.stderr
+
+    result = runner.invoke(app, ["restore", str(snapshot), "--json", "--force"])
+    assert result.exit_code == 0
+    assert json.loads(result.stdout) == {"path": str(snapshot), "pages": data["pages"]}
+
+
+@pytest.mark.parametrize("as_json", [False, True])
+def test_backup_command_refuses_to_overwrite_without_force(tmp_path, as_json):
+    snapshot = tmp_path / "snap.sqlite"
+    snapshot.write_text("precious")
+    args = ["backup", str(snapshot)] + (["--json"] if as_json else [])
+
+    result = runner.invoke(app, args)
+    assert result.exit_code == 1
+    assert "use --force to overwrite" in (result.stderr if as_json else result.stdout)
+    assert snapshot.read_text() == "precious"
+
+    result = runner.invoke(app, [*args, "--force"])
+    assert result.exit_code == 0
+    assert snapshot.read_bytes().startswith(b"SQLite format 3")
+
+
+def test_backup_command_reports_unwritable_path(tmp_path):
+    result = runner.invoke(app, ["backup", str(tmp_path / "missing" / "snap.sqlite")])
+    assert result.exit_code == 1
+    assert "Failed to back up the database: unable to open" in result.stdout
+
+
+def test_restore_command_rejects_non_database(tmp_path):
+    bogus = tmp_path / "bogus.sqlite"
+    bogus.write_text("not a database " * 100)
+
+    result = runner.invoke(app, ["restore", str(bogus), "--force"])
+    assert result.exit_code == 1
+    assert "Failed to restore the database: Not an odot database" in result.stdout
+
+
+def test_backup_command_shows_progress_on_a_terminal(tmp_path, monkeypatch):
+    import io
+
+    from rich.console import Console
+
+    from odot import cli
+
+    terminal = io.StringIO()
+    # Swap the console the lazy proxy wraps, so the proxy itself is exercised.
+    monkeypatch.setattr(
+        cli.console, "_console", Console(file=terminal, force_terminal=True, width=80)
+    )
+
+    result = runner.invoke(app, ["backup", str(tmp_path / "snap.sqlite")])
+    assert result.exit_code == 0
+    assert "Backing up" in terminal.getvalue()
+    assert "Backed up the database" in terminal.getvalue()
+
+
 # --------------------------------------------------------------------------- #
 # #60: search highlight
 # --------------------------------------------------------------------------- #
@@ -1180,7 +1748,7 @@ def test_search_command_highlights_match():
 
 
 def test_search_command_is_case_insensitive():
-    """Search matches regardless of case, per core's icontains-based lookup."""
+    """Search matches regardless of case, whichever index answers it."""
     runner.invoke(app, ["add", "Buy Groceries for dinner"])
 
     result = runner.invoke(app, ["search", "groceries"])
@@ -1308,6 +1876,329 @@ def test_json_list_returns_array():
     assert [t["content"] for t in data] == ["Task A", "Task B"]
 
 
+def test_json_list_is_formatted_like_json_dumps():
+    """The streamed array is byte-for-byte what `json.dumps` prints."""
+    runner.invoke(app, ["add", "Café ☕"])
+    runner.invoke(app, ["add", 'Say "hi"'])
+
+    result = runner.invoke(app, ["list", "--json"])
+    assert result.exit_code == 0
+    assert result.stdout == json.dumps(json.loads(result.stdout)) + "\n"
+    assert list(json.loads(result.stdout)[0]) == [
+        "priority",
+        "content",
+        "category",
+        "created_at",
+        "id",
+        "is_done",
+        "updated_at",
+    ]
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["add", "New task", "--json"],
+        ["show", "1", "--json"],
+        ["update", "1", "-p", "2", "--json"],
+        ["done", "1", "--json"],
+        ["search", "Café", "--json"],
+        ["list", "--limit", "1", "--json"],
+        ["export"],
+    ],
+)
+def test_json_task_objects_keep_the_0_5_key_order(args):
+    """Every command prints task keys in the order 0.5.0 did."""
+    from odot.models import TASK_JSON_KEYS
+
+    runner.invoke(app, ["add", "Café ☕"])
+
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0
+    data = json.loads(result.stdout)
+    task = data["tasks"][0] if "tasks" in data else data
+    task = task[0] if isinstance(task, list) else task
+    assert tuple(task)[: len(TASK_JSON_KEYS)] == TASK_JSON_KEYS
+
+
+@pytest.mark.parametrize(
+    "args", [["--format", "ndjson"], ["--json", "--format", "ndjson"]]
+)
+def test_list_format_ndjson_writes_one_task_per_line(args):
+    """NDJSON lines are the `list --json` array's items, and --format wins."""
+    runner.invoke(app, ["add", "Task A"])
+    runner.invoke(app, ["add", "Task B"])
+    array = runner.invoke(app, ["list", "--json"]).stdout
+
+    result = runner.invoke(app, ["list", *args])
+    assert result.exit_code == 0
+    assert [json.loads(line) for line in result.stdout.splitlines()] == json.loads(
+        array
+    )
+    assert result.stdout.endswith("}\n")
+
+
+def test_list_format_json_and_table():
+    runner.invoke(app, ["add", "Task A"])
+
+    assert _json_out(runner.invoke(app, ["list", "--format", "json"]))[0]["id"] == 1
+    result = runner.invoke(app, ["--json", "list", "--format", "table"])
+    assert "Odot Tasks" in result.stdout
+
+
+def test_list_format_ndjson_empty_prints_nothing():
+    result = runner.invoke(app, ["list", "--format", "ndjson"])
+    assert result.exit_code == 0
+    assert result.stdout == ""
+
+
+def _cursor_after(task_id):
+    """Return the default-order cursor that continues after `task_id`."""
+    from odot import core
+    from odot.models import Task
+
+    return core.page_cursor(Task(id=task_id, content="x"))
+
+
+def test_json_list_pages_follow_next_cursor():
+    """`list --limit --json` wraps each page with the cursor for the next."""
+    for name in "ABCDE":
+        runner.invoke(app, ["add", f"Task {name}", "-p", "2"])
+
+    contents, cursor = [], []
+    while True:
+        result = runner.invoke(
+            app, ["list", "--sort", "priority", "-n", "2", "--json", *cursor]
+        )
+        assert result.exit_code == 0
+        data = _json_out(result)
+        assert list(data) == ["tasks", "next_cursor"]
+        assert result.stdout == json.dumps(data) + "\n"
+        contents += [t["content"] for t in data["tasks"]]
+        if data["next_cursor"] is None:
+            break
+        cursor = ["--cursor", data["next_cursor"]]
+
+    assert contents == [f"Task {name}" for name in "ABCDE"]
+
+
+def test_list_limit_table_prints_next_page_hint():
+    for name in "ABC":
+        runner.invoke(app, ["add", f"Task {name}"])
+
+    first = runner.invoke(app, ["list", "--limit", "2"])
+    assert first.exit_code == 0
+    assert "Task B" in first.stdout
+    assert "Task C" not in first.stdout
+    cursor = first.stdout.split("Next page: --cursor ")[1].split()[0]
+
+    last = runner.invoke(app, ["list", "--limit", "2", "--cursor", cursor])
+    assert "Task C" in last.stdout
+    assert "Task A" not in last.stdout
+    assert "Next page" not in last.stdout
+
+    done = runner.invoke(app, ["list", "--cursor", _cursor_after(3)])
+    assert done.exit_code == 0
+    assert "No more tasks." in done.stdout
+
+
+def test_list_limit_ndjson_reports_cursor_on_stderr():
+    runner.invoke(app, ["add", "Task A"])
+    runner.invoke(app, ["add", "Task B"])
+
+    result = runner.invoke(app, ["list", "-n", "1", "--format", "ndjson"])
+    assert result.exit_code == 0
+    assert [json.loads(line)["id"] for line in result.stdout.splitlines()] == [1]
+    assert f"--cursor {_cursor_after(1)}" in result.stderr
+
+    last = runner.invoke(
+        app, ["list", "-n", "1", "--format", "ndjson", "--cursor", _cursor_after(1)]
+    )
+    assert [json.loads(line)["id"] for line in last.stdout.splitlines()] == [2]
+    assert last.stderr == ""
+
+
+def test_list_limit_empty_shows_empty_state(session):
+    result = runner.invoke(app, ["list", "-n", "5"])
+    assert result.exit_code == 0
+    assert "No tasks yet" in result.stdout
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--cursor", "garbage!"],
+        ["--sort", "date", "--cursor", "W251bGwsZmFsc2UsWzFdXQ"],
+    ],
+)
+def test_list_bad_cursor_exits_two(args):
+    result = runner.invoke(app, ["list", *args])
+    assert result.exit_code == 2
+    assert "--cursor" in result.output
+
+
+@pytest.fixture
+def terminal(monkeypatch):
+    """Make `console` a terminal so `list --pager` engages; returns its output."""
+    import io
+
+    from rich.console import Console
+
+    from odot import cli
+
+    out = io.StringIO()
+    monkeypatch.setattr(
+        cli.console, "_console", Console(file=out, force_terminal=True, width=80)
+    )
+    return out
+
+
+def _python_pager(code):
+    """A $PAGER command running `code` under this interpreter."""
+    import shlex
+    import sys
+
+    return shlex.join([sys.executable, "-c", code])
+
+
+def test_list_pager_splices_pages_into_one_table(terminal, monkeypatch, tmp_path):
+    from odot import cli
+
+    monkeypatch.setattr(cli, "PAGER_PAGE_SIZE", 3)
+    for i in range(8):
+        runner.invoke(app, ["add", f"Task {i}", "-c", "c" * (12 if i == 6 else 4)])
+    paged = tmp_path / "paged.txt"
+    code = f"import sys; open({str(paged)!r}, 'w').write(sys.stdin.read())"
+    monkeypatch.setenv("PAGER", _python_pager(code))
+
+    result = runner.invoke(app, ["list", "--pager"])
+    assert result.exit_code == 0
+    assert "Odot Tasks" not in terminal.getvalue()
+
+    lines = re.sub(r"\x1b\[[0-9;]*m", "", paged.read_text()).splitlines()
+    assert sum("Odot Tasks" in line for line in lines) == 1
+    assert sum(line.startswith("┃") for line in lines) == 1
+    assert sum(line.startswith(("┏", "└")) for line in lines) == 2
+    rows = [line for line in lines if line.startswith("│")]
+    assert [row.split("│")[5].strip() for row in rows] == [
+        f"Task {i}" for i in range(8)
+    ]
+    assert len({len(line) for line in lines[1:-1]}) == 1
+    assert lines[-1] == "8 tasks (8 pending, 0 done)"
+
+
+def test_list_pager_stops_fetching_when_the_pager_quits(terminal, monkeypatch):
+    from odot import cli, core
+
+    monkeypatch.setattr(cli, "PAGER_PAGE_SIZE", 10)
+    runner.invoke(app, ["add", "-"], input="".join(f"Task {i}\n" for i in range(500)))
+    fetched = []
+    list_page = core.list_tasks_page
+    monkeypatch.setattr(
+        core,
+        "list_tasks_page",
+        lambda *args, **kwargs: fetched.append(1) or list_page(*args, **kwargs),
+    )
+    monkeypatch.setenv("PAGER", _python_pager("import sys; sys.stdin.readline()"))
+
+    result = runner.invoke(app, ["list", "--pager"])
+    assert result.exit_code == 0
+    assert len(fetched) < 50
+
+
+def test_list_pager_short_list_and_empty_state(terminal, monkeypatch, tmp_path):
+    paged = tmp_path / "paged.txt"
+    code = f"import sys; open({str(paged)!r}, 'w').write(sys.stdin.read())"
+    monkeypatch.setenv("PAGER", _python_pager(code))
+
+    runner.invoke(app, ["list", "--pager"])
+    assert "No tasks yet" in terminal.getvalue()
+    assert not paged.exists()
+
+    runner.invoke(app, ["add", "Only task"])
+    result = runner.invoke(app, ["list", "--pager"])
+    assert result.exit_code == 0
+    assert "Only task" in paged.read_text()
+
+
+def test_list_pager_missing_pager_errors(terminal, monkeypatch):
+    runner.invoke(app, ["add", "Task A"])
+    monkeypatch.setenv("PAGER", "odot-no-such-pager")
+
+    result = runner.invoke(app, ["list", "--pager"])
+    assert result.exit_code == 1
+    assert "Could not run pager 'odot-no-such-pager'" in result.stderr
+
+
+def test_list_pager_is_ignored_off_a_terminal(monkeypatch):
+    """Piped output (and JSON) is printed directly, like git does."""
+    monkeypatch.setenv("PAGER", "odot-no-such-pager")
+    runner.invoke(app, ["add", "Task A"])
+
+    assert "Task A" in runner.invoke(app, ["list", "--pager"]).stdout
+    assert _json_out(runner.invoke(app, ["list", "--pager", "--json"]))
+
+
+@pytest.mark.parametrize(("fmt", "sep"), [("tsv", "\t"), ("csv", ",")])
+def test_list_format_delimited_writes_header_and_rows(fmt, sep):
+    runner.invoke(app, ["add", "Task A", "-p", "3", "-c", "work"])
+    runner.invoke(app, ["add", "Task B"])
+    runner.invoke(app, ["done", "2"])
+
+    result = runner.invoke(app, ["list", "--format", fmt, "--sort", "priority"])
+    assert result.exit_code == 0
+    header, *rows = (line.split(sep) for line in result.stdout.splitlines())
+    assert header == [
+        "content",
+        "priority",
+        "category",
+        "id",
+        "is_done",
+        "created_at",
+        "updated_at",
+    ]
+    assert [row[:5] for row in rows] == [
+        ["Task B", "1", "general", "2", "true"],
+        ["Task A", "3", "work", "1", "false"],
+    ]
+    assert rows[0][5].endswith("Z")
+    assert rows[1][6] == ""
+    assert "[" not in result.stdout  # no Rich markup
+
+
+def test_list_format_tsv_escapes_tabs_and_newlines(session):
+    from odot import core
+    from odot.models import TaskCreate
+
+    core.add_task(db=session, task_data=TaskCreate(content="a\tb\nc"))
+
+    result = runner.invoke(app, ["list", "--format", "tsv"])
+    assert result.stdout.splitlines()[1].startswith("a\\tb\\nc\t")
+
+
+def test_search_format_csv():
+    runner.invoke(app, ["add", "Buy milk, eggs"])
+    runner.invoke(app, ["add", "Walk dog"])
+
+    result = runner.invoke(app, ["search", "buy", "--format", "csv"])
+    assert result.exit_code == 0
+    assert result.stdout.splitlines()[1].startswith('"Buy milk, eggs",1,general,1,')
+    assert len(result.stdout.splitlines()) == 2
+
+
+def test_list_format_tsv_pages_report_cursor_on_stderr():
+    runner.invoke(app, ["add", "Task A"])
+    runner.invoke(app, ["add", "Task B"])
+
+    result = runner.invoke(app, ["list", "-n", "1", "--format", "tsv"])
+    assert result.exit_code == 0
+    assert [line.split("\t")[0] for line in result.stdout.splitlines()] == [
+        "content",
+        "Task A",
+    ]
+    assert f"--cursor {_cursor_after(1)}" in result.stderr
+
+
 def test_json_bare_invocation_emits_list_json():
     """Bare `odot --json` falls through to the list command's JSON array."""
     runner.invoke(app, ["add", "Bare task"])
@@ -1364,6 +2255,39 @@ def test_json_search_returns_array():
     assert [t["content"] for t in data] == ["Findable phrase"]
 
 
+def test_json_search_includes_score_and_match_spans():
+    """`search --json` adds the relevance score and match offsets per task."""
+    runner.invoke(app, ["add", "Buy groceries"])
+
+    result = runner.invoke(app, ["search", "groc", "--json"])
+    assert result.exit_code == 0
+    [task] = _json_out(result)
+    assert task["content"] == "Buy groceries"
+    assert task["score"] > 0
+    assert task["matches"] == [[4, 8]]
+
+
+def test_search_command_limit_keeps_best_matches():
+    """`search --limit N` shows only the N most relevant tasks."""
+    runner.invoke(app, ["add", "memo about something else entirely"])
+    runner.invoke(app, ["add", "memo memo"])
+
+    result = runner.invoke(app, ["search", "memo", "--limit", "1", "--json"])
+    assert result.exit_code == 0
+    assert [t["content"] for t in _json_out(result)] == ["memo memo"]
+
+
+def test_search_format_ndjson_writes_one_hit_per_line():
+    runner.invoke(app, ["add", "Buy groceries"])
+    runner.invoke(app, ["add", "Groceries list"])
+
+    result = runner.invoke(app, ["search", "groceries", "--format", "ndjson"])
+    assert result.exit_code == 0
+    hits = [json.loads(line) for line in result.stdout.splitlines()]
+    assert {hit["content"] for hit in hits} == {"Buy groceries", "Groceries list"}
+    assert all("score" in hit and "matches" in hit for hit in hits)
+
+
 def test_json_search_no_matches_is_empty_array():
     """`search --json` with no matches emits an empty array."""
     runner.invoke(app, ["add", "Task A"])
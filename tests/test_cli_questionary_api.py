@@ -6,6 +6,10 @@ conflicting parameters before code reaches production.
 """
 
 import questionary
+from prompt_toolkit.completion import CompleteEvent
+from prompt_toolkit.document import Document
+
+from odot._picker import TaskCompleter, TaskIndex
 
 
 def test_select_task_questionary_parameters_valid():
@@ -35,7 +39,24 @@ def test_autocomplete_task_questionary_parameters_valid():
     """Ensure questionary.autocomplete() parameters are valid."""
     q = questionary.autocomplete(
         "Select a task (type to filter):",
-        choices=["Task 1", "Task 2"],
-        match_middle=True,
+        choices=[],
+        completer=TaskCompleter(TaskIndex([(1, "Task 1", "work", 2, False)])),
     )
     assert q is not None
+
+
+def test_autocomplete_uses_the_given_completer():
+    """questionary.autocomplete() offers the custom completer's completions.
+
+    `_autocomplete_task` passes no choices and relies on questionary using
+    the `completer` argument in place of its own word completer.
+    """
+    index = TaskIndex([(1, "Task 1", "work", 2, False)])
+    q = questionary.autocomplete(
+        "Select a task (type to filter):", choices=[], completer=TaskCompleter(index)
+    )
+    buffer = q.application.layout.current_buffer
+    completions = list(
+        buffer.completer.get_completions(Document("work"), CompleteEvent())
+    )
+    assert [c.text for c in completions] == [index.label(0)]
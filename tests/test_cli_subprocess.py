@@ -49,3 +49,65 @@ def test_invalid_command_exits_nonzero(tmp_path):
     result = run_odot("not-a-real-command", db_path=tmp_path / "db.sqlite")
 
     assert result.returncode != 0
+
+
+#: Packages `import odot.cli` must not load. Each is imported inside the
+#: commands that need it; pulling one back to module level would add it to
+#: every invocation's startup, including `--version`, `--help` and the
+#: daemon client.
+DEFERRED_PACKAGES = (
+    "sqlmodel",
+    "sqlalchemy",
+    "pydantic",
+    "rich",
+    "questionary",
+    "prompt_toolkit",
+    "importlib.metadata",
+)
+
+
+def imported_modules(*python_args, db_path):
+    """Run Python with `-X importtime` and return the names of modules loaded."""
+    env = {
+        **os.environ,
+        "ODOT_DB_PATH": str(db_path),
+        "ODOT_NO_DAEMON": "1",
+    }
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *python_args],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    # Lines look like "import time:  self [us] | cumulative | <indent>name".
+    return {
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    }
+
+
+def loaded_deferred(modules):
+    return sorted(
+        name
+        for name in modules
+        for package in DEFERRED_PACKAGES
+        if name == package or name.startswith(f"{package}.")
+    )
+
+
+def test_import_budget_for_cli_module(tmp_path):
+    modules = imported_modules("-c", "import odot.cli", db_path=tmp_path / "db")
+
+    assert "odot.cli" in modules
+    assert loaded_deferred(modules) == []
+
+
+def test_version_does_not_load_database_or_prompt_stack(tmp_path):
+    modules = imported_modules(
+        "-m", "odot", "--version", db_path=tmp_path / "db.sqlite"
+    )
+
+    # --version needs rich (to print) and importlib.metadata, nothing else.
+    assert {"sqlmodel", "sqlalchemy", "questionary"}.isdisjoint(modules)
@@ -2,11 +2,22 @@
 
 import io
 import json
+import re
+import sqlite3
+import tracemalloc
+from datetime import UTC, datetime, timedelta, timezone
 
 import pytest
 
-from odot import core
-from odot.models import Task, TaskCreate, TaskUpdate
+from odot import core, database
+from odot.models import (
+    TASK_JSON_KEYS,
+    Task,
+    TaskCreate,
+    TaskImport,
+    TaskRow,
+    TaskUpdate,
+)
 
 
 def test_add_task(session):
@@ -20,6 +31,135 @@ def test_add_task(session):
     assert task.is_done is False
 
 
+def test_add_task_without_a_returned_id_raises(session, monkeypatch):
+    monkeypatch.setattr(core, "_insert_batches", lambda db, rows: iter([[]]))
+
+    with pytest.raises(RuntimeError, match="returned 0 ids instead of 1"):
+        core.add_task(db=session, task_data=TaskCreate(content="lost"))
+
+
+def test_add_task_that_cannot_be_read_back_raises(session, monkeypatch):
+    monkeypatch.setattr(session, "get", lambda model, task_id: None)
+
+    with pytest.raises(RuntimeError, match="Task 1 was inserted but could not"):
+        core.add_task(db=session, task_data=TaskCreate(content="lost"))
+
+
+def test_add_tasks_many(session, monkeypatch):
+    """Rows land in batches with ids in input order, like add_task's rows."""
+    monkeypatch.setattr(core, "INSERT_BATCH_SIZE", 2)
+    single = core.add_task(db=session, task_data=TaskCreate(content="single"))
+
+    ids = core.add_tasks_many(
+        db=session,
+        tasks=(
+            TaskCreate(content=f"bulk {i}", priority=3, category="Work")
+            for i in range(5)
+        ),
+    )
+
+    assert ids == list(range(single.id + 1, single.id + 6))
+    tasks = core.list_tasks(db=session)
+    assert [t.content for t in tasks[1:]] == [f"bulk {i}" for i in range(5)]
+    assert all(t.category == "work" and t.priority == 3 for t in tasks[1:])
+    assert all(not t.is_done and t.updated_at is None for t in tasks[1:])
+    assert tasks[1].created_at.tzinfo == single.created_at.tzinfo
+    assert {t.id for t in core.search_tasks(db=session, phrase="bulk")} == set(ids)
+
+
+def test_add_tasks_many_fits_the_bound_variable_limit(session):
+    """Batches shrink to the connection's limit (999 before SQLite 3.32)."""
+    connection = session.connection().connection.driver_connection
+    connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+
+    ids = core.add_tasks_many(
+        db=session, tasks=(TaskCreate(content=f"task {i}") for i in range(1000))
+    )
+
+    assert ids == list(range(1, 1001))
+
+
+def test_add_tasks_many_empty(session):
+    assert core.add_tasks_many(db=session, tasks=[]) == []
+
+
+def test_add_tasks_many_rolls_back_on_error(session, monkeypatch):
+    monkeypatch.setattr(core, "INSERT_BATCH_SIZE", 2)
+
+    def tasks():
+        for i in range(3):
+            yield TaskCreate(content=f"doomed {i}")
+        msg = "bad input"
+        raise ValueError(msg)
+
+    with pytest.raises(ValueError, match="bad input"):
+        core.add_tasks_many(db=session, tasks=tasks())
+
+    assert core.list_tasks(db=session) == []
+
+
+def _stored_rows(session, start_id):
+    """Every column of the rows from `start_id` on, with SQLite's storage type."""
+    columns = ", ".join(
+        f"{name}, typeof({name})" for name in core.TASK_COLUMNS if name != "id"
+    )
+    return (
+        session.connection()
+        .exec_driver_sql(
+            f"SELECT {columns} FROM task WHERE id >= ? ORDER BY id",  # noqa: S608  # test-only constant columns
+            (start_id,),
+        )
+        .all()
+    )
+
+
+TRUSTED_CREATES = [
+    {"content": "Plain"},
+    {"content": 'Café ☕ "quoted"\n', "priority": 3, "category": " Work "},
+    {"content": "x" * 255, "priority": 2, "category": "Home"},
+]
+
+
+@pytest.mark.parametrize("returning", [True, False])
+def test_trusted_inserts_store_what_the_orm_stores(
+    session, tmp_path, monkeypatch, returning
+):
+    """add_task, add_tasks_many and import_tasks write trusted rows straight
+    to SQLite, or through the ORM where SQLite has no RETURNING; each stores
+    exactly what a validated `Task` flushed through the ORM does, down to the
+    value types and timestamp text."""
+    monkeypatch.setattr(core, "_SQLITE_RETURNING", returning)
+    now = datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC)
+    imports = [
+        {**fields, "is_done": True, "created_at": now, "updated_at": now}
+        for fields in TRUSTED_CREATES
+    ]
+    for fields in TRUSTED_CREATES:
+        session.add(Task(**TaskCreate(**fields).model_dump(), created_at=now))
+    for fields in imports:
+        session.add(Task(**TaskImport(**fields).model_dump()))
+    session.commit()
+    orm = _stored_rows(session, 1)
+
+    for fields in TRUSTED_CREATES:
+        core.add_task(db=session, task_data=TaskCreate(**fields))
+    core.add_tasks_many(session, [TaskCreate(**fields) for fields in TRUSTED_CREATES])
+    path = tmp_path / "import.json"
+    path.write_text(json.dumps(imports, default=str), encoding="utf-8")
+    core.import_tasks(session, path)
+
+    def without_created_at(row):
+        return row[:8] + row[9:]
+
+    created = orm[: len(TRUSTED_CREATES)]
+    trusted = _stored_rows(session, len(orm) + 1)
+    assert [without_created_at(row) for row in trusted[:6]] == [
+        without_created_at(row) for row in created * 2
+    ]
+    assert all(re.fullmatch(r"[\d-]{10} [\d:]{8}\.\d{6}", r[8]) for r in trusted)
+    assert trusted[6:] == orm[len(TRUSTED_CREATES) :]
+
+
 def test_get_task(session):
     """Test parsing an inserted task and None handling for a missing ID."""
     # Add a task to fetch later
@@ -145,6 +285,218 @@ def test_list_tasks_invalid_sort_raises(session):
         core.list_tasks(db=session, sort_by="nonexistent")
 
 
+#: Every filter combination `list_tasks` can issue.
+LIST_FILTERS = [
+    {},
+    {"is_done": False},
+    {"is_done": True},
+    {"category": "work"},
+    {"is_done": False, "category": "work"},
+]
+
+
+def _query_plan(session, statement):
+    """Return SQLite's EXPLAIN QUERY PLAN detail lines for a statement."""
+    conn = session.connection()
+    sql = str(statement.compile(conn.engine, compile_kwargs={"literal_binds": True}))
+    return [row[3] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")]
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("sort_by", [None, *core.VALID_SORT_FIELDS])
+@pytest.mark.parametrize("filters", LIST_FILTERS)
+def test_list_tasks_query_plan_uses_index(session, filters, sort_by, reverse):
+    """Every filter/sort combination is read in index order, never temp-sorted."""
+    statement = core._select_tasks(sort_by=sort_by, reverse=reverse, **filters)
+
+    plan = " | ".join(_query_plan(session, statement))
+
+    assert "USE TEMP B-TREE" not in plan
+
+
+def test_list_open_tasks_by_priority_reads_the_category_index(session):
+    """`list --todo -c X --sort priority` seeks the category/priority index."""
+    statement = core._select_tasks(is_done=False, category="work", sort_by="priority")
+
+    plan = " | ".join(_query_plan(session, statement))
+
+    assert "ix_task_category_priority" in plan
+
+
+@pytest.fixture(name="counted")
+def counted_fixture(session):
+    """Seed tasks across statuses and categories for the counting tests."""
+    for content, category, done in [
+        ("a", "Work", False),
+        ("b", "work", True),
+        ("c", "home", False),
+        ("d", "home", False),
+    ]:
+        task = core.add_task(
+            db=session, task_data=TaskCreate(content=content, category=category)
+        )
+        if done:
+            core.update_task(db=session, task_id=task.id, data=TaskUpdate(is_done=True))
+    return session
+
+
+@pytest.mark.parametrize(
+    ("filters", "expected"),
+    [
+        ({}, (4, 3, 1)),
+        ({"is_done": False}, (3, 3, 0)),
+        ({"is_done": True}, (1, 0, 1)),
+        ({"category": " WORK "}, (2, 1, 1)),
+        ({"category": "home", "is_done": True}, (0, 0, 0)),
+    ],
+)
+def test_count_tasks_matches_list_tasks(counted, filters, expected):
+    counts = core.count_tasks(db=counted, **filters)
+
+    assert (counts.total, counts.pending, counts.done) == expected
+    assert counts.total == len(core.list_tasks(db=counted, **filters))
+
+
+def test_count_tasks_empty_database(session):
+    assert core.count_tasks(db=session) == core.TaskCounts(total=0, pending=0, done=0)
+
+
+@pytest.mark.parametrize(
+    ("filters", "expected"),
+    [
+        ({}, True),
+        ({"is_done": True}, True),
+        ({"category": "HOME"}, True),
+        ({"category": "home", "is_done": True}, False),
+        ({"category": "nowhere"}, False),
+    ],
+)
+def test_has_tasks(counted, filters, expected):
+    assert core.has_tasks(db=counted, **filters) is expected
+
+
+def test_has_tasks_empty_database(session):
+    assert not core.has_tasks(db=session)
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {"is_done": False},
+        {"category": "work"},
+        {"is_done": True, "category": "work"},
+    ],
+)
+def test_count_tasks_query_plan_is_covering(session, filters):
+    """The status breakdown is read from an index alone, without a temp sort."""
+    statement = core._count_statement(**filters)
+
+    plan = " | ".join(_query_plan(session, statement))
+
+    assert "USE TEMP B-TREE" not in plan
+    assert "COVERING INDEX" in plan
+
+
+def _counted_breakdown(session):
+    """Return per-category counts as plain tuples, for easy comparison."""
+    return {
+        name: (counts.total, counts.pending, counts.done)
+        for name, counts in core.count_tasks_by_category(db=session).items()
+    }
+
+
+def test_count_tasks_by_category(counted):
+    assert _counted_breakdown(counted) == {"home": (2, 2, 0), "work": (2, 1, 1)}
+    by_category = core.count_tasks_by_category(db=counted, is_done=True)
+    assert by_category == {"work": core.TaskCounts(total=1, pending=0, done=1)}
+
+
+@pytest.mark.parametrize(
+    ("filters", "by_category"),
+    [({}, False), ({"is_done": True, "category": "work"}, False), ({}, True)],
+)
+def test_count_tasks_reads_counters_when_enabled(counted, engine, filters, by_category):
+    before = core.count_tasks(db=counted, **filters), _counted_breakdown(counted)
+    database.rebuild_counters(engine)
+    # Prove the counters are what gets read by making them disagree.
+    with engine.begin() as conn:
+        conn.exec_driver_sql("UPDATE task_counters SET n = n + 10")
+
+    statement = core._count_statement(by_category=by_category, counters=True)
+    assert "task_counters" in " | ".join(_query_plan(counted, statement))
+    after = core.count_tasks(db=counted, **filters), _counted_breakdown(counted)
+    assert after != before
+
+
+def test_counters_follow_every_task_write(counted, engine):
+    database.rebuild_counters(engine)
+    tasks = core.list_tasks(db=counted)
+
+    core.add_task(db=counted, task_data=TaskCreate(content="e", category="new"))
+    core.update_task(db=counted, task_id=tasks[0].id, data=TaskUpdate(is_done=True))
+    core.update_task(db=counted, task_id=tasks[2].id, data=TaskUpdate(category="work"))
+    core.update_task(db=counted, task_id=tasks[3].id, data=TaskUpdate(priority=3))
+    core.delete_task(db=counted, task_id=tasks[1].id)
+    assert database.check_counters(engine) == {}
+    assert _counted_breakdown(counted) == {
+        "home": (1, 1, 0),
+        "new": (1, 1, 0),
+        "work": (2, 1, 1),
+    }
+
+    core.delete_completed_tasks(db=counted)
+    assert database.check_counters(engine) == {}
+    core.delete_all_tasks(db=counted)
+    assert database.check_counters(engine) == {}
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql("SELECT count(*) FROM task_counters").scalar()
+    assert rows == 0  # emptied pairs are removed, not left at zero
+
+
+def test_check_counters_reports_drift_and_rebuild_repairs_it(counted, engine):
+    database.rebuild_counters(engine)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP TRIGGER task_counters_insert")
+        conn.exec_driver_sql(
+            "INSERT INTO task (content, priority, category, is_done, created_at) "
+            "VALUES ('sneaky', 1, 'home', 0, '2026-01-01 00:00:00.000000')"
+        )
+        conn.exec_driver_sql("UPDATE task_counters SET n = 7 WHERE category = 'work'")
+
+    assert database.check_counters(engine) == {
+        ("home", False): (2, 3),
+        ("work", False): (7, 1),
+        ("work", True): (7, 1),
+    }
+
+    database.rebuild_counters(engine)
+    assert database.check_counters(engine) == {}
+    counted.add(Task(content="after", category="home"))  # trigger is back
+    counted.commit()
+    assert database.check_counters(engine) == {}
+
+
+def test_check_counters_requires_counters(session, engine):
+    with pytest.raises(ValueError, match="not enabled"):
+        database.check_counters(engine)
+
+
+def test_drop_counters(counted, engine):
+    assert not database.drop_counters(engine)
+    database.rebuild_counters(engine)
+
+    assert database.drop_counters(engine)
+
+    with engine.connect() as conn:
+        assert not database.counters_enabled(conn)
+        leftovers = conn.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE name LIKE 'task_counters%'"
+        ).all()
+    assert leftovers == []
+    core.add_task(db=counted, task_data=TaskCreate(content="no triggers left"))
+
+
 def test_update_task(session):
     """Test conditional modification tracking logic excluding unmodified properties."""
     task = core.add_task(
@@ -201,8 +553,17 @@ def test_search_tasks(session):
     assert len(results) == 1
     assert results[0].content == "Quarterly report draft"
 
-    # Match multiple (all contain 'e')
-    results = core.search_tasks(db=session, phrase="e")
+    # Substring match across words
+    results = core.search_tasks(db=session, phrase="quarterly rep")
+    assert len(results) == 1
+    assert results[0].content == "Quarterly report draft"
+
+    # The default trigram index matches inside words...
+    results = core.search_tasks(db=session, phrase="itch")
+    assert len(results) == 1
+
+    # ...and a phrase too short for it falls back to a substring scan
+    results = core.search_tasks(db=session, phrase=" ")
     assert len(results) == 3
 
     # Match none
@@ -228,6 +589,698 @@ def test_search_tasks_mixed_case(session):
     assert len(results) == 1
 
 
+def test_search_tasks_trigram_matches_substrings(session):
+    """The default trigram index matches substrings, like the old LIKE search."""
+    core.add_task(db=session, task_data=TaskCreate(content="Clean the kitchen"))
+    core.add_task(db=session, task_data=TaskCreate(content="Buy groceries"))
+    core.add_task(db=session, task_data=TaskCreate(content="Quarterly report draft"))
+
+    assert database.get_search_tokenizer(session.connection()) == "trigram"
+
+    assert [t.content for t in core.search_tasks(db=session, phrase="ITCH")] == [
+        "Clean the kitchen"
+    ]
+    assert [t.content for t in core.search_tasks(db=session, phrase="roc")] == [
+        "Buy groceries"
+    ]
+    assert len(core.search_tasks(db=session, phrase="t d")) == 1
+    # Under three characters the trigram index can't answer; LIKE does.
+    assert len(core.search_tasks(db=session, phrase="e")) == 3
+
+
+@pytest.mark.parametrize("tokenizer", database.SEARCH_TOKENIZERS)
+@pytest.mark.parametrize(
+    ("phrase", "expected"),
+    [
+        ("c++", ["Learn c++ templates"]),
+        ("C++ T", ["Learn c++ templates"]),
+        ("e-mail", ["Answer e-mail"]),
+        ("naïve", ["naïve café"]),
+        ("café", ["naïve café"]),
+    ],
+)
+def test_search_tasks_match_only_tasks_containing_the_phrase(
+    session, engine, tokenizer, phrase, expected
+):
+    """Characters an index drops never widen a search to other tasks."""
+    contents = ("naïve café", "cafe", "Learn c++ templates", "Answer e-mail", "email")
+    for content in contents:
+        core.add_task(db=session, task_data=TaskCreate(content=content))
+    database.rebuild_search_index(tokenizer, engine=engine)
+
+    results = core.search_tasks(db=session, phrase=phrase)
+
+    assert [t.content for t in results] == expected
+
+
+def test_search_hits_rank_by_relevance_and_limit(session):
+    """Denser matches rank first; limit keeps the top N."""
+    core.add_task(
+        db=session, task_data=TaskCreate(content="Budget review for the team")
+    )
+    core.add_task(db=session, task_data=TaskCreate(content="Budget budget budget"))
+    core.add_task(db=session, task_data=TaskCreate(content="Unrelated chore"))
+
+    hits = core.search_hits(db=session, phrase="budget")
+    assert [h.task.content for h in hits] == [
+        "Budget budget budget",
+        "Budget review for the team",
+    ]
+    assert hits[0].score is not None
+    assert hits[1].score is not None
+    assert hits[0].score > hits[1].score
+
+    top = core.search_tasks(db=session, phrase="budget", limit=1)
+    assert [t.content for t in top] == ["Budget budget budget"]
+
+
+def test_search_hits_report_match_spans(session, engine):
+    """Spans come from the index: substrings by default, words for unicode61."""
+    core.add_task(db=session, task_data=TaskCreate(content="Buy groceries, groceries"))
+
+    [hit] = core.search_hits(db=session, phrase="ROC")
+    assert hit.spans == ((5, 8), (16, 19))
+
+    database.rebuild_search_index("unicode61", engine=engine)
+    [hit] = core.search_hits(db=session, phrase="groc")
+    assert hit.spans == ((4, 13), (15, 24))
+
+
+def test_search_hits_fallback_has_spans_but_no_score(session):
+    """The LIKE fallback still reports spans, but has no relevance score."""
+    core.add_task(db=session, task_data=TaskCreate(content="a + b + c"))
+
+    [hit] = core.search_hits(db=session, phrase="+")
+    assert hit.score is None
+    assert hit.spans == ((2, 3), (6, 7))
+
+
+def test_search_hits_content_containing_sentinels(session):
+    """Content with the highlight sentinels falls back to a substring scan."""
+    core.add_task(db=session, task_data=TaskCreate(content="odd \x02 memo"))
+
+    [hit] = core.search_hits(db=session, phrase="memo")
+    assert hit.spans == ((6, 10),)
+
+
+def test_search_tasks_without_index_falls_back_to_like(session):
+    """A database that predates the search index still searches by substring."""
+    core.add_task(db=session, task_data=TaskCreate(content="Clean the kitchen"))
+    session.connection().exec_driver_sql("DROP TABLE task_fts")
+
+    results = core.search_tasks(db=session, phrase="itch")
+    assert [t.content for t in results] == ["Clean the kitchen"]
+
+
+@pytest.mark.parametrize("sort_by", [None, *core.VALID_SORT_FIELDS])
+@pytest.mark.parametrize("fields", [core.LABEL_FIELDS, ("created_at", "id")])
+def test_list_tasks_fields_project_each_task(session, sort_by, fields):
+    """Projected rows hold the same typed values the full tasks do."""
+    _seed_json_parity(session)
+
+    rows = core.list_tasks(db=session, sort_by=sort_by, fields=fields)
+
+    assert [tuple(row) for row in rows] == [
+        tuple(getattr(task, name) for name in fields)
+        for task in core.list_tasks(db=session, sort_by=sort_by)
+    ]
+    assert all(row.id == row[fields.index("id")] for row in rows)
+
+
+@pytest.mark.parametrize("phrase", ["buy", "+", "zzz"])
+def test_search_tasks_fields_project_each_match(session, phrase):
+    """Both the ranked search and the substring fallback project."""
+    _seed_json_parity(session)
+    core.add_task(db=session, task_data=TaskCreate(content="Buy a + b"))
+
+    rows = core.search_tasks(db=session, phrase=phrase, fields=("id", "is_done"))
+
+    assert [tuple(row) for row in rows] == [
+        (task.id, task.is_done) for task in core.search_tasks(db=session, phrase=phrase)
+    ]
+
+
+@pytest.mark.parametrize("fields", [(), ("id", "bogus")])
+def test_unknown_fields_are_rejected(session, fields):
+    with pytest.raises(ValueError, match="Invalid task fields"):
+        core.list_tasks(db=session, fields=fields)
+    with pytest.raises(ValueError, match="Invalid task fields"):
+        core.search_tasks(db=session, phrase="x", fields=fields)
+
+
+def test_search_index_follows_updates_and_deletes(session):
+    """Triggers keep the search index in step with content changes."""
+    task = core.add_task(db=session, task_data=TaskCreate(content="Draft memo"))
+    assert task.id is not None
+
+    core.update_task(db=session, task_id=task.id, data=TaskUpdate(content="Send fax"))
+    assert core.search_tasks(db=session, phrase="memo") == []
+    assert [t.id for t in core.search_tasks(db=session, phrase="fax")] == [task.id]
+
+    core.delete_task(db=session, task_id=task.id)
+    assert core.search_tasks(db=session, phrase="fax") == []
+
+
+def test_rebuild_search_index_repairs_drift(session, engine):
+    """Rows the triggers never saw become searchable after a rebuild."""
+    conn = session.connection()
+    conn.exec_driver_sql("DROP TRIGGER task_fts_insert")
+    conn.exec_driver_sql(
+        "INSERT INTO task (content, priority, category, is_done, created_at) "
+        "VALUES ('Hidden row', 1, 'general', 0, '2026-01-01 00:00:00')"
+    )
+    session.commit()
+    assert core.search_tasks(db=session, phrase="hidden") == []
+
+    # No tokenizer given: the index keeps the one it already had.
+    assert database.rebuild_search_index(engine=engine) == (
+        database.DEFAULT_SEARCH_TOKENIZER
+    )
+
+    assert len(core.search_tasks(db=session, phrase="hidden")) == 1
+
+
+def test_search_without_fts5_scans_and_reindex_adds_the_index(
+    session, engine, monkeypatch
+):
+    """Without FTS5 the migration skips the index and search scans instead."""
+    session.close()
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP TABLE task_fts")
+        for trigger in ("insert", "delete", "update"):
+            conn.exec_driver_sql(f"DROP TRIGGER task_fts_{trigger}")
+        conn.exec_driver_sql("PRAGMA user_version = 2")
+    monkeypatch.setattr(database, "_has_fts5", lambda conn: False)
+
+    assert database.migrate(engine) == 1
+    core.add_task(db=session, task_data=TaskCreate(content="Clean the kitchen"))
+    assert [t.content for t in core.search_tasks(db=session, phrase="itch")] == [
+        "Clean the kitchen"
+    ]
+    with pytest.raises(ValueError, match="has no FTS5"):
+        database.rebuild_search_index(engine=engine)
+
+    monkeypatch.undo()
+    database.rebuild_search_index(engine=engine)
+    core.add_task(db=session, task_data=TaskCreate(content="Kitchen rota"))
+    hits = core.search_hits(db=session, phrase="itch")
+    assert sorted(h.task.content for h in hits) == ["Clean the kitchen", "Kitchen rota"]
+    assert all(h.score is not None for h in hits)
+
+
+def test_rebuild_search_index_rejects_unknown_tokenizer(engine):
+    with pytest.raises(ValueError, match="Invalid tokenizer"):
+        database.rebuild_search_index("porter", engine=engine)
+
+
+def _seed_json_parity(session):
+    """Tasks exercising every JSON encoding path, with ties on each sort key."""
+    for content, priority, category in [
+        ('Buy "oat" milk', 2, "home"),
+        ("Back\\slash and café ☕", 2, "work"),
+        ("Buy stamps", 1, "work"),
+        ("Sentinel \x02 inside", 3, "home"),
+    ]:
+        core.add_task(
+            db=session,
+            task_data=TaskCreate(content=content, priority=priority, category=category),
+        )
+    core.update_task(db=session, task_id=1, data=TaskUpdate(is_done=True))
+    # Timestamps SQLAlchemy didn't write: no fraction, an all-zero fraction,
+    # and an explicit offset. The ORM still parses each of them.
+    session.connection().exec_driver_sql(
+        "INSERT INTO task (content, priority, category, is_done, created_at, "
+        "updated_at) VALUES "
+        "('Buy legacy', 1, 'home', 1, '2026-01-01 00:00:00', NULL), "
+        "('Zero fraction', 2, 'work', 0, '2026-01-03 04:05:06.000000', "
+        "'2026-01-02T03:04:05+02:00')"
+    )
+    session.commit()
+
+
+@pytest.mark.parametrize("sort_by", [None, *core.VALID_SORT_FIELDS])
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize(
+    "filters",
+    [{}, {"is_done": True}, {"is_done": False, "category": "WORK "}],
+)
+def test_iter_tasks_json_matches_model_dump(session, filters, sort_by, reverse):
+    """The raw sqlite3 path emits the same values as the ORM + model_dump path.
+
+    ORM-loaded tasks dump keys in SQLAlchemy's population order, which varies
+    between call sites, so the raw path pins `TASK_JSON_KEYS` order instead.
+    """
+    _seed_json_parity(session)
+    session.expire_all()
+
+    expected = [
+        task.model_dump(mode="json")
+        for task in core.list_tasks(
+            db=session, sort_by=sort_by, reverse=reverse, **filters
+        )
+    ]
+    encoded = list(
+        core.iter_tasks_json(session, sort_by=sort_by, reverse=reverse, **filters)
+    )
+
+    assert [json.loads(item) for item in encoded] == expected
+    # Same bytes as json.dumps once keys are in the fixed column order.
+    assert encoded == [
+        json.dumps({key: task[key] for key in TASK_JSON_KEYS}) for task in expected
+    ]
+
+
+def _seed_paging(session):
+    """Tasks with ties on every sort key, so only the id tiebreak orders them."""
+    session.connection().exec_driver_sql(
+        "INSERT INTO task (content, priority, category, is_done, created_at) "
+        "VALUES (?, ?, ?, ?, '2026-01-01 00:00:00.000000')",
+        [
+            (f"Task {i}", i % 3 + 1, ("home", "work")[i % 2], i % 5 == 0)
+            for i in range(23)
+        ],
+    )
+    session.commit()
+
+
+@pytest.mark.parametrize("sort_by", [None, *core.VALID_SORT_FIELDS])
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {"is_done": False},
+        {"category": "work"},
+        {"is_done": True, "category": "home"},
+    ],
+)
+def test_list_tasks_pages_match_the_full_listing(session, filters, sort_by, reverse):
+    """Paging visits every task exactly once, in the order of a full page."""
+    _seed_paging(session)
+    listing = {"sort_by": sort_by, "reverse": reverse, **filters}
+    expected = [task.id for task in core.list_tasks(db=session, **listing)]
+
+    seen, json_seen, cursor, json_cursor = [], [], None, None
+    while True:
+        page = core.list_tasks_page(session, **listing, limit=4, after=cursor)
+        json_page = core.tasks_page_json(session, **listing, limit=4, after=json_cursor)
+        assert 0 < len(page.items) <= 4 or not expected
+        seen += [task.id for task in page.items]
+        json_seen += [json.loads(item)["id"] for item in json_page.items]
+        assert json_page.next_cursor == page.next_cursor
+        cursor = json_cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == json_seen == expected
+
+
+def test_list_tasks_order_is_total(session):
+    """On a page, ties in the sort field fall back to creation order, then id."""
+    _seed_paging(session)
+
+    tasks = core.list_tasks(db=session, sort_by="priority", reverse=True)
+
+    assert [(t.priority, t.id) for t in tasks] == sorted(
+        ((t.priority, t.id) for t in tasks), reverse=True
+    )
+
+
+def test_list_tasks_after_cursor_survives_writes(session):
+    _seed_paging(session)
+    first = core.list_tasks_page(session, sort_by="date", limit=5)
+    core.delete_task(db=session, task_id=first.items[-1].id)
+    core.add_task(db=session, task_data=TaskCreate(content="Newest"))
+
+    rest = core.list_tasks(db=session, sort_by="date", after=first.next_cursor)
+
+    assert [t.id for t in rest] == [*range(6, 24), 24]
+
+
+def test_page_cursor_from_task_and_row_agree(session):
+    _seed_paging(session)
+    [task] = core.list_tasks(db=session, limit=1)
+    [row] = core.iter_task_rows(session, limit=1)
+
+    for sort_by in core.VALID_SORT_FIELDS:
+        assert core.page_cursor(task, sort_by=sort_by) == core.page_cursor(
+            row, sort_by=sort_by
+        )
+
+
+def test_page_cursor_reads_aware_timestamps_as_utc():
+    naive = Task(
+        id=1,
+        content="x",
+        created_at=datetime(2026, 1, 1, 12, tzinfo=UTC).replace(tzinfo=None),
+    )
+    aware = Task(
+        id=1,
+        content="x",
+        created_at=datetime(2026, 1, 1, 14, tzinfo=timezone(timedelta(hours=2))),
+    )
+
+    assert core.page_cursor(naive, sort_by="date") == core.page_cursor(
+        aware, sort_by="date"
+    )
+
+
+@pytest.mark.parametrize("cursor", ["!!", "bm90IGpzb24", "WzFd"])
+def test_list_tasks_rejects_malformed_cursors(session, cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        core.list_tasks(db=session, after=cursor)
+
+
+@pytest.mark.parametrize(
+    "listing",
+    [
+        {"sort_by": "priority"},
+        {"sort_by": "date", "reverse": True},
+        {"is_done": True},
+        {"category": "home"},
+    ],
+)
+def test_list_tasks_rejects_cursors_for_another_listing(session, listing):
+    _seed_paging(session)
+    listed = {"sort_by": "date", "category": "work"}
+    cursor = core.list_tasks_page(session, **listed, limit=1).next_cursor
+
+    with pytest.raises(ValueError, match="different sort order or filter"):
+        core.list_tasks(db=session, after=cursor, **listing)
+
+
+def test_list_tasks_cursor_ignores_equivalent_listing_differences(session):
+    """Category case and `reverse` without a sort don't change the listing."""
+    _seed_paging(session)
+    first, *others = core.list_tasks(db=session, category="work")
+    cursor = core.page_cursor(first, category="work")
+
+    rest = core.list_tasks(db=session, category=" Work ", reverse=True, after=cursor)
+
+    assert rest == others
+
+
+def test_unpaged_listing_keeps_id_order(session):
+    """Without a sort or cursor, tasks list by id whatever the filters."""
+    for content in ("first", "second", "third"):
+        core.add_task(db=session, task_data=TaskCreate(content=content, category="w"))
+    core.update_task(db=session, task_id=1, data=TaskUpdate(is_done=True))
+
+    by_category = core.list_tasks(db=session, category="w")
+    reversed_ = core.list_tasks(db=session, reverse=True)
+
+    assert [t.id for t in by_category] == [t.id for t in reversed_] == [1, 2, 3]
+
+
+def test_list_tasks_page_without_limit_is_the_last_page(session):
+    _seed_paging(session)
+
+    page = core.list_tasks_page(session, limit=None)
+
+    assert len(page.items) == 23
+    assert page.next_cursor is None
+
+
+def test_iter_task_pages_fetches_each_page_on_demand(session, monkeypatch):
+    _seed_paging(session)
+    fetched = []
+    list_page = core.list_tasks_page
+    monkeypatch.setattr(
+        core,
+        "list_tasks_page",
+        lambda *args, **kwargs: (
+            fetched.append(kwargs["after"]) or list_page(*args, **kwargs)
+        ),
+    )
+
+    pages = core.iter_task_pages(session, sort_by="priority", size=10)
+    first = next(pages)
+
+    assert len(fetched) == 1
+    rest = list(pages)
+    assert [len(page.items) for page in [first, *rest]] == [10, 10, 3]
+    assert [page.next_cursor is None for page in rest] == [False, True]
+    assert [task.id for page in [first, *rest] for task in page.items] == [
+        task.id for task in core.list_tasks(db=session, sort_by="priority")
+    ]
+
+
+def test_iter_task_pages_empty_and_invalid(session):
+    assert list(core.iter_task_pages(session, size=10)) == []
+    with pytest.raises(ValueError, match="Invalid sort field"):
+        core.iter_task_pages(session, sort_by="bogus", size=10)
+
+
+def test_max_task_id(session):
+    assert core.max_task_id(session) == 0
+    _seed_paging(session)
+    core.delete_task(db=session, task_id=1)
+
+    assert core.max_task_id(session) == 23
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("sort_by", [None, *core.VALID_SORT_FIELDS])
+@pytest.mark.parametrize("filters", LIST_FILTERS)
+def test_later_pages_seek_the_index(session, filters, sort_by, reverse):
+    """A cursor becomes an index range, so page N costs what page 1 does."""
+    _seed_paging(session)
+    [row] = core.iter_task_rows(
+        session, sort_by=sort_by, reverse=reverse, limit=1, **filters
+    )
+    cursor = core.page_cursor(row, sort_by=sort_by, reverse=reverse, **filters)
+    statement = core._select_tasks(
+        sort_by=sort_by, reverse=reverse, limit=10, after=cursor, **filters
+    )
+
+    plan = " | ".join(_query_plan(session, statement))
+
+    assert "USE TEMP B-TREE" not in plan
+    assert "SEARCH" in plan
+
+
+def test_task_fields_read_like_the_json_values(session):
+    _seed_json_parity(session)
+
+    def as_text(value):
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        return "" if value is None else str(value)
+
+    rows = core.iter_task_rows(session)
+    for row, encoded in zip(rows, core.iter_tasks_json(session), strict=True):
+        values = json.loads(encoded)
+        assert core.task_fields(row) == tuple(
+            as_text(values[name]) for name in core.TASK_COLUMNS
+        )
+
+
+def test_iter_search_rows_follow_search_hits(session):
+    _seed_json_parity(session)
+
+    rows = core.iter_search_rows(session, "buy", limit=2)
+
+    assert [row[3] for row in rows] == [
+        hit.task.id for hit in core.search_hits(db=session, phrase="buy", limit=2)
+    ]
+
+
+def test_iter_task_rows_are_plain_tuples_in_column_order(session):
+    task = core.add_task(db=session, task_data=TaskCreate(content="Row"))
+
+    [row] = core.iter_task_rows(session)
+
+    assert dict(zip(core.TASK_COLUMNS, row, strict=True))["id"] == task.id
+    assert tuple(Task.model_fields) == core.TASK_COLUMNS
+
+
+@pytest.mark.parametrize("sort_by", [None, *core.VALID_SORT_FIELDS])
+@pytest.mark.parametrize(
+    "filters", [{}, {"is_done": True}, {"category": "work", "limit": 2}]
+)
+def test_list_task_rows_equal_list_tasks(session, filters, sort_by):
+    """TaskRows hold the values, and dump the JSON, of the ORM-loaded tasks."""
+    _seed_json_parity(session)
+    session.expire_all()
+    tasks = core.list_tasks(db=session, sort_by=sort_by, **filters)
+
+    rows = core.list_task_rows(session, sort_by=sort_by, **filters)
+
+    assert rows == [
+        tuple(getattr(task, name) for name in core.TASK_COLUMNS) for task in tasks
+    ]
+    assert [row.model_dump() for row in rows] == [task.model_dump() for task in tasks]
+    assert [row.model_dump(mode="json") for row in rows] == [
+        task.model_dump(mode="json") for task in tasks
+    ]
+
+
+def test_get_task_row(session):
+    _seed_json_parity(session)
+    session.expire_all()
+
+    for task_id in (1, 5, 6):
+        row = core.get_task_row(session, task_id)
+        assert row is not None
+        assert row.model_dump() == core.get_task(session, task_id).model_dump()
+    assert core.get_task_row(session, 99) is None
+
+
+def test_list_tasks_page_of_rows_pages_like_tasks(session):
+    _seed_paging(session)
+
+    pages = list(core.iter_task_pages(session, sort_by="priority", size=10, rows=True))
+
+    assert all(isinstance(task, TaskRow) for page in pages for task in page.items)
+    assert [task.id for page in pages for task in page.items] == [
+        task.id for task in core.list_tasks(db=session, sort_by="priority")
+    ]
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [{}, {"is_done": False}, {"is_done": True}, {"category": "work"}, {"limit": 3}],
+)
+def test_iter_task_choices_project_list_tasks(session, filters):
+    """Picker rows carry just the label columns of the tasks `list_tasks` returns."""
+    for i in range(8):
+        core.add_task(
+            db=session,
+            task_data=TaskCreate(
+                content=f"Task {i}", category="work" if i % 2 else "home"
+            ),
+        )
+        if i % 3 == 0:
+            core.update_task(db=session, task_id=i + 1, data=TaskUpdate(is_done=True))
+
+    rows = list(core.iter_task_choices(session, **filters))
+
+    assert rows == [
+        tuple(row)
+        for row in core.list_tasks(db=session, **filters, fields=core.LABEL_FIELDS)
+    ]
+
+
+@pytest.mark.parametrize("sort_by", [None, *core.VALID_SORT_FIELDS])
+@pytest.mark.parametrize("batch_size", [1, 2, 1000])
+def test_iter_tasks_follow_list_tasks_detached(session, sort_by, batch_size):
+    """Batched tasks equal the listed ones and leave the identity map empty."""
+    _seed_json_parity(session)
+    expected = [t.model_dump() for t in core.list_tasks(db=session, sort_by=sort_by)]
+    session.expunge_all()
+
+    tasks = core.iter_tasks(session, sort_by=sort_by, batch_size=batch_size)
+
+    assert [t.model_dump() for t in tasks] == expected
+    assert len(session.identity_map) == 0
+
+
+def test_iter_tasks_leave_already_loaded_tasks_attached(session):
+    _seed_json_parity(session)
+    session.expunge_all()
+    loaded = core.get_task(db=session, task_id=2)
+
+    assert [t.id for t in core.iter_tasks(session)][:3] == [1, 2, 3]
+
+    assert loaded in session
+    assert list(session.identity_map.values()) == [loaded]
+
+
+def test_iter_tasks_by_category_group_each_ordering(session):
+    _seed_json_parity(session)
+
+    tasks = list(core.iter_tasks(session, sort_by="priority", by_category=True))
+
+    assert tasks == sorted(
+        core.list_tasks(db=session, sort_by="priority"), key=lambda t: t.category
+    )
+
+
+def test_iter_tasks_stopped_early_release_the_cursor(session):
+    _seed_json_parity(session)
+    tasks = core.iter_tasks(session, batch_size=1)
+
+    assert next(tasks).id == 1
+    tasks.close()
+
+    core.add_task(db=session, task_data=TaskCreate(content="Still writable"))
+
+
+def test_iter_tasks_fields_stream_projected_rows(session):
+    _seed_json_parity(session)
+
+    rows = core.iter_tasks(session, sort_by="date", batch_size=2, fields=("id",))
+
+    assert [tuple(row) for row in rows] == [
+        (t.id,) for t in core.list_tasks(db=session, sort_by="date")
+    ]
+
+
+def test_iter_tasks_memory_stays_bounded(session):
+    """Only a batch of tasks is alive at once, not the whole result."""
+    core.add_tasks_many(
+        db=session,
+        tasks=(TaskCreate(content=f"Task {i} " + "x" * 100) for i in range(20_000)),
+    )
+    session.expunge_all()
+
+    tracemalloc.start()
+    try:
+        count = sum(1 for _ in core.iter_tasks(session, batch_size=100))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert count == 20_000
+    # `list_tasks` peaks around 30 MB here.
+    assert peak < 2 * 1024 * 1024
+
+
+def test_iter_tasks_invalid_sort_raises_eagerly(session):
+    with pytest.raises(ValueError, match="Invalid sort field"):
+        core.iter_tasks(session, sort_by="bogus")
+
+
+@pytest.mark.parametrize(("phrase", "limit"), [("buy", None), ("buy", 1), ("+", None)])
+def test_iter_search_follows_search_tasks(session, phrase, limit):
+    _seed_json_parity(session)
+    core.add_task(db=session, task_data=TaskCreate(content="Buy a + b"))
+    expected = [t.id for t in core.search_tasks(db=session, phrase=phrase, limit=limit)]
+    session.expunge_all()
+
+    tasks = core.iter_search(session, phrase, limit=limit, batch_size=1)
+
+    assert [t.id for t in tasks] == expected
+    assert len(session.identity_map) == 0
+
+
+def test_iter_task_rows_invalid_sort_raises_eagerly(session):
+    with pytest.raises(ValueError, match="Invalid sort field"):
+        core.iter_task_rows(session, sort_by="bogus")
+
+
+@pytest.mark.parametrize(
+    ("phrase", "limit"),
+    [("buy", None), ("buy", 1), ("caf", None), ("☕", None), ("zzz", None)],
+)
+def test_iter_search_json_matches_search_hits(session, phrase, limit):
+    """Ranked and fallback searches match the ORM-built JSON byte for byte."""
+    _seed_json_parity(session)
+    session.expire_all()
+
+    expected = [
+        {
+            **{key: hit.task.model_dump(mode="json")[key] for key in TASK_JSON_KEYS},
+            "score": hit.score,
+            "matches": [list(span) for span in hit.spans],
+        }
+        for hit in core.search_hits(db=session, phrase=phrase, limit=limit)
+    ]
+
+    encoded = list(core.iter_search_json(session, phrase, limit=limit))
+    assert encoded == [json.dumps(item) for item in expected]
+
+
 def test_delete_completed_tasks(session):
     """Test dropping only records marked as done."""
     t1 = core.add_task(db=session, task_data=TaskCreate(content="Dummy task 1"))
@@ -335,6 +1388,72 @@ def test_export_tasks_defaults_to_stdout(session, monkeypatch):
     assert len(data) == 1
 
 
+@pytest.mark.parametrize("pretty", [False, True])
+@pytest.mark.parametrize("filters", [{}, {"is_done": True}, {"category": "nothing"}])
+def test_export_tasks_matches_json_dump(session, tmp_path, pretty, filters):
+    """Streamed export writes what json.dump of the dumped tasks wrote."""
+    _seed_json_parity(session)
+    session.expire_all()
+
+    tasks = core.list_tasks(db=session, **filters)
+    expected = json.dumps(
+        [
+            {key: task.model_dump(mode="json")[key] for key in TASK_JSON_KEYS}
+            for task in tasks
+        ],
+        indent=2 if pretty else None,
+    )
+    export_file = tmp_path / "export.json"
+    captured_output = io.StringIO()
+
+    assert core.export_tasks(
+        db=session, path=export_file, pretty=pretty, **filters
+    ) == len(tasks)
+    core.export_tasks(db=session, pretty=pretty, output=captured_output, **filters)
+
+    assert export_file.read_text(encoding="utf-8") == expected
+    assert captured_output.getvalue() == expected + "\n"
+
+
+def test_export_tasks_ndjson_writes_one_task_per_line(session, tmp_path):
+    _seed_json_parity(session)
+    export_file = tmp_path / "export.ndjson"
+    captured_output = io.StringIO()
+
+    count = core.export_tasks(db=session, path=export_file, ndjson=True)
+    core.export_tasks(db=session, output=captured_output, ndjson=True)
+
+    expected = "".join(f"{item}\n" for item in core.iter_tasks_json(session))
+    assert count == len(expected.splitlines())
+    assert export_file.read_text(encoding="utf-8") == expected
+    assert captured_output.getvalue() == expected
+
+
+def test_export_tasks_ndjson_cannot_be_pretty(session):
+    with pytest.raises(ValueError, match="cannot be pretty-printed"):
+        core.export_tasks(db=session, pretty=True, ndjson=True)
+
+
+def test_export_tasks_memory_stays_bounded(session, tmp_path):
+    """Rows are written as they are fetched, not collected first."""
+    core.add_tasks_many(
+        db=session,
+        tasks=(TaskCreate(content=f"Task {i} " + "x" * 100) for i in range(20_000)),
+    )
+    export_file = tmp_path / "export.json"
+
+    tracemalloc.start()
+    try:
+        count = core.export_tasks(db=session, path=export_file)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert count == 20_000
+    # Against a 4 MB file and ~60 MB of dumped task dicts.
+    assert peak < 1024 * 1024
+
+
 def test_import_tasks(session, tmp_path):
     """Test importing tasks from a JSON file."""
     import_file = tmp_path / "import.json"
@@ -410,6 +1529,95 @@ def test_import_tasks_ignores_unknown_fields(session, tmp_path):
     assert not hasattr(tasks[0], "unexpected_field")
 
 
+@pytest.mark.parametrize("ndjson", [False, True])
+def test_import_tasks_round_trips_export(session, tmp_path, monkeypatch, ndjson):
+    """Status and timestamps survive export -> import unchanged."""
+    monkeypatch.setattr(core, "INSERT_BATCH_SIZE", 2)
+    for i in range(5):
+        core.add_task(db=session, task_data=TaskCreate(content=f"Task {i}"))
+    core.update_task(db=session, task_id=2, data=TaskUpdate(is_done=True))
+    export_file = tmp_path / "export.json"
+    core.export_tasks(db=session, path=export_file, ndjson=ndjson)
+    before = [t.model_dump() for t in core.list_tasks(db=session)]
+
+    assert (
+        core.import_tasks(db=session, path=export_file, clear=True, ndjson=ndjson) == 5
+    )
+
+    after = [t.model_dump() for t in core.list_tasks(db=session)]
+    for task in before + after:
+        del task["id"]
+    assert after == before
+    assert after[1]["is_done"] is True
+    assert after[1]["updated_at"] is not None
+
+
+def test_import_tasks_naive_timestamps_are_utc(session, tmp_path):
+    import_file = tmp_path / "import.json"
+    import_file.write_text(
+        json.dumps([{"content": "Old", "created_at": "2020-05-01T12:30:00"}])
+    )
+
+    core.import_tasks(db=session, path=import_file)
+
+    [task] = core.list_tasks(db=session)
+    assert task.created_at == datetime(2020, 5, 1, 12, 30, tzinfo=UTC)
+    assert task.updated_at is None
+
+
+@pytest.mark.parametrize(
+    "bad_item",
+    [{"content": "Bad", "is_done": "maybe"}, {"content": "Bad", "priority": 9}],
+)
+def test_import_tasks_failure_rolls_back_clear_and_batches(
+    session, tmp_path, monkeypatch, bad_item
+):
+    """A bad item late in the file leaves the database exactly as it was."""
+    monkeypatch.setattr(core, "INSERT_BATCH_SIZE", 2)
+    core.add_task(db=session, task_data=TaskCreate(content="Survivor"))
+    import_file = tmp_path / "import.json"
+    items = [{"content": f"Item {i}"} for i in range(5)]
+    import_file.write_text(json.dumps([*items, bad_item]))
+
+    with pytest.raises(ValueError, match="validation error"):
+        core.import_tasks(db=session, path=import_file, clear=True)
+
+    assert [t.content for t in core.list_tasks(db=session)] == ["Survivor"]
+
+
+def test_import_tasks_malformed_tail_rolls_back(session, tmp_path, monkeypatch):
+    """Batches already inserted from a streamed file are undone on a late error."""
+    monkeypatch.setattr(core, "INSERT_BATCH_SIZE", 2)
+    import_file = tmp_path / "import.json"
+    items = ", ".join(json.dumps({"content": f"Item {i}"}) for i in range(5))
+    import_file.write_text(f"[{items}, {{oops}}]")
+
+    with pytest.raises(ValueError, match="line 1 column"):
+        core.import_tasks(db=session, path=import_file)
+
+    assert core.list_tasks(db=session) == []
+
+
+@pytest.mark.parametrize(
+    ("generate", "write"),
+    [
+        (core.generate_markdown_report, core.write_markdown_report),
+        (core.generate_html_report, core.write_html_report),
+    ],
+)
+@pytest.mark.parametrize("sort_by", [None, "priority"])
+def test_streamed_reports_match_generated_ones(session, generate, write, sort_by):
+    """Writing category-grouped tasks as they stream gives the same report."""
+    _seed_json_parity(session)
+    tasks = core.list_tasks(db=session, sort_by=sort_by)
+    stream = io.StringIO()
+
+    write(stream, core.iter_tasks(session, sort_by=sort_by, by_category=True))
+
+    strip = re.compile(r"Generated: [^<*]*")
+    assert strip.sub("", stream.getvalue()) == strip.sub("", generate(tasks))
+
+
 def test_generate_markdown_report():
     """Test generating a markdown formatted report string."""
     tasks = [
@@ -0,0 +1,328 @@
+"""Tests for the opt-in command daemon in `odot._daemon`."""
+
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from odot import _daemon, core
+from odot.models import TaskCreate
+
+
+@pytest.fixture(name="db_path")
+def db_path_fixture(tmp_path, monkeypatch):
+    """Point ODOT_DB_PATH at an existing file so no auto-init notice is printed."""
+    db_path = tmp_path / "db.sqlite"
+    db_path.touch()
+    monkeypatch.setenv("ODOT_DB_PATH", str(db_path))
+    return db_path
+
+
+@pytest.fixture(name="daemon")
+def daemon_fixture(session, db_path):  # migrated schema + isolated socket path
+    """Run a daemon on a background thread and yield its socket path."""
+    path = _daemon.socket_path()
+    server = _daemon.make_server(path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield path
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def run(argv: list[str], path: Path) -> tuple[int | None, str, str]:
+    """Forward argv to the daemon at path, capturing its output."""
+    out, err = io.StringIO(), io.StringIO()
+    code = _daemon.forward(argv, path=path, stdout=out, stderr=err)
+    return code, out.getvalue(), err.getvalue()
+
+
+def test_socket_path_sits_next_to_database(db_path):
+    assert _daemon.socket_path() == db_path.with_name("db.sock")
+
+
+class TestShouldForward:
+    @pytest.fixture(autouse=True)
+    def _non_interactive(self, monkeypatch):
+        monkeypatch.delenv(_daemon.NO_DAEMON_ENV, raising=False)
+        monkeypatch.setattr("sys.stdin", io.StringIO())
+        monkeypatch.setattr("sys.stdout", io.StringIO())
+
+    def test_scripted_calls_are_forwarded(self):
+        assert _daemon.should_forward(["count", "--json"])
+
+    def test_terminal_on_stdin_runs_in_process(self, monkeypatch):
+        monkeypatch.setattr("sys.stdin.isatty", lambda: True)
+        assert not _daemon.should_forward(["count"])
+
+    def test_terminal_on_stdout_runs_in_process(self, monkeypatch):
+        monkeypatch.setattr("sys.stdout.isatty", lambda: True)
+        assert not _daemon.should_forward(["count"])
+
+    def test_env_opt_out(self, monkeypatch):
+        monkeypatch.setenv(_daemon.NO_DAEMON_ENV, "1")
+        assert not _daemon.should_forward(["count"])
+
+    def test_daemon_command_is_never_forwarded(self):
+        assert not _daemon.should_forward(["daemon"])
+
+    def test_stdin_input_is_never_forwarded(self):
+        assert not _daemon.should_forward(["add", "-", "-c", "work"])
+
+    def test_piped_stdin_runs_in_process(self, monkeypatch):
+        """`echo y | odot clean > log`: the answer is on a pipe."""
+        read_end, write_end = os.pipe()
+        os.close(write_end)
+        with os.fdopen(read_end) as stdin:
+            monkeypatch.setattr("sys.stdin", stdin)
+            assert not _daemon.should_forward(["clean"])
+
+    def test_file_with_data_on_stdin_runs_in_process(self, monkeypatch, tmp_path):
+        path = tmp_path / "answers"
+        path.write_text("y\n")
+        with path.open() as stdin:
+            monkeypatch.setattr("sys.stdin", stdin)
+            assert not _daemon.should_forward(["clean"])
+            stdin.read()
+            assert _daemon.should_forward(["clean"])
+
+    def test_devnull_or_closed_stdin_is_forwarded(self, monkeypatch):
+        with Path(os.devnull).open() as stdin:
+            monkeypatch.setattr("sys.stdin", stdin)
+            assert _daemon.should_forward(["count"])
+        monkeypatch.setattr("sys.stdin", None)
+        assert _daemon.should_forward(["count"])
+
+
+def test_forward_without_daemon_returns_none(tmp_path):
+    assert _daemon.forward(["count"], path=tmp_path / "missing.sock") is None
+
+
+def test_forward_with_stale_socket_file_returns_none(tmp_path):
+    # A killed daemon leaves its socket behind; nothing accepts on it.
+    stale = tmp_path / "stale.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.bind(str(stale))
+    assert _daemon.forward(["count"], path=stale) is None
+
+
+def test_forwarded_command_streams_stdout_and_exit_code(daemon, session):
+    core.add_task(db=session, task_data=TaskCreate(content="Warm"))
+
+    code, out, err = run(["count", "--json"], daemon)
+
+    assert code == 0
+    assert json.loads(out) == {"total": 1, "pending": 1, "done": 0}
+    assert err == ""
+
+
+def test_forwarded_failure_keeps_stderr_and_exit_code(daemon):
+    code, out, err = run(["--json", "show", "999"], daemon)
+
+    assert code == 1
+    assert out == ""
+    assert "999" in err
+
+
+def test_usage_error_matches_in_process_exit_code(daemon):
+    code, _, err = run(["not-a-real-command"], daemon)
+
+    assert code == 2
+    assert "No such command" in err
+
+
+def test_prompt_aborts_instead_of_blocking(daemon, session):
+    task = core.add_task(db=session, task_data=TaskCreate(content="Keep me"))
+
+    # stdin is empty on the server, so the confirmation sees EOF and aborts.
+    code, out, err = run(["rm", str(task.id)], daemon)
+
+    assert code == 1
+    assert "[y/N]" in out
+    assert "Aborted" in err
+    assert "Traceback" not in err
+    assert core.get_task(db=session, task_id=task.id) is not None
+
+
+def test_frame_writer_refuses_bytes():
+    """Click writes bytes to any stream that accepts ``write(b"")``."""
+    writer = _daemon._FrameWriter(io.BytesIO(), "out")
+    with pytest.raises(TypeError, match="must be str"):
+        writer.write(b"")
+
+
+def test_client_environment_is_applied_to_the_command(daemon, session, monkeypatch):
+    for i in range(3):
+        core.add_task(db=session, task_data=TaskCreate(content=f"Task {i} " * 8))
+    monkeypatch.setenv("COLUMNS", "40")
+
+    code, out, _ = run(["list"], daemon)
+
+    assert code == 0
+    assert max(map(len, out.splitlines())) <= 40
+
+
+def test_client_env_replaces_and_restores_the_daemons(monkeypatch):
+    monkeypatch.setenv("NO_COLOR", "1")
+    monkeypatch.delenv("TZ", raising=False)
+
+    with _daemon.client_env({"TZ": "Asia/Tokyo"}):
+        assert "NO_COLOR" not in os.environ
+        assert os.environ["TZ"] == "Asia/Tokyo"
+        assert time.localtime(0).tm_hour == 9
+
+    assert os.environ["NO_COLOR"] == "1"
+    assert "TZ" not in os.environ
+
+
+@pytest.mark.parametrize("profile", ["bulk", "bogus"])
+def test_other_db_profile_is_declined(daemon, session, monkeypatch, profile):
+    """The warm connections carry the daemon's PRAGMAs, so a call asking for
+    another profile runs in the client instead."""
+    task = core.add_task(db=session, task_data=TaskCreate(content="Keep me"))
+    monkeypatch.setenv("ODOT_DB_PROFILE", profile)
+
+    assert run(["rm", str(task.id), "--force"], daemon) == (None, "", "")
+    assert core.get_task(db=session, task_id=task.id) is not None
+    monkeypatch.setenv("ODOT_DB_PROFILE", "SAFE")
+    assert run(["count", "--json"], daemon)[0] == 0
+
+
+def test_relative_paths_resolve_in_client_cwd(daemon, session, tmp_path, monkeypatch):
+    core.add_task(db=session, task_data=TaskCreate(content="Exported"))
+    client_dir = tmp_path / "client"
+    client_dir.mkdir()
+    monkeypatch.chdir(client_dir)
+
+    code, _, _ = run(["export", "out.json"], daemon)
+
+    assert code == 0
+    assert json.loads((client_dir / "out.json").read_text())[0]["content"] == (
+        "Exported"
+    )
+    assert Path.cwd() == client_dir
+
+
+def test_closed_stdout_pipe_ends_the_call_quietly(daemon, session):
+    """`odot list | head` through the daemon: exit 1, no traceback anywhere."""
+    core.add_tasks_many(
+        db=session, tasks=(TaskCreate(content=f"Task {i}") for i in range(2000))
+    )
+    read_end, write_end = os.pipe()
+    os.close(read_end)
+    err = io.StringIO()
+
+    with os.fdopen(write_end, "w") as out:
+        code = _daemon.forward(
+            ["list", "--format", "tsv"], path=daemon, stdout=out, stderr=err
+        )
+        assert code == 1
+        out.write("flushed at exit")  # now /dev/null, so no second EPIPE
+
+    assert err.getvalue() == ""
+    # The daemon dropped that command and is still serving.
+    assert run(["count", "--json"], daemon)[0] == 0
+
+
+def test_liveness_probe_does_not_disturb_server(daemon):
+    assert _daemon.is_running(daemon)
+    code, _, _ = run(["count", "--json"], daemon)
+    assert code == 0
+
+
+def test_dropped_connection_is_reported_as_failure(tmp_path):
+    class Truncating(socketserver.StreamRequestHandler):
+        def handle(self):
+            self.rfile.readline()
+            self.wfile.write(b'{"out": "partial"}\n')
+
+    path = tmp_path / "drop.sock"
+    server = socketserver.UnixStreamServer(str(path), Truncating)
+    thread = threading.Thread(target=server.handle_request)
+    thread.start()
+
+    code, out, err = run(["count"], path)
+    thread.join()
+    server.server_close()
+
+    assert code == 1
+    assert out == "partial"
+    assert "closed the connection" in err
+
+
+class TestRunCommand:
+    def _run(self, monkeypatch, app) -> tuple[int, str]:
+        monkeypatch.setattr("odot.cli.app", app)
+        err = io.StringIO()
+        code = _daemon.run_command([], io.StringIO(), err)
+        return code, err.getvalue()
+
+    def test_unexpected_exception_exits_one_with_traceback(self, monkeypatch):
+        def boom(**_):
+            raise RuntimeError("kaboom")
+
+        code, err = self._run(monkeypatch, boom)
+        assert code == 1
+        assert "RuntimeError: kaboom" in err
+
+    def test_string_exit_is_printed_and_exits_one(self, monkeypatch):
+        def bail(**_):
+            raise SystemExit("bad state")
+
+        code, err = self._run(monkeypatch, bail)
+        assert code == 1
+        assert err == "bad state\n"
+
+    def test_normal_return_exits_zero(self, monkeypatch):
+        code, _ = self._run(monkeypatch, lambda **_: None)
+        assert code == 0
+
+
+def test_make_server_refuses_when_daemon_running(daemon):
+    with pytest.raises(_daemon.DaemonError, match="already listening"):
+        _daemon.make_server(daemon)
+
+
+def test_make_server_is_owner_only_and_replaces_stale_socket(tmp_path):
+    path = tmp_path / "d.sock"
+    path.write_text("stale")
+    server = _daemon.make_server(path)
+    try:
+        assert path.is_socket()
+        assert path.stat().st_mode & 0o777 == 0o600
+    finally:
+        server.server_close()
+
+
+def test_serve_removes_socket_on_interrupt(tmp_path, monkeypatch):
+    def interrupt(self):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(socketserver.UnixStreamServer, "serve_forever", interrupt)
+    path = tmp_path / "d.sock"
+
+    _daemon.serve(_daemon.make_server(path))
+
+    assert not path.exists()
+
+
+def test_serve_stops_cleanly_on_sigterm(tmp_path, monkeypatch):
+    def terminate(self):
+        os.kill(os.getpid(), signal.SIGTERM)
+
+    monkeypatch.setattr(socketserver.UnixStreamServer, "serve_forever", terminate)
+    previous = signal.getsignal(signal.SIGTERM)
+    path = tmp_path / "d.sock"
+
+    _daemon.serve(_daemon.make_server(path))
+
+    assert not path.exists()
+    assert signal.getsignal(signal.SIGTERM) is previous
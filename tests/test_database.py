@@ -4,7 +4,8 @@ import os
 from pathlib import Path
 
 import pytest
-from sqlmodel import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlmodel import create_engine, select
 
 from odot import database
 
@@ -100,3 +101,302 @@ def test_reset_engine_clears_singleton():
 
     first_engine.dispose()
     second_engine.dispose()
+
+
+@pytest.mark.parametrize("profile", sorted(database.DB_PROFILES))
+def test_engine_applies_pragma_profile(tmp_path, monkeypatch, profile):
+    """Each named profile puts new connections into WAL with its PRAGMAs."""
+    monkeypatch.setenv("ODOT_DB_PATH", str(tmp_path / "db.sqlite"))
+    monkeypatch.setenv("ODOT_DB_PROFILE", profile.upper())
+
+    engine = database.get_engine()
+    expected = database.DB_PROFILES[profile]
+    synchronous_levels = {"OFF": 0, "NORMAL": 1, "FULL": 2}
+    with engine.connect() as conn:
+
+        def pragma(name):
+            return conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+        assert pragma("journal_mode") == "wal"
+        assert pragma("synchronous") == synchronous_levels[expected["synchronous"]]
+        assert pragma("busy_timeout") == expected["busy_timeout"]
+        assert pragma("wal_autocheckpoint") == expected["wal_autocheckpoint"]
+    engine.dispose()
+
+
+def test_db_profile_defaults_to_safe(monkeypatch):
+    """An unset or blank ODOT_DB_PROFILE falls back to the durable profile."""
+    monkeypatch.delenv("ODOT_DB_PROFILE", raising=False)
+    assert database.get_db_profile() == database.DEFAULT_DB_PROFILE == "safe"
+
+    monkeypatch.setenv("ODOT_DB_PROFILE", "  ")
+    assert database.get_db_profile() == "safe"
+
+
+def test_db_profile_rejects_unknown_name(monkeypatch):
+    """A typo in ODOT_DB_PROFILE is an explicit error, not a silent default."""
+    monkeypatch.setenv("ODOT_DB_PROFILE", "turbo")
+    with pytest.raises(ValueError, match="Invalid ODOT_DB_PROFILE"):
+        database.get_db_profile()
+
+
+def _schema(engine):
+    """Return the table/index/trigger names and task columns of a database."""
+    with engine.connect() as conn:
+        objects = set(
+            conn.exec_driver_sql(
+                "SELECT type, name FROM sqlite_master WHERE name NOT LIKE 'sqlite_%'"
+            ).all()
+        )
+        columns = conn.exec_driver_sql("PRAGMA table_info(task)").all()
+    return objects, columns
+
+
+def test_migrate_creates_schema_from_scratch(tmp_path):
+    """A new file is brought straight to SCHEMA_VERSION."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+
+    assert database.get_schema_version(engine) == 0
+    assert database.migrate(engine) == database.SCHEMA_VERSION
+    assert database.get_schema_version(engine) == database.SCHEMA_VERSION
+
+    # A current database is left alone.
+    assert database.migrate(engine) == 0
+    engine.dispose()
+
+
+def test_migrated_schema_matches_model_metadata(tmp_path):
+    """Migrations and SQLModel.metadata must describe the same schema."""
+    from sqlmodel import SQLModel
+
+    from odot.models import Task  # noqa: F401  # registers the table
+
+    migrated = create_engine(f"sqlite:///{tmp_path / 'migrated.sqlite'}")
+    database.migrate(migrated)
+    reference = create_engine(f"sqlite:///{tmp_path / 'reference.sqlite'}")
+    SQLModel.metadata.create_all(reference)
+
+    migrated_objects, migrated_columns = _schema(migrated)
+    reference_objects, reference_columns = _schema(reference)
+    assert reference_objects <= migrated_objects
+    assert {o for o in migrated_objects if o[0] == "index"} == {
+        o for o in reference_objects if o[0] == "index"
+    }
+    assert migrated_columns == reference_columns
+    migrated.dispose()
+    reference.dispose()
+
+
+def test_migrate_upgrades_unversioned_database_in_place(tmp_path):
+    """A pre-versioning database (user_version 0) keeps its rows."""
+    from sqlmodel import Session, SQLModel
+
+    from odot.models import Task
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.sqlite'}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Task(content="legacy row"))
+        session.commit()
+
+    assert database.migrate(engine) == database.SCHEMA_VERSION
+
+    with Session(engine) as session:
+        assert [t.content for t in session.exec(select(Task))] == ["legacy row"]
+    engine.dispose()
+
+
+def test_migrate_rolls_back_a_failing_step(tmp_path, monkeypatch):
+    """A broken step leaves the database at the last good version."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    database.migrate(engine)
+    good_version = database.SCHEMA_VERSION
+
+    broken = (
+        "CREATE TABLE half_applied (id INTEGER)",
+        "THIS IS NOT SQL",
+    )
+    monkeypatch.setattr(database, "MIGRATIONS", (*database.MIGRATIONS, broken))
+    monkeypatch.setattr(database, "SCHEMA_VERSION", good_version + 1)
+
+    with pytest.raises(OperationalError):
+        database.migrate(engine)
+
+    assert database.get_schema_version(engine) == good_version
+    objects, _ = _schema(engine)
+    assert ("table", "half_applied") not in objects
+    engine.dispose()
+
+
+def test_create_db_and_tables_runs_migrations(tmp_path, monkeypatch):
+    """create_db_and_tables leaves a new database fully versioned."""
+    monkeypatch.setenv("ODOT_DB_PATH", str(tmp_path / "db.sqlite"))
+
+    database.create_db_and_tables()
+
+    assert database.get_schema_version() == database.SCHEMA_VERSION
+    database.get_engine().dispose()
+
+
+def _file_engine(path):
+    """Return an engine on a migrated database file at `path`."""
+    engine = create_engine(f"sqlite:///{path}")
+    database.migrate(engine)
+    return engine
+
+
+def _contents(engine):
+    with engine.connect() as conn:
+        return conn.exec_driver_sql("SELECT content FROM task ORDER BY id").all()
+
+
+def _add_rows(engine, *contents):
+    with engine.begin() as conn:
+        for content in contents:
+            conn.exec_driver_sql(
+                "INSERT INTO task (content, priority, category, is_done, created_at) "
+                "VALUES (?, 1, 'general', 0, '2024-01-01 00:00:00.000000')",
+                (content,),
+            )
+
+
+def test_backup_and_restore_round_trip(tmp_path):
+    """A snapshot restores the exact rows, with progress reported per step."""
+    engine = _file_engine(tmp_path / "db.sqlite")
+    _add_rows(engine, *(f"Task {i} " + "x" * 500 for i in range(100)))
+    snapshot = tmp_path / "snap.sqlite"
+    steps = []
+
+    pages = database.backup(
+        snapshot, pages=4, progress=lambda *step: steps.append(step), engine=engine
+    )
+
+    assert steps[-1] == (pages, pages)
+    assert len(steps) == -(-pages // 4)
+    assert not (tmp_path / ".snap.sqlite.partial").exists()
+    before = _contents(engine)
+    _add_rows(engine, "Added after the backup")
+
+    assert database.restore(snapshot, pages=4, engine=engine) == pages
+
+    assert _contents(engine) == before
+    engine.dispose()
+
+
+def test_backup_snapshot_is_a_self_contained_file(tmp_path):
+    """The snapshot is in rollback-journal mode, openable with no -wal file."""
+    import sqlite3
+
+    engine = _file_engine(tmp_path / "db.sqlite")
+    with engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+    snapshot = tmp_path / "snap.sqlite"
+
+    database.backup(snapshot, engine=engine)
+
+    with sqlite3.connect(f"{snapshot.as_uri()}?mode=ro", uri=True) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone() == ("delete",)
+    engine.dispose()
+
+
+def test_backup_replaces_existing_file_and_cleans_up_on_failure(tmp_path):
+    engine = _file_engine(tmp_path / "db.sqlite")
+    snapshot = tmp_path / "snap.sqlite"
+    snapshot.write_text("old")
+
+    database.backup(snapshot, engine=engine)
+    assert snapshot.read_bytes().startswith(b"SQLite format 3")
+
+    def interrupt(_copied, _total):
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        database.backup(tmp_path / "new.sqlite", progress=interrupt, engine=engine)
+    assert not (tmp_path / "new.sqlite").exists()
+    assert not (tmp_path / ".new.sqlite.partial").exists()
+    engine.dispose()
+
+
+def test_backup_and_restore_refuse_the_database_itself(tmp_path):
+    engine = _file_engine(tmp_path / "db.sqlite")
+
+    with pytest.raises(ValueError, match="onto itself"):
+        database.backup(tmp_path / "db.sqlite", engine=engine)
+    with pytest.raises(ValueError, match="from itself"):
+        database.restore(tmp_path / "db.sqlite", engine=engine)
+    engine.dispose()
+
+
+def test_restore_migrates_an_older_snapshot(tmp_path):
+    engine = _file_engine(tmp_path / "db.sqlite")
+    old = _file_engine(tmp_path / "old.sqlite")
+    _add_rows(old, "From an old version")
+    with old.begin() as conn:
+        conn.exec_driver_sql("DROP TABLE task_fts")
+        conn.exec_driver_sql("PRAGMA user_version = 2")
+    old.dispose()
+
+    database.restore(tmp_path / "old.sqlite", engine=engine)
+
+    assert database.get_schema_version(engine) == database.SCHEMA_VERSION
+    assert _contents(engine) == [("From an old version",)]
+    engine.dispose()
+
+
+def _write_not_sqlite(path):
+    path.write_text("not a database " * 100)
+
+
+def _write_no_task_table(path):
+    import sqlite3
+
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE other (id INTEGER)")
+    conn.close()
+
+
+def _write_newer_schema(path):
+    _file_engine(path).dispose()
+    import sqlite3
+
+    conn = sqlite3.connect(path)
+    conn.execute(f"PRAGMA user_version = {database.SCHEMA_VERSION + 1}")
+    conn.close()
+
+
+def _write_corrupt(path):
+    _write_not_sqlite(path)
+    engine = _file_engine(path.with_name("good.sqlite"))
+    _add_rows(engine, *("x" * 1000 for _ in range(50)))
+    engine.dispose()
+    data = bytearray(path.with_name("good.sqlite").read_bytes())
+    data[4096 * 3 : 4096 * 3 + 200] = b"\xff" * 200
+    path.write_bytes(bytes(data))
+
+
+@pytest.mark.parametrize(
+    ("write", "message"),
+    [
+        (_write_not_sqlite, "Not an odot database: file is not a database"),
+        (_write_no_task_table, "no task table"),
+        (_write_newer_schema, "newer than this odot supports"),
+        (_write_corrupt, "Backup failed its integrity check"),
+    ],
+)
+def test_restore_rejects_unusable_snapshots(tmp_path, write, message):
+    """Nothing is overwritten when the snapshot fails its checks."""
+    engine = _file_engine(tmp_path / "db.sqlite")
+    _add_rows(engine, "Keep me")
+    snapshot = tmp_path / "snap.sqlite"
+    write(snapshot)
+
+    with pytest.raises(ValueError, match=message):
+        database.restore(snapshot, engine=engine)
+
+    assert _contents(engine) == [("Keep me",)]
+    engine.dispose()
+
+
+def test_restore_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        database.restore(tmp_path / "missing.sqlite")
@@ -1,19 +1,27 @@
 """Unit tests for presentation helpers in `odot._format`."""
 
+import csv
+import io
+import re
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
+import pytest
 from rich.text import Text
 
 from odot._format import (
     build_task_choice_labels,
+    file_size,
     highlight_match,
+    highlight_spans,
     priority_display,
     priority_display_plain,
     relative_time,
     render_task_table,
+    write_csv,
+    write_tsv,
 )
-from odot.models import Task
+from odot.models import Task, TaskRow
 
 
 def make_task(**overrides: Any) -> Task:
@@ -101,6 +109,11 @@ class TestBuildTaskChoiceLabels:
             i for i, c in enumerate(labels[1]) if c == "│"
         ]
 
+    def test_task_rows_label_like_tasks(self):
+        tasks = [make_task(id=1), make_task(id=20, is_done=True, category="work")]
+        rows = [TaskRow(**task.model_dump()) for task in tasks]
+        assert build_task_choice_labels(rows) == build_task_choice_labels(tasks)
+
 
 class TestHighlightMatch:
     def test_highlights_case_insensitive_match(self):
@@ -129,6 +142,17 @@ class TestHighlightMatch:
         assert len(text.spans) == 1
 
 
+class TestHighlightSpans:
+    def test_styles_each_given_span(self):
+        text = highlight_spans("cat dog cat", [(0, 3), (8, 11)])
+        assert str(text) == "cat dog cat"
+        assert [(span.start, span.end) for span in text.spans] == [(0, 3), (8, 11)]
+        assert all(span.style == "bold yellow" for span in text.spans)
+
+    def test_no_spans_returns_plain_text(self):
+        assert highlight_spans("Some content", []).spans == []
+
+
 class TestRenderTaskTable:
     def test_builds_table_with_expected_columns(self):
         tasks = [make_task(id=1, content="Task A")]
@@ -138,6 +162,18 @@ class TestRenderTaskTable:
         assert column_headers == ["ID", "Status", "Priority", "Category", "Content"]
         assert table.row_count == 1
 
+    def test_task_rows_render_like_tasks(self):
+        tasks = [make_task(id=1, content="Task A"), make_task(id=2, is_done=True)]
+        rows = [TaskRow(**task.model_dump()) for task in tasks]
+        cells = [
+            [str(cell) for cell in column._cells]
+            for column in render_task_table(rows, title=None).columns
+        ]
+        assert cells == [
+            [str(cell) for cell in column._cells]
+            for column in render_task_table(tasks, title=None).columns
+        ]
+
     def test_done_task_renders_check_status(self):
         tasks = [make_task(is_done=True)]
         table = render_task_table(tasks, title="T")
@@ -151,12 +187,43 @@ class TestRenderTaskTable:
         content_cell = table.columns[4]._cells[0]
         assert isinstance(content_cell, Text)
 
+    def test_highlight_spans_mapping_styles_by_task_id(self):
+        tasks = [make_task(id=1, content="Buy groceries"), make_task(id=2)]
+        table = render_task_table(tasks, title="Search", highlight={1: [(4, 13)]})
+        first, second = table.columns[4]._cells
+        assert isinstance(first, Text)
+        assert [(span.start, span.end) for span in first.spans] == [(4, 13)]
+        # Rows without spans in the mapping stay plain strings.
+        assert second == "Sample task"
+
     def test_no_highlight_keeps_plain_string_content(self):
         tasks = [make_task(content="Buy groceries")]
         table = render_task_table(tasks, title="List")
         content_cell = table.columns[4]._cells[0]
         assert content_cell == "Buy groceries"
 
+    def test_fixed_widths_line_up_separately_rendered_tables(self):
+        from rich.console import Console
+
+        console = Console(width=60)
+        widths = (3, 6, 8, 10)
+        short, long = (
+            render_task_table(
+                [make_task(id=task_id, content=content)],
+                title=None,
+                widths=widths,
+                show_header=False,
+            )
+            for task_id, content in [(1, "x"), (123, "A much longer task content")]
+        )
+
+        lines = [console.render_lines(table) for table in (short, long)]
+        assert [column.width for column in short.columns[:4]] == list(widths)
+        assert not short.show_header
+        # Same borders at the same offsets, whatever the rows hold.
+        assert lines[0][0] == lines[1][0]
+        assert sum(s.cell_length for s in lines[0][1]) == 60
+
 
 class TestRelativeTime:
     def test_just_now_under_one_minute(self):
@@ -208,3 +275,69 @@ class TestRelativeTime:
         # No `now` passed: dt is "just now" relative to the real clock.
         dt = datetime.now(UTC)
         assert relative_time(dt) == "just now"
+
+
+class TestFileSize:
+    def test_bytes_are_whole(self):
+        assert file_size(0) == "0 B"
+        assert file_size(1023) == "1023 B"
+
+    def test_larger_sizes_use_binary_units(self):
+        assert file_size(1024) == "1.0 KiB"
+        assert file_size(48 * 1024 + 512) == "48.5 KiB"
+        assert file_size(3 * 1024**2) == "3.0 MiB"
+        assert file_size(5 * 1024**3) == "5.0 GiB"
+        assert file_size(2048 * 1024**3) == "2048.0 GiB"
+
+
+ROWS = [
+    ("plain", "1"),
+    ("tab\there", "2"),
+    ("new\nline\r\n", "3"),
+    ('back\\slash, "quoted"', ""),
+]
+
+
+class TestWriteDelimited:
+    def test_tsv_escapes_keep_one_row_per_line(self):
+        stream = io.StringIO()
+
+        assert write_tsv(stream, ("content", "id"), ROWS) == len(ROWS)
+
+        assert stream.getvalue().splitlines() == [
+            "content\tid",
+            "plain\t1",
+            "tab\\there\t2",
+            "new\\nline\\r\\n\t3",
+            'back\\\\slash, "quoted"\t',
+        ]
+
+    @pytest.mark.parametrize("row", [("a\\tb", "x"), ("\\", "\t"), ("\\\\n\n", "\\")])
+    def test_tsv_escapes_are_unambiguous(self, row):
+        stream = io.StringIO()
+        write_tsv(stream, ("a", "b"), [row])
+
+        [line] = stream.getvalue().splitlines()[1:]
+        unescape = {"t": "\t", "n": "\n", "r": "\r", "\\": "\\"}
+        fields = [
+            re.sub(r"\\(.)", lambda m: unescape[m[1]], field)
+            for field in line.split("\t")
+        ]
+        assert fields == list(row)
+
+    def test_csv_round_trips_through_the_csv_module(self):
+        stream = io.StringIO()
+
+        assert write_csv(stream, ("content", "id"), ROWS) == len(ROWS)
+
+        assert list(csv.reader(io.StringIO(stream.getvalue()))) == [
+            ["content", "id"],
+            *map(list, ROWS),
+        ]
+        assert stream.getvalue().startswith("content,id\nplain,1\n")
+
+    def test_empty_input_writes_only_the_header(self):
+        tsv, csv_out = io.StringIO(), io.StringIO()
+        assert write_tsv(tsv, ("a", "b"), []) == write_csv(csv_out, ("a", "b"), []) == 0
+        assert tsv.getvalue() == "a\tb\n"
+        assert csv_out.getvalue() == "a,b\n"
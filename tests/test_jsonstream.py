@@ -0,0 +1,200 @@
+"""Tests for incremental JSON array reading in `odot._jsonstream`."""
+
+import io
+import json
+import re
+import tracemalloc
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from odot import _jsonstream
+from odot._jsonstream import (
+    iter_json_array,
+    iter_json_lines,
+    write_json_array,
+    write_json_lines,
+)
+
+SAMPLE = [
+    {"content": 'Task, with ] and " inside', "tags": [1, 2, {"x": None}]},
+    12345678901234567890,
+    -1.5e10,
+    1e-07,
+    0.5,
+    "unicode é ✓",
+    True,
+    False,
+    None,
+    [],
+    {},
+]
+
+json_values = st.recursive(
+    st.none() | st.booleans() | st.integers() | st.floats(allow_nan=False) | st.text(),
+    lambda children: (
+        st.lists(children, max_size=4)
+        | st.dictionaries(st.text(max_size=5), children, max_size=4)
+    ),
+    max_leaves=20,
+)
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 4096])
+def test_items_match_json_loads_at_any_chunk_boundary(indent, chunk_size):
+    text = json.dumps(SAMPLE, indent=indent)
+    assert list(iter_json_array(io.StringIO(text), chunk_size)) == SAMPLE
+
+
+@given(items=st.lists(json_values, max_size=8), chunk_size=st.integers(1, 16))
+def test_arbitrary_arrays_match_json_loads(items, chunk_size):
+    text = json.dumps(items)
+    assert list(iter_json_array(io.StringIO(text), chunk_size)) == json.loads(text)
+
+
+@pytest.mark.parametrize("text", ["[]", "  [ ]\n", "[\n]"])
+def test_empty_array(text):
+    assert list(iter_json_array(io.StringIO(text), 1)) == []
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "[1,]",
+        "[1 2]",
+        "[1]x",
+        "[\n\n  1,\n  nope]",
+        "[1",
+        "[",
+        "[1,",
+        "[01]",
+        "[1.]",
+        '[{"a": 1,\n "b": tru}]',
+        '[1, "abc',
+        "[\n" + '  {"content": "x"},\n' * 50 + '  {"content": ]',
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 3, 4096])
+def test_errors_are_positioned_like_json_loads(text, chunk_size):
+    with pytest.raises(json.JSONDecodeError) as expected:
+        json.loads(text)
+
+    with pytest.raises(ValueError, match=r"line \d+ column \d+") as actual:
+        list(iter_json_array(io.StringIO(text), chunk_size))
+
+    assert str(actual.value) == str(expected.value)
+
+
+@pytest.mark.parametrize("text", ["", "  ", '{"content": "x"}', '"tasks"'])
+def test_non_array_input_is_rejected(text):
+    with pytest.raises(ValueError, match="Expecting a JSON array: line 1"):
+        list(iter_json_array(io.StringIO(text)))
+
+
+def test_items_before_an_error_are_yielded():
+    items = iter_json_array(io.StringIO("[1, 2, oops]"), 1)
+    assert next(items) == 1
+    assert next(items) == 2
+    with pytest.raises(ValueError, match="Expecting value"):
+        next(items)
+
+
+def test_oversized_item_stops_reading(monkeypatch):
+    """A malformed item does not pull the rest of the input into memory."""
+    monkeypatch.setattr(_jsonstream, "MAX_ITEM_SIZE", 100)
+    stream = io.StringIO('[{"content": oops' + " " * 10_000 + "}]")
+
+    with pytest.raises(ValueError, match="Expecting value"):
+        list(iter_json_array(stream, 10))
+
+    assert stream.tell() < 200
+
+
+def _write_large_array(path, count):
+    """Write a `count`-item array of minimal task objects to `path`."""
+    with path.open("w", encoding="utf-8") as f:
+        f.write("[")
+        for start in range(0, count, 10_000):
+            if start:
+                f.write(", ")
+            stop = min(start + 10_000, count)
+            f.write(", ".join(f'{{"content": "Task {i}"}}' for i in range(start, stop)))
+        f.write("]")
+
+
+def test_memory_stays_bounded_for_a_million_items(tmp_path):
+    """Peak memory is a function of the chunk size, not of the file size."""
+    path = tmp_path / "large.json"
+    _write_large_array(path, 1_000_000)
+
+    tracemalloc.start()
+    try:
+        with path.open(encoding="utf-8") as f:
+            count = sum(1 for _ in iter_json_array(f))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert count == 1_000_000
+    # A couple of 64 KiB chunks of text plus one decoded item, against a
+    # 28 MB file that json.load would hold in full with every decoded dict.
+    assert peak < 1024 * 1024
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+@given(items=st.lists(json_values, max_size=8))
+def test_written_arrays_match_json_dumps(indent, items):
+    encoded = (json.dumps(item, indent=indent) for item in items)
+    stream = io.StringIO()
+
+    count = write_json_array(stream, encoded, pretty=indent is not None)
+
+    assert count == len(items)
+    assert stream.getvalue() == json.dumps(items, indent=indent)
+
+
+def test_written_array_round_trips_through_the_reader():
+    stream = io.StringIO()
+    write_json_array(stream, map(json.dumps, SAMPLE), pretty=False)
+    assert list(iter_json_array(io.StringIO(stream.getvalue()), 3)) == SAMPLE
+
+
+@given(items=st.lists(json_values, max_size=8))
+def test_json_lines_round_trip(items):
+    stream = io.StringIO()
+
+    assert write_json_lines(stream, map(json.dumps, items)) == len(items)
+    assert stream.getvalue() == "".join(f"{json.dumps(item)}\n" for item in items)
+    assert list(iter_json_lines(io.StringIO(stream.getvalue()))) == items
+
+
+def test_json_lines_skip_blank_lines_and_accept_crlf():
+    text = '\n{"a": 1}\r\n   \n[2]'
+    assert list(iter_json_lines(io.StringIO(text))) == [{"a": 1}, [2]]
+
+
+@pytest.mark.parametrize(
+    ("text", "message"),
+    [
+        ('1\n{"a": }\n', "Expecting value: line 2 column 7 (char 8)"),
+        ("1\n2 3\n", "Extra data: line 2 column 3 (char 4)"),
+        ("[1,\n2]\n", "Expecting value: line 1 column 4 (char 3)"),
+    ],
+)
+def test_json_lines_errors_name_the_line(text, message):
+    with pytest.raises(ValueError, match=re.escape(message)):
+        list(iter_json_lines(io.StringIO(text)))
+
+
+def test_json_lines_reject_oversized_lines(monkeypatch):
+    monkeypatch.setattr(_jsonstream, "MAX_ITEM_SIZE", 10)
+    stream = io.StringIO('"short"\n"' + "x" * 10_000 + '"\n')
+
+    with pytest.raises(
+        ValueError, match=r"longer than 10 .* line 2 column 1 \(char 8\)"
+    ):
+        list(iter_json_lines(stream))
+
+    assert stream.tell() < 100
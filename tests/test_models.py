@@ -1,11 +1,13 @@
 """Tests for data models."""
 
+from datetime import UTC, datetime, timedelta
+
 import pytest
 from hypothesis import given
 from hypothesis import strategies as st
 from pydantic import ValidationError
 
-from odot.models import Task, TaskCreate, TaskUpdate
+from odot.models import Task, TaskCreate, TaskImport, TaskRow, TaskUpdate
 
 
 def test_task_creation_valid():
@@ -64,6 +66,22 @@ def test_task_create_whitespace_only_category_is_rejected():
         TaskCreate(content="x", category="   ")
 
 
+def test_task_import_carries_state_and_assumes_utc():
+    item = TaskImport(
+        content="Done",
+        category=" Work ",
+        is_done=True,
+        created_at="2026-01-02T03:04:05",
+    )
+    assert item.category == "work"
+    assert item.is_done is True
+    assert item.created_at == datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC)
+    assert item.updated_at is None
+
+    offset = TaskImport(content="x", updated_at="2026-01-02T03:04:05+02:00")
+    assert offset.updated_at.utcoffset() == timedelta(hours=2)
+
+
 def test_task_table_defaults():
     """Test default values for full Task table model."""
     task = Task(content="Database test")
@@ -73,6 +91,30 @@ def test_task_table_defaults():
     assert task.updated_at is None
 
 
+def test_task_row_dumps_like_a_task():
+    created = datetime(2026, 1, 2, 3, 4, 5, 600, tzinfo=UTC)
+    values = {
+        "content": "Row",
+        "priority": 2,
+        "category": "work",
+        "id": 7,
+        "is_done": True,
+        "created_at": created,
+        "updated_at": None,
+    }
+    row, task = TaskRow(**values), Task(**values)
+
+    assert row.model_dump() == task.model_dump() == values
+    assert row.model_dump(mode="json") == task.model_dump(mode="json")
+    updated = row._replace(updated_at=created + timedelta(hours=1))
+    assert (
+        updated.model_dump(mode="json")["updated_at"]
+        == (Task(**updated._asdict()).model_dump(mode="json")["updated_at"])
+    )
+    with pytest.raises(AttributeError):
+        row.content = "changed"
+
+
 def test_task_update_optional_fields():
     """Test that TaskUpdate fields are optional."""
     update_empty = TaskUpdate()
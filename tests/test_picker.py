@@ -0,0 +1,165 @@
+"""Tests for the indexed large-list task picker in `odot._picker`."""
+
+import pytest
+from prompt_toolkit.completion import CompleteEvent
+from prompt_toolkit.document import Document
+
+from odot._format import build_task_choice_labels
+from odot._picker import LOOKUP_LIMIT, WINDOW, TaskCompleter, TaskIndex
+from odot.models import Task
+
+ROWS = [
+    (1, "Buy milk", "groceries", 1, False),
+    (2, "Write report", "work", 3, True),
+    (3, "Buy stamps", "errands", 2, False),
+    (10, "Call the bank", "errands", 2, False),
+]
+
+
+@pytest.fixture
+def index():
+    return TaskIndex(ROWS)
+
+
+def _ids(index, rows):
+    return [index.resolve(index.label(row)) for row in rows]
+
+
+def test_labels_match_the_select_menu_labels(index):
+    """Lazily built labels are the ones `build_task_choice_labels` makes."""
+    tasks = [
+        Task(content=c, priority=p, category=cat, id=i, is_done=d)
+        for i, c, cat, p, d in ROWS
+    ]
+    expected = [label for label, _ in build_task_choice_labels(tasks)]
+    assert [index.label(row) for row in range(len(index))] == expected
+
+
+SEARCHES = [
+    ("", [1, 2, 3, 10]),
+    ("buy", [1, 3]),
+    ("BUY", [1, 3]),
+    ("errands", [3, 10]),
+    ("stamps buy", [3]),
+    ("buy   errands", [3]),
+    ("med", [3, 10]),
+    ("10", [10]),
+    ("1", [1, 10]),
+    ("milk work", []),
+    ("nothing", []),
+]
+
+
+@pytest.mark.parametrize(("query", "ids"), SEARCHES)
+def test_search_matches_every_word_in_order(index, query, ids):
+    assert _ids(index, index.search(query)) == ids
+
+
+@pytest.mark.parametrize("lookup_limit", [0, 1, LOOKUP_LIMIT])
+@pytest.mark.parametrize(("query", "ids"), [s for s in SEARCHES if s[0]])
+def test_word_index_matches_what_the_scan_matches(
+    index, monkeypatch, lookup_limit, query, ids
+):
+    """Whether a word is looked up, checked in the text or left to the scan,
+    the word index finds the same tasks, also when it reuses a lookup."""
+    monkeypatch.setattr("odot._picker.LOOKUP_LIMIT", lookup_limit)
+    words = query.lower().split()
+
+    assert _ids(index, index._intersect(words, WINDOW)) == ids
+    assert _ids(index, index._intersect(words, WINDOW)) == ids
+
+
+def test_a_match_never_spans_two_tasks(index):
+    """The text of one task ends before the next begins."""
+    assert index.search("high\nbuy") == []
+    assert index.search("highbuy") == []
+
+
+def test_search_stops_at_the_limit(index):
+    assert _ids(index, index.search("", limit=2)) == [1, 2]
+    assert _ids(index, index.search("e", limit=2)) == [1, 2]
+
+
+def test_typing_on_narrows_the_last_complete_search(index, monkeypatch):
+    """Once a search has found every match, extending the query only
+    rechecks those matches instead of scanning the index again."""
+    assert _ids(index, index.search("bu")) == [1, 3]
+    monkeypatch.setattr(index, "_scan", None)
+
+    assert _ids(index, index.search("buy")) == [1, 3]
+    assert _ids(index, index.search("Buy st")) == [3]
+    assert _ids(index, index.search("buy sta", limit=0)) == []
+
+
+def test_resolve_rejects_unknown_answers(index):
+    label = index.label(0)
+    assert index.resolve(label) == 1
+    assert index.resolve("not a real task label") is None
+    assert index.resolve(label.replace("#  1 │", "#  9 │")) is None
+    assert index.resolve(label + " ") is None
+
+
+def test_empty_index():
+    index = TaskIndex([])
+    assert len(index) == 0
+    assert index.search("") == []
+    assert index.search("x") == []
+
+
+def test_completer_offers_a_window_of_labels():
+    rows = [(i, f"Task {i}", "work", 1, False) for i in range(1, 201)]
+    completer = TaskCompleter(TaskIndex(rows))
+
+    completions = list(completer.get_completions(Document("task"), CompleteEvent()))
+
+    assert len(completions) == WINDOW
+    assert completions[0].text.startswith("#   1 │")
+    assert all(c.start_position == -len("task") for c in completions)
+
+
+class _CountingText(str):
+    """The index text, counting the `find` calls a search makes on it."""
+
+    __slots__ = ("finds",)
+
+    def find(self, *args):
+        self.finds += 1
+        return super().find(*args)
+
+
+@pytest.mark.parametrize("query", ["t", "task 49999", "cat7 content", "zzz"])
+def test_keystrokes_do_bounded_work_on_many_tasks(monkeypatch, query):
+    """A keystroke over 50k tasks, even one that matches none, builds at most a
+    window of labels and searches the prebuilt text a window's worth of times,
+    never once per task."""
+    rows = [(i, f"Task {i} content", f"cat{i % 50}", 1, False) for i in range(50_000)]
+    index = TaskIndex(rows)
+    index._text = text = _CountingText(index._text)
+    text.finds = 0
+    labels = []
+    monkeypatch.setattr(
+        index, "label", lambda row: labels.append(row) or TaskIndex.label(index, row)
+    )
+
+    completions = list(
+        TaskCompleter(index).get_completions(Document(query), CompleteEvent())
+    )
+
+    assert len(labels) == len(completions) <= WINDOW
+    assert text.finds <= 2 * len(query.split()) * (WINDOW + 1)
+
+
+@pytest.mark.parametrize("query", ["alpha beta", "alpha b"])
+def test_keystrokes_for_words_never_together_do_bounded_work(query):
+    """Words that are each in half of 50k tasks but never share one give up
+    the scan within its budget; the word index then finds no match by
+    intersecting postings, without searching task by task."""
+    rows = [(i, "alpha" if i % 2 else "beta", "work", 1, False) for i in range(50_000)]
+    index = TaskIndex(rows)
+    index._text = text = _CountingText(index._text)
+    index._words = words = _CountingText(index._words)
+    text.finds = words.finds = 0
+
+    assert index.search(query) == []
+    assert text.finds <= 2 * len(query.split()) * (WINDOW + 1)
+    assert words.finds <= 2 * len(query.split())